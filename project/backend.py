@@ -0,0 +1,86 @@
+from typing import Optional
+
+try:
+    import numpy  # type: ignore
+except ImportError:
+    numpy = None  # type: ignore
+
+BACKENDS = ("python", "numpy")
+
+_backend: str = "python" if numpy is None else "numpy"
+
+
+def numpy_available() -> bool:
+    """
+    Checks whether NumPy was found at import time.
+
+    Returns:
+    --------
+    bool
+        True if the "numpy" backend can be used.
+    """
+    return numpy is not None
+
+
+def get_backend() -> str:
+    """
+    Returns the name of the backend used when no backend is passed explicitly.
+
+    By default it is "numpy" if NumPy is installed and "python" otherwise.
+
+    Returns:
+    --------
+    str
+        The name of the global backend.
+    """
+    return _backend
+
+
+def set_backend(name: str) -> None:
+    """
+    Sets the backend used by `Matrix` and `Vector` operations by default.
+
+    Parameters:
+    -----------
+    name : str
+        Either "python" (pure Python kernels) or "numpy" (vectorized ndarray kernels).
+
+    Exceptions:
+    -----------
+    ValueError
+        If the name is not one of the known backends.
+    Exception
+        If "numpy" is requested but NumPy is not installed.
+    """
+    global _backend
+    _backend = resolve_backend(name)
+
+
+def resolve_backend(backend: Optional[str] = None) -> str:
+    """
+    Chooses the backend for a single call.
+
+    Parameters:
+    -----------
+    backend : Optional[str]
+        The backend requested by the caller, None means the global backend.
+
+    Returns:
+    --------
+    str
+        The name of the backend to use.
+
+    Exceptions:
+    -----------
+    ValueError
+        If the name is not one of the known backends.
+    Exception
+        If "numpy" is requested but NumPy is not installed.
+    """
+    if backend is None:
+        return _backend
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}', expected one of {BACKENDS}")
+    if backend == "numpy" and numpy is None:
+        raise Exception("NumPy backend is not available")
+    return backend
@@ -0,0 +1,555 @@
+import math
+from array import array
+from itertools import repeat
+from operator import getitem, mul, sub
+from typing import Any, List, Optional, Union
+
+from project.matrix import Matrix
+from project.vector import Vector
+
+
+def _check_square(matrix: Matrix) -> int:
+    """
+    Checks that the matrix is square and returns its size.
+    """
+    if matrix.height != matrix.width:
+        raise Exception("Matrix must be square")
+    return matrix.height
+
+
+def _forward(lower: List[array], diagonal: Optional[array], values: array) -> array:
+    """
+    Solves ``L * y = values`` for a lower triangular L given by the rows of its
+    strictly lower part and its diagonal (None for a unit diagonal).
+    """
+    result = array("d", values)
+    for i, row in enumerate(lower):
+        value = result[i] - sum(map(mul, row, result), 0.0)
+        result[i] = value if diagonal is None else value / diagonal[i]
+    return result
+
+
+def _backward(upper: List[array], diagonal: array, values: array) -> array:
+    """
+    Solves ``U * x = values`` for an upper triangular U given by the rows of its
+    strictly upper part (``upper[i]`` holds the elements ``(i, i + 1), ...``) and
+    its diagonal.
+    """
+    result = array("d", values)
+    for i in range(len(upper) - 1, -1, -1):
+        value = result[i] - sum(map(mul, upper[i], result[i + 1 :]), 0.0)
+        result[i] = value / diagonal[i]
+    return result
+
+
+def _from_columns(columns: List[array], height: int) -> Matrix:
+    """
+    Builds a matrix from a list of its columns (as a transposition view).
+    """
+    data = array("d")
+    for column in columns:
+        data.extend(column)
+    return Matrix._from_array(data, len(columns), height).trans()
+
+
+class Factorization:
+    """
+    A factorization of a square matrix into triangular factors (see `lu` and
+    `cholesky`).
+
+    The factorization costs O(n^3) once, after which every right-hand side costs
+    only two triangular solves, O(n^2). The factors are independent copies, so
+    changing the factorized matrix does not change the factorization.
+
+    Attributes:
+    -----------
+    size : int
+        The number of rows (and columns) of the factorized matrix.
+
+    Methods:
+    --------
+    solve(rhs: Union[Vector, Matrix]) -> Union[Vector, Matrix]:
+        Solves the system for one right-hand side or for every column of a matrix.
+
+    det() -> float:
+        Calculates the determinant of the factorized matrix.
+
+    inv() -> Matrix:
+        Calculates the inverse of the factorized matrix.
+    """
+
+    def __init__(
+        self,
+        lower: List[array],
+        lower_diagonal: Optional[array],
+        upper: List[array],
+        upper_diagonal: array,
+        permutation: Optional[List[int]] = None,
+    ) -> None:
+        """
+        Keeps the triangular factors: the rows of the strictly lower part of L,
+        the diagonal of L (None for a unit diagonal), the rows of the strictly
+        upper part of U (``upper[i]`` starts at the element ``(i, i + 1)``), the
+        diagonal of U and the row permutation applied to the right-hand sides.
+        """
+        self.size: int = len(upper_diagonal)
+        self._lower = lower
+        self._lower_diagonal = lower_diagonal
+        self._upper = upper
+        self._upper_diagonal = upper_diagonal
+        self._permutation = permutation
+
+    def _solve_values(self, values: Any) -> array:
+        """
+        Solves the system for one right-hand side given by its coordinates.
+        """
+        if self._permutation is not None:
+            values = array("d", [values[p] for p in self._permutation])
+        return _backward(
+            self._upper,
+            self._upper_diagonal,
+            _forward(self._lower, self._lower_diagonal, values),
+        )
+
+    def solve(self, rhs: Union[Vector, Matrix]) -> Any:
+        """
+        Solves the system ``A * x = rhs`` for the factorized matrix A.
+
+        Parameters:
+        -----------
+        rhs : Union[Vector, Matrix]
+            A vector with `size` coordinates, or a matrix with `size` rows whose
+            every column is a separate right-hand side.
+
+        Returns:
+        --------
+        Union[Vector, Matrix]
+            The solution of the same type as `rhs`.
+
+        Exceptions:
+        -----------
+        Exception
+            If the size of `rhs` does not match the size of the matrix.
+        """
+        if isinstance(rhs, Matrix):
+            if rhs.height != self.size:
+                raise Exception("Matrix dimensions not fit for multiplication")
+            return _from_columns(
+                [self._solve_values(rhs._column(j)) for j in range(rhs.width)],
+                rhs.height,
+            )
+        if len(rhs.coordinates) != self.size:
+            raise Exception("Matrix dimensions not fit for multiplication")
+        return Vector(self._solve_values(rhs.coordinates))
+
+    def det(self) -> float:
+        """
+        Calculates the determinant of the factorized matrix from the diagonals
+        of the factors and the sign of the row permutation.
+
+        Returns:
+        --------
+        float
+            The determinant.
+        """
+        determinant = math.prod(self._upper_diagonal)
+        if self._lower_diagonal is not None:
+            determinant *= math.prod(self._lower_diagonal)
+        if self._permutation is not None:
+            # every cycle of length m is m - 1 transpositions
+            seen = [False] * self.size
+            for start in range(self.size):
+                if seen[start]:
+                    continue
+                i = self._permutation[start]
+                seen[start] = True
+                while i != start:
+                    seen[i] = True
+                    i = self._permutation[i]
+                    determinant = -determinant
+        return determinant
+
+    def inv(self) -> Matrix:
+        """
+        Calculates the inverse of the factorized matrix by solving the system for
+        every column of the identity matrix.
+
+        Returns:
+        --------
+        Matrix
+            The inverse matrix.
+        """
+        columns = []
+        for j in range(self.size):
+            column = array("d", bytes(8 * self.size))
+            column[j] = 1.0
+            columns.append(self._solve_values(column))
+        return _from_columns(columns, self.size)
+
+
+class LU(Factorization):
+    """
+    The LU factorization with partial pivoting: ``P * A = L * U``, where P is a
+    permutation, L is lower triangular with a unit diagonal and U is upper
+    triangular (see `lu`).
+
+    Attributes:
+    -----------
+    size : int
+        The number of rows (and columns) of the factorized matrix.
+    lower : Matrix
+        The factor L.
+    upper : Matrix
+        The factor U.
+    permutation : List[int]
+        The row ``i`` of ``P * A`` is the row ``permutation[i]`` of A.
+    """
+
+    def __init__(self, matrix: Matrix) -> None:
+        """
+        Factorizes the matrix with Gaussian elimination, choosing the largest
+        remaining element of the column as the pivot.
+
+        Parameters:
+        -----------
+        matrix : Matrix
+            The square matrix to factorize.
+
+        Exceptions:
+        -----------
+        Exception
+            If the matrix is not square or is singular.
+        """
+        size = _check_square(matrix)
+        rows = [matrix._row(i) for i in range(size)]
+        permutation = list(range(size))
+        self._sign = 1
+        for k in range(size):
+            p = max(range(k, size), key=lambda i: abs(rows[i][k]))
+            if rows[p][k] == 0:
+                raise Exception("Matrix is singular")
+            if p != k:
+                rows[k], rows[p] = rows[p], rows[k]
+                permutation[k], permutation[p] = permutation[p], permutation[k]
+                self._sign = -self._sign
+            pivot = rows[k][k]
+            tail = rows[k][k + 1 :]
+            for row in rows[k + 1 :]:
+                factor = row[k] / pivot
+                row[k] = factor
+                if factor:
+                    row[k + 1 :] = array(
+                        "d", map(sub, row[k + 1 :], map(mul, repeat(factor), tail))
+                    )
+        super().__init__(
+            [row[:i] for i, row in enumerate(rows)],
+            None,
+            [row[i + 1 :] for i, row in enumerate(rows)],
+            array("d", [row[i] for i, row in enumerate(rows)]),
+            permutation,
+        )
+
+    @property
+    def permutation(self) -> List[int]:
+        """
+        The row permutation chosen by pivoting.
+        """
+        return list(self._permutation or [])
+
+    @property
+    def lower(self) -> Matrix:
+        """
+        The factor L (lower triangular with a unit diagonal).
+        """
+        data = array("d")
+        for i, row in enumerate(self._lower):
+            data.extend(row)
+            data.append(1.0)
+            data.frombytes(bytes(8 * (self.size - i - 1)))
+        return Matrix._from_array(data, self.size, self.size)
+
+    @property
+    def upper(self) -> Matrix:
+        """
+        The factor U (upper triangular).
+        """
+        data = array("d")
+        for i, row in enumerate(self._upper):
+            data.frombytes(bytes(8 * i))
+            data.append(self._upper_diagonal[i])
+            data.extend(row)
+        return Matrix._from_array(data, self.size, self.size)
+
+    def det(self) -> float:
+        """
+        Calculates the determinant as the signed product of the diagonal of U.
+        """
+        return self._sign * math.prod(self._upper_diagonal)
+
+
+class Cholesky(Factorization):
+    """
+    The Cholesky factorization ``A = L * L^T`` of a symmetric positive definite
+    matrix, where L is lower triangular with a positive diagonal (see `cholesky`).
+
+    It takes half the operations of `LU` and needs no pivoting.
+
+    Attributes:
+    -----------
+    size : int
+        The number of rows (and columns) of the factorized matrix.
+    lower : Matrix
+        The factor L.
+    """
+
+    def __init__(self, matrix: Matrix) -> None:
+        """
+        Factorizes the matrix; only its lower triangle is read.
+
+        Parameters:
+        -----------
+        matrix : Matrix
+            The symmetric positive definite matrix to factorize.
+
+        Exceptions:
+        -----------
+        Exception
+            If the matrix is not square or is not positive definite.
+        """
+        size = _check_square(matrix)
+        lower: List[array] = []
+        diagonal = array("d")
+        for i in range(size):
+            source = matrix._row(i)
+            row = array("d")
+            for j in range(i):
+                row.append(
+                    (source[j] - sum(map(mul, row, lower[j]), 0.0)) / diagonal[j]
+                )
+            value = source[i] - sum(map(mul, row, row), 0.0)
+            if not value > 0:
+                raise Exception("Matrix is not positive definite")
+            lower.append(row)
+            diagonal.append(math.sqrt(value))
+        upper = [
+            array("d", [lower[k][i] for k in range(i + 1, size)]) for i in range(size)
+        ]
+        super().__init__(lower, diagonal, upper, diagonal)
+
+    @property
+    def lower(self) -> Matrix:
+        """
+        The factor L (lower triangular).
+        """
+        data = array("d")
+        for i, row in enumerate(self._lower):
+            data.extend(row)
+            data.append(self._upper_diagonal[i])
+            data.frombytes(bytes(8 * (self.size - i - 1)))
+        return Matrix._from_array(data, self.size, self.size)
+
+
+def _cached(matrix: Matrix, kind: str, cache: bool) -> Any:
+    """
+    Returns the factorization of the given kind, computing it if it is not cached
+    on the matrix. The cache is dropped whenever the matrix is changed (see
+    `Matrix._prepare_write`).
+    """
+    factorizations = matrix._factorizations
+    if factorizations is not None and kind in factorizations:
+        return factorizations[kind]
+    factorization = LU(matrix) if kind == "lu" else Cholesky(matrix)
+    if cache:
+        if factorizations is None:
+            factorizations = matrix._factorizations = {}
+        factorizations[kind] = factorization
+    return factorization
+
+
+def lu(matrix: Matrix, cache: bool = True) -> LU:
+    """
+    Calculates the LU factorization of a square matrix with partial pivoting.
+
+    Parameters:
+    -----------
+    matrix : Matrix
+        The square matrix to factorize.
+    cache : bool, optional
+        Whether the factorization is kept on the matrix, so the next call (and
+        `solve`, `inv`, `det`) reuses it until the matrix is changed. Default is True.
+
+    Returns:
+    --------
+    LU
+        The factorization.
+
+    Exceptions:
+    -----------
+    Exception
+        If the matrix is not square or is singular.
+
+    Example:
+    --------
+    >>> factorization = lu(Matrix([[4, 3], [6, 3]]))
+    >>> factorization.solve(Vector([10, 12]))
+    Vector([1.0, 2.0])
+    """
+    return _cached(matrix, "lu", cache)
+
+
+def cholesky(matrix: Matrix, cache: bool = True) -> Cholesky:
+    """
+    Calculates the Cholesky factorization of a symmetric positive definite matrix.
+
+    Parameters:
+    -----------
+    matrix : Matrix
+        The symmetric positive definite matrix to factorize.
+    cache : bool, optional
+        Whether the factorization is kept on the matrix until it is changed,
+        default is True.
+
+    Returns:
+    --------
+    Cholesky
+        The factorization.
+
+    Exceptions:
+    -----------
+    Exception
+        If the matrix is not square or is not positive definite.
+
+    Example:
+    --------
+    >>> cholesky(Matrix([[4, 2], [2, 5]])).lower.content
+    [[2.0, 0.0], [1.0, 2.0]]
+    """
+    return _cached(matrix, "cholesky", cache)
+
+
+def solve_triangular(
+    matrix: Matrix,
+    rhs: Union[Vector, Matrix],
+    lower: bool = True,
+    unit_diagonal: bool = False,
+) -> Any:
+    """
+    Solves the system ``A * x = rhs`` for a triangular matrix A by substitution.
+
+    Only the triangle given by `lower` is read, the other one is ignored.
+
+    Parameters:
+    -----------
+    matrix : Matrix
+        The square triangular matrix A.
+    rhs : Union[Vector, Matrix]
+        A vector, or a matrix whose every column is a separate right-hand side.
+    lower : bool, optional
+        Whether A is lower (True, the default) or upper triangular.
+    unit_diagonal : bool, optional
+        Whether the diagonal of A is assumed to consist of ones, default is False.
+
+    Returns:
+    --------
+    Union[Vector, Matrix]
+        The solution of the same type as `rhs`.
+
+    Exceptions:
+    -----------
+    Exception
+        If the matrix is not square, has a zero on the diagonal, or the size of
+        `rhs` does not match.
+    """
+    size = _check_square(matrix)
+    rows = [matrix._row(i) for i in range(size)]
+    ones = array("d", [1.0] * size)
+    diagonal = ones if unit_diagonal else array("d", map(getitem, rows, range(size)))
+    if 0 in diagonal:
+        raise Exception("Matrix is singular")
+    empty = [array("d") for _ in range(size)]
+    if lower:
+        triangle = Factorization(
+            [row[:i] for i, row in enumerate(rows)], diagonal, empty, ones
+        )
+    else:
+        triangle = Factorization(
+            empty, None, [row[i + 1 :] for i, row in enumerate(rows)], diagonal
+        )
+    return triangle.solve(rhs)
+
+
+def solve(matrix: Matrix, rhs: Union[Vector, Matrix]) -> Any:
+    """
+    Solves the system ``A * x = rhs`` using the (cached) LU factorization of A.
+
+    Parameters:
+    -----------
+    matrix : Matrix
+        The square non-singular matrix A.
+    rhs : Union[Vector, Matrix]
+        A vector, or a matrix whose every column is a separate right-hand side.
+
+    Returns:
+    --------
+    Union[Vector, Matrix]
+        The solution of the same type as `rhs`.
+
+    Exceptions:
+    -----------
+    Exception
+        If the matrix is not square or is singular, or the size of `rhs` does not match.
+
+    Example:
+    --------
+    >>> solve(Matrix([[2, 0], [0, 4]]), Vector([2, 2]))
+    Vector([1.0, 0.5])
+    """
+    return lu(matrix).solve(rhs)
+
+
+def inv(matrix: Matrix) -> Matrix:
+    """
+    Calculates the inverse of a square matrix using its (cached) LU factorization.
+
+    Parameters:
+    -----------
+    matrix : Matrix
+        The square non-singular matrix.
+
+    Returns:
+    --------
+    Matrix
+        The inverse matrix.
+
+    Exceptions:
+    -----------
+    Exception
+        If the matrix is not square or is singular.
+    """
+    return lu(matrix).inv()
+
+
+def det(matrix: Matrix) -> float:
+    """
+    Calculates the determinant of a square matrix using its (cached) LU factorization.
+
+    Parameters:
+    -----------
+    matrix : Matrix
+        The square matrix.
+
+    Returns:
+    --------
+    float
+        The determinant, 0.0 for a singular matrix.
+
+    Exceptions:
+    -----------
+    Exception
+        If the matrix is not square.
+    """
+    try:
+        return lu(matrix).det()
+    except Exception:
+        _check_square(matrix)
+        return 0.0
@@ -1,14 +1,354 @@
-from typing import Union, List
+import mmap
+import struct
+import sys
+from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left
+from itertools import repeat
+from multiprocessing import Pool
+from multiprocessing.sharedctypes import RawArray
+from operator import add, itemgetter, mul, sub
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    Union,
+    List,
+    Tuple,
+    Optional,
+    Sequence,
+    TYPE_CHECKING,
+)
+
+from project.backend import numpy, resolve_backend
+
+if TYPE_CHECKING:
+    from project.vector import Vector
+
+_BLOCK_SIZE: int = 64
+
+PARALLEL_THRESHOLD: int = 128**3
+
+STRASSEN_CUTOFF: int = 128
+
+ALGORITHMS = ("auto", "naive", "blocked", "strassen")
+
+FILE_BLOCK_SIZE: int = 256
+
+_FILE_MAGIC = b"MTRX"
+
+# magic, dtype, padding, height, width: the data right after it is 8-byte aligned
+_FILE_HEADER = struct.Struct("<4sc3xQQ")
+
+_worker_operands: Dict[str, Any] = {}
+
+
+def _multiply_blocked(
+    rows: Sequence[Sequence[float]],
+    columns: Sequence[Sequence[float]],
+    out: Optional[array] = None,
+) -> array:
+    """
+    Multiplies matrices given as the rows of the left operand and the columns of the right one.
+
+    The output is split into ``_BLOCK_SIZE x _BLOCK_SIZE`` tiles, so a tile of columns
+    is reused by a whole tile of rows while it is still hot in the cache. The inner
+    (k) loop is a single ``sum(map(mul, ...))`` over two contiguous arrays, which keeps
+    the accumulation inside the interpreter's C loop instead of boxing every product.
+
+    Parameters:
+    -----------
+    rows : Sequence[Sequence[float]]
+        The rows of the left operand (arrays or ``memoryview`` slices of doubles).
+    columns : Sequence[Sequence[float]]
+        The columns of the right operand (the rows of its transposition).
+    out : Optional[array]
+        A storage of ``len(rows) * len(columns)`` elements to write the product into
+        instead of a new array; it must not hold the rows or the columns.
+
+    Returns:
+    --------
+    array
+        The product in row-major order, ``len(rows) x len(columns)``.
+    """
+    height = len(rows)
+    width = len(columns)
+    result = array("d", bytes(8 * height * width)) if out is None else out
+    for i0 in range(0, height, _BLOCK_SIZE):
+        i1 = min(i0 + _BLOCK_SIZE, height)
+        for j0 in range(0, width, _BLOCK_SIZE):
+            j1 = min(j0 + _BLOCK_SIZE, width)
+            tile = columns[j0:j1]
+            for i in range(i0, i1):
+                row = rows[i]
+                start = i * width
+                result[start + j0 : start + j1] = array(
+                    "d", [sum(map(mul, row, column)) for column in tile]
+                )
+    return result
+
+
+def _multiply_naive(
+    rows: List[array], columns: List[array], out: Optional[array] = None
+) -> array:
+    """
+    Multiplies matrices given as rows and columns element by element, without tiling,
+    into a new array or into `out` (see `_multiply_blocked`).
+
+    Used for products that fit into a single tile of `_multiply_blocked`.
+    """
+    if out is not None:
+        width = len(columns)
+        for i, row in enumerate(rows):
+            out[i * width : (i + 1) * width] = array(
+                "d", [sum(map(mul, row, column)) for column in columns]
+            )
+        return out
+    result = array("d")
+    for row in rows:
+        result.extend([sum(map(mul, row, column)) for column in columns])
+    return result
+
+
+def _add_rows(x: List[array], y: List[array]) -> List[array]:
+    """
+    Adds two square blocks given as lists of rows.
+    """
+    return [array("d", map(add, a, b)) for a, b in zip(x, y)]
+
+
+def _sub_rows(x: List[array], y: List[array]) -> List[array]:
+    """
+    Subtracts two square blocks given as lists of rows.
+    """
+    return [array("d", map(sub, a, b)) for a, b in zip(x, y)]
+
+
+def _strassen(rows: List[array], columns: List[array], cutoff: int) -> List[array]:
+    """
+    Multiplies two square blocks with the Strassen-Winograd algorithm.
+
+    The right operand is kept transposed during the whole recursion (the quadrants
+    of ``B^T`` are the transposed quadrants of ``B`` and sums commute with the
+    transposition), so the base case can call `_multiply_blocked` directly once the
+    size drops to `cutoff`. An odd block is padded with one zero row and column.
+
+    Parameters:
+    -----------
+    rows : List[array]
+        The rows of the left block.
+    columns : List[array]
+        The columns of the right block.
+    cutoff : int
+        The size below which the blocked kernel is used.
+
+    Returns:
+    --------
+    List[array]
+        The rows of the product.
+    """
+    n = len(rows)
+    if n <= cutoff:
+        flat = _multiply_blocked(rows, columns)
+        return [flat[i * n : (i + 1) * n] for i in range(n)]
+    if n % 2:
+        padding = array("d", [0.0])
+        zeros = array("d", bytes(8 * (n + 1)))
+        rows = [row + padding for row in rows] + [zeros]
+        columns = [column + padding for column in columns] + [zeros]
+        return [row[:n] for row in _strassen(rows, columns, cutoff)[:n]]
+    h = n // 2
+    a11 = [row[:h] for row in rows[:h]]
+    a12 = [row[h:] for row in rows[:h]]
+    a21 = [row[:h] for row in rows[h:]]
+    a22 = [row[h:] for row in rows[h:]]
+    # the quadrants of the transposed right operand: b12^T is in the bottom left
+    b11 = [column[:h] for column in columns[:h]]
+    b21 = [column[h:] for column in columns[:h]]
+    b12 = [column[:h] for column in columns[h:]]
+    b22 = [column[h:] for column in columns[h:]]
+
+    s1 = _add_rows(a21, a22)
+    s2 = _sub_rows(s1, a11)
+    s3 = _sub_rows(a11, a21)
+    s4 = _sub_rows(a12, s2)
+    t1 = _sub_rows(b12, b11)
+    t2 = _sub_rows(b22, t1)
+    t3 = _sub_rows(b22, b12)
+    t4 = _sub_rows(t2, b21)
+
+    p1 = _strassen(a11, b11, cutoff)
+    p2 = _strassen(a12, b21, cutoff)
+    p3 = _strassen(s4, b22, cutoff)
+    p4 = _strassen(a22, t4, cutoff)
+    p5 = _strassen(s1, t1, cutoff)
+    p6 = _strassen(s2, t2, cutoff)
+    p7 = _strassen(s3, t3, cutoff)
+
+    c11 = _add_rows(p1, p2)
+    u2 = _add_rows(p1, p6)
+    u3 = _add_rows(u2, p7)
+    c12 = _add_rows(_add_rows(u2, p5), p3)
+    c21 = _sub_rows(u3, p4)
+    c22 = _add_rows(u3, p5)
+    return [x + y for x, y in zip(c11, c12)] + [x + y for x, y in zip(c21, c22)]
+
+
+def _multiply_strassen(rows: List[array], columns: List[array], inner: int) -> array:
+    """
+    Multiplies matrices of any shape with `_strassen`, padding them with zeros to a square.
+
+    Parameters:
+    -----------
+    rows : List[array]
+        The rows of the left operand.
+    columns : List[array]
+        The columns of the right operand.
+    inner : int
+        The number of columns of the left operand.
+
+    Returns:
+    --------
+    array
+        The product in row-major order, ``len(rows) x len(columns)``.
+    """
+    height = len(rows)
+    width = len(columns)
+    n = max(height, inner, width)
+    zeros = array("d", bytes(8 * n))
+    padding = array("d", bytes(8 * (n - inner)))
+    square_rows = [row + padding for row in rows] + [zeros] * (n - height)
+    square_columns = [column + padding for column in columns] + [zeros] * (n - width)
+    result = array("d")
+    for row in _strassen(square_rows, square_columns, STRASSEN_CUTOFF)[:height]:
+        result.extend(row[:width])
+    return result
+
+
+def choose_algorithm(height: int, inner: int, width: int) -> str:
+    """
+    Chooses the multiplication algorithm for the given shape of the product.
+
+    - "naive" if the product fits into a single tile (``_BLOCK_SIZE`` in every dimension);
+    - "strassen" if every dimension is at least twice `STRASSEN_CUTOFF` (so at least
+      one level of recursion pays off) and the operands are close to square
+      (padding to a square costs at most a factor of two);
+    - "blocked" otherwise.
+
+    Parameters:
+    -----------
+    height : int
+        The number of rows of the left operand.
+    inner : int
+        The number of columns of the left operand (rows of the right one).
+    width : int
+        The number of columns of the right operand.
+
+    Returns:
+    --------
+    str
+        One of "naive", "blocked" or "strassen".
+    """
+    smallest = min(height, inner, width)
+    largest = max(height, inner, width)
+    if largest <= _BLOCK_SIZE:
+        return "naive"
+    if smallest >= 2 * STRASSEN_CUTOFF and largest <= 2 * smallest:
+        return "strassen"
+    return "blocked"
+
+
+def _init_multiply_worker(
+    left: Any, right_columns: Any, result: Any, inner: int, width: int
+) -> None:
+    """
+    Remembers the shared operands in a worker process of `_multiply_parallel`.
+    """
+    _worker_operands["left"] = memoryview(left).cast("B").cast("d")
+    _worker_operands["columns"] = memoryview(right_columns).cast("B").cast("d")
+    _worker_operands["result"] = memoryview(result).cast("B")
+    _worker_operands["inner"] = inner
+    _worker_operands["width"] = width
+
+
+def _multiply_rows(start: int, end: int) -> None:
+    """
+    Computes the rows ``start..end`` of the product in a worker process of `_multiply_parallel`.
+
+    The rows and the columns are ``memoryview`` slices of the shared operands, so the
+    workers read them in place instead of each copying the whole right operand.
+    """
+    left = _worker_operands["left"]
+    columns = _worker_operands["columns"]
+    inner = _worker_operands["inner"]
+    width = _worker_operands["width"]
+    rows = [left[i * inner : (i + 1) * inner] for i in range(start, end)]
+    column_list = [columns[j * inner : (j + 1) * inner] for j in range(width)]
+    block = _multiply_blocked(rows, column_list)
+    _worker_operands["result"][8 * start * width : 8 * end * width] = block.tobytes()
+
+
+def _multiply_parallel(left: "Matrix", right: "Matrix", workers: int) -> "Matrix":
+    """
+    Multiplies two matrices splitting the rows of the result between worker processes.
+
+    The left operand, the columns of the right operand and the result live in
+    shared memory (``multiprocessing.RawArray``) handed to the workers once when
+    the pool starts, so only the row ranges are pickled per task. Every worker
+    runs `_multiply_blocked` on its row block and writes it straight into the
+    shared result.
+
+    Parameters:
+    -----------
+    left : Matrix
+        The left operand.
+    right : Matrix
+        The right operand, ``left.width == right.height``.
+    workers : int
+        The number of worker processes.
+
+    Returns:
+    --------
+    Matrix
+        The product of the matrices.
+    """
+    height = left.height
+    inner = left.width
+    width = right.width
+    shared_left = RawArray("d", height * inner)
+    shared_columns = RawArray("d", width * inner)
+    shared_result = RawArray("d", height * width)
+    memoryview(shared_left).cast("B")[:] = left._flat().tobytes()
+    columns = memoryview(shared_columns).cast("B").cast("d")
+    for j in range(width):
+        columns[j * inner : (j + 1) * inner] = right._column(j)
+    if height == 0:
+        return Matrix._from_array(array("d"), height, width)
+    chunk = -(-height // workers)
+    ranges = [(start, min(start + chunk, height)) for start in range(0, height, chunk)]
+    with Pool(
+        min(workers, len(ranges)),
+        _init_multiply_worker,
+        (shared_left, shared_columns, shared_result, inner, width),
+    ) as pool:
+        pool.starmap(_multiply_rows, ranges)
+    return Matrix._from_array(
+        array("d", memoryview(shared_result).cast("B").tobytes()), height, width
+    )
 
 
 class Matrix:
     """
     A class to represent a matrix and perform operations with it.
 
+    The elements are kept in a flat, contiguous ``array('d')`` in row-major order,
+    so every element costs 8 bytes regardless of the matrix size. The position of
+    the element ``(i, j)`` in the storage is described by the row and column strides.
+
     Attributes:
     -----------
-    content : List[List[Union[int, float]]]
-        A two-dimensional list representing the matrix content.
+    content : List[List[float]]
+        A two-dimensional list representing the matrix content (built from the storage on access).
     width : int
         The number of columns in the matrix (the maximum length of rows).
     height : int
@@ -19,43 +359,400 @@ class Matrix:
     __init__(content: List[List[Union[int, float]]] = []) -> None:
         Initializes a matrix, aligning the rows to have the same length.
 
-    draw() -> None:
-        Prints the matrix content to the console.
+    __getitem__(index: Tuple[int, int]) -> float:
+        Returns the element at the given row and column.
+
+    __setitem__(index: Tuple[int, int], value: Union[int, float]) -> None:
+        Replaces the element at the given row and column.
+
+    add(other: 'Matrix', backend: Optional[str] = None, out: Optional['Matrix'] = None) -> 'Matrix':
+        Adds the current matrix with another matrix and returns the result (also `+`, `+=`).
+
+    scale(factor: Union[int, float], backend: Optional[str] = None, out: Optional['Matrix'] = None) -> 'Matrix':
+        Multiplies every element by a number (in place with `*=`).
+
+    multiply(other: 'Matrix', backend: Optional[str] = None, workers: int = 1, algorithm: str = "auto", out: Optional['Matrix'] = None) -> 'Matrix':
+        Multiplies the current matrix with another matrix and returns the result (also `*`).
+
+    matvec(vector: Vector, backend: Optional[str] = None, out: Optional[Vector] = None) -> Vector:
+        Multiplies the current matrix by a column vector (also ``matrix * vector``).
 
-    __add__(other: 'Matrix') -> 'Matrix':
-        Adds the current matrix with another matrix and returns the result.
+    vecmat(vector: Vector, backend: Optional[str] = None, out: Optional[Vector] = None) -> Vector:
+        Multiplies a row vector by the current matrix (also ``vector * matrix``).
 
-    __mul__(other: 'Matrix') -> 'Matrix':
-        Multiplies the current matrix with another matrix and returns the result.
+    trans(backend: Optional[str] = None, out: Optional['Matrix'] = None) -> 'Matrix':
+        Transposes the current matrix (swaps rows with columns) and returns the result as a view.
 
-    trans() -> 'Matrix':
-        Transposes the current matrix (swaps rows with columns) and returns the result.
+    copy() -> 'Matrix':
+        Returns an independent row-major copy of the matrix.
+
+    lazy() -> 'MatrixExpression':
+        Starts a lazy expression (see `MatrixExpression`).
     """
 
+    # factorizations cached by `project.linalg`, dropped by `_prepare_write`
+    _factorizations: Optional[Dict[str, Any]] = None
+
     def __init__(self, content: List[List[Union[int, float]]] = []) -> None:
         """
         Initializes a matrix.
 
         Takes a two-dimensional list (a list of lists) that represents the matrix.
         Automatically aligns the rows to the maximum length by adding zeros to the end
-        of rows that are shorter than others.
+        of rows that are shorter than others. The rows are copied into the flat storage,
+        the passed list itself is left untouched.
 
         Parameters:
         -----------
         content : List[List[Union[int, float]]], optional
             A two-dimensional list of numbers (int or float) representing the matrix. Defaults to an empty list.
         """
-        self.content: List[List[Union[int, float]]] = content
-        self.width: int = 0
-        self.height: int = len(self.content)
+        width: int = 0
+        for row in content:
+            width = max(len(row), width)
+        data = array("d")
+        for row in content:
+            data.extend(row)
+            if width > len(row):
+                data.extend([0.0] * (width - len(row)))
+        self._set_storage(data, len(content), width)
 
+    @classmethod
+    def _from_array(cls, data: array, height: int, width: int) -> "Matrix":
+        """
+        Creates a matrix directly over a row-major storage without copying it.
+
+        Parameters:
+        -----------
+        data : array
+            A flat ``array('d')`` with exactly ``height * width`` elements.
+        height : int
+            The number of rows.
+        width : int
+            The number of columns.
+
+        Returns:
+        --------
+        Matrix
+            A matrix that owns the passed storage.
+        """
+        matrix = cls.__new__(cls)
+        matrix._set_storage(data, height, width)
+        return matrix
+
+    def _set_storage(self, data: array, height: int, width: int) -> None:
+        """
+        Attaches a row-major storage with the given shape to the matrix.
+        """
+        self._data: array = data
+        self.height: int = height
+        self.width: int = width
+        self._row_stride: int = width
+        self._col_stride: int = 1
+        self._shared: bool = False
+
+    def _is_contiguous(self) -> bool:
+        """
+        Checks whether the storage is laid out row by row without gaps.
+        """
+        return (self._col_stride == 1 or self.width <= 1) and (
+            self._row_stride == self.width or self.height <= 1
+        )
+
+    def _prepare_write(self) -> None:
+        """
+        Makes the storage private before a mutation (copy-on-write) and drops the
+        cached factorizations.
+
+        A storage shared with a transposition view is copied into a new row-major
+        array, so neither the view nor the original observe the change.
+        """
+        self._factorizations = None
+        if self._shared:
+            self._set_storage(self.copy()._data, self.height, self.width)
+
+    def _prepare_output(self, height: int, width: int) -> None:
+        """
+        Checks that the matrix can receive a result of the given shape (``out=``)
+        and makes its storage private and contiguous.
+
+        Exceptions:
+        -----------
+        Exception
+            If the shape of the matrix differs from the shape of the result.
+        """
+        if self.height != height or self.width != width:
+            raise Exception(f"Output matrix must be of size {height}x{width}")
+        self._prepare_write()
+
+    @staticmethod
+    def _result(
+        data: array, height: int, width: int, out: Optional["Matrix"]
+    ) -> "Matrix":
+        """
+        Wraps a computed storage into a new matrix, or copies it into the storage
+        of `out` (prepared by `_prepare_output`) without reallocating it. Used by the
+        kernels that cannot write into `out` directly.
+        """
+        if out is None:
+            return Matrix._from_array(data, height, width)
+        out._data[:] = data
+        return out
+
+    def _row(self, i: int) -> array:
+        """
+        Returns a copy of the i-th row as an ``array('d')``.
+        """
+        start = i * self._row_stride
+        return self._data[
+            start : start + self.width * self._col_stride : self._col_stride
+        ]
+
+    def _column(self, j: int) -> array:
+        """
+        Returns a copy of the j-th column as an ``array('d')``.
+        """
+        start = j * self._col_stride
+        return self._data[
+            start : start + self.height * self._row_stride : self._row_stride
+        ]
+
+    def _flat(self) -> array:
+        """
+        Returns the elements as a row-major ``array('d')`` (the storage itself when possible).
+        """
+        if self._is_contiguous():
+            return self._data
+        result = array("d")
         for i in range(self.height):
-            self.width = max(len(self.content[i]), self.width)
-        for i in range(self.height):
-            if self.width > len(self.content[i]):
-                self.content[i] += [0] * (self.width - len(self.content[i]))
+            result.extend(self._row(i))
+        return result
+
+    def to_file(self, path: str) -> None:
+        """
+        Saves the matrix in the binary matrix format.
+
+        The file starts with a header (``b"MTRX"``, the dtype ``b"d"``, the height
+        and the width as little-endian 64-bit integers, 24 bytes in total), followed
+        by the elements in row-major order as little-endian doubles.
+
+        Parameters:
+        -----------
+        path : str
+            The path of the file to write.
+        """
+        data = self._flat()
+        if sys.byteorder == "big":
+            data = array("d", data)
+            data.byteswap()
+        with open(path, "wb") as file:
+            file.write(_pack_header(self.height, self.width))
+            data.tofile(file)
+
+    @classmethod
+    def from_file(cls, path: str) -> "Matrix":
+        """
+        Loads a matrix saved by `to_file` into memory.
+
+        Use `MappedMatrix` for matrices that do not fit into memory.
+
+        Parameters:
+        -----------
+        path : str
+            The path of the file to read.
+
+        Returns:
+        --------
+        Matrix
+            The loaded matrix.
+
+        Exceptions:
+        -----------
+        Exception
+            If the file is not in the binary matrix format.
+        """
+        with open(path, "rb") as file:
+            height, width = _unpack_header(file.read(_FILE_HEADER.size))
+            data = array("d")
+            data.fromfile(file, height * width)
+        if sys.byteorder == "big":
+            data.byteswap()
+        return cls._from_array(data, height, width)
+
+    def lazy(self) -> "MatrixExpression":
+        """
+        Wraps the matrix into a lazy expression.
+
+        Operations on the result build an expression tree instead of computing
+        intermediate matrices; call `MatrixExpression.evaluate` to get the value.
+
+        Returns:
+        --------
+        MatrixExpression
+            An expression consisting of this matrix only.
+
+        Example:
+        --------
+        >>> ((a.lazy() + b) * c.trans() + d).evaluate()
+        """
+        return _MatrixLeaf(self)
+
+    def copy(self) -> "Matrix":
+        """
+        Creates an independent matrix with the same elements in row-major order.
+
+        Use it to materialize a transposition view explicitly.
+
+        Returns:
+        --------
+        Matrix
+            A new matrix that does not share the storage with the current one.
+        """
+        data = self._flat()
+        if data is self._data:
+            data = array("d", data)
+        return Matrix._from_array(data, self.height, self.width)
+
+    @property
+    def content(self) -> List[List[float]]:
+        """
+        The matrix as a two-dimensional list.
+
+        The list is built from the storage on every access, so changing it does not
+        change the matrix; use item assignment (``matrix[i, j] = value``) instead.
+        """
+        return [self._row(i).tolist() for i in range(self.height)]
+
+    def _offset(self, index: Tuple[int, int]) -> int:
+        """
+        Converts a ``(row, column)`` pair into a position in the storage.
+
+        Exceptions:
+        -----------
+        IndexError
+            If the row or the column is out of the matrix bounds.
+        """
+        i, j = index
+        if not (0 <= i < self.height and 0 <= j < self.width):
+            raise IndexError("Matrix index out of range")
+        return i * self._row_stride + j * self._col_stride
+
+    def __getitem__(self, index: Tuple[int, int]) -> float:
+        """
+        Returns the element at the given position.
+
+        Parameters:
+        -----------
+        index : Tuple[int, int]
+            The row and the column of the element.
+
+        Returns:
+        --------
+        float
+            The element of the matrix.
+        """
+        return self._data[self._offset(index)]
+
+    def __setitem__(self, index: Tuple[int, int], value: Union[int, float]) -> None:
+        """
+        Replaces the element at the given position.
+
+        Parameters:
+        -----------
+        index : Tuple[int, int]
+            The row and the column of the element.
+        value : Union[int, float]
+            The new value of the element.
+        """
+        self._prepare_write()
+        self._data[self._offset(index)] = value
+
+    def _to_ndarray(self) -> Any:
+        """
+        Returns a NumPy view over the storage (no data is copied).
+        """
+        return numpy.lib.stride_tricks.as_strided(
+            numpy.frombuffer(self._data, dtype=numpy.float64),
+            shape=(self.height, self.width),
+            strides=(self._row_stride * 8, self._col_stride * 8),
+            writeable=False,
+        )
+
+    def _to_writable_ndarray(self) -> Any:
+        """
+        Returns a writable NumPy view over a contiguous storage (see `_prepare_output`).
+        """
+        return numpy.frombuffer(self._data, dtype=numpy.float64).reshape(
+            self.height, self.width
+        )
+
+    @classmethod
+    def _from_ndarray(cls, values: Any) -> "Matrix":
+        """
+        Creates a matrix from a two-dimensional NumPy array.
+        """
+        height, width = values.shape
+        return cls._from_array(
+            array("d", numpy.ascontiguousarray(values, dtype=numpy.float64).tobytes()),
+            height,
+            width,
+        )
 
     def __add__(self, other: "Matrix") -> "Matrix":
+        """
+        Adds the current matrix with another matrix using the global backend (see `add`).
+        """
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.add(other)
+
+    def __mul__(self, other: Any) -> Any:
+        """
+        Multiplies the current matrix with another matrix (see `multiply`) or with
+        a vector (see `matvec`) using the global backend.
+        """
+        from project.vector import Vector
+
+        if isinstance(other, Vector):
+            return self.matvec(other)
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.multiply(other)
+
+    def __rmul__(self, other: Any) -> Any:
+        """
+        Multiplies a vector by the current matrix using the global backend (see `vecmat`).
+        """
+        from project.vector import Vector
+
+        if not isinstance(other, Vector):
+            return NotImplemented
+        return self.vecmat(other)
+
+    def __iadd__(self, other: "Matrix") -> "Matrix":
+        """
+        Adds another matrix to the current one in place (see `add`).
+        """
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.add(other, out=self)
+
+    def __imul__(self, other: Any) -> "Matrix":
+        """
+        Multiplies the current matrix by a number in place (see `scale`).
+
+        For a matrix operand ``a *= b`` falls back to ``a = a * b``.
+        """
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+        return self.scale(other, out=self)
+
+    def add(
+        self,
+        other: "Matrix",
+        backend: Optional[str] = None,
+        out: Optional["Matrix"] = None,
+    ) -> "Matrix":
         """
         Adds the current matrix with another matrix.
 
@@ -66,29 +763,105 @@ class Matrix:
         -----------
         other : Matrix
             The second matrix to be added.
+        backend : Optional[str]
+            "python" or "numpy", overrides the global backend for this call.
+        out : Optional[Matrix]
+            A matrix of the same size to write the result into (may be one of the operands).
 
         Returns:
         --------
         Matrix
-            A new matrix representing the result of adding the two matrices.
+            A new matrix representing the result of adding the two matrices, or `out`.
 
         Exceptions:
         -----------
         Exception
-            If the sizes of the two matrices do not match.
+            If the sizes of the two matrices (or of `out`) do not match.
         """
         if self.width != other.width or self.height != other.height:
             raise Exception(
                 "In order to find the sum of two matrices they must be the same size"
             )
-        return Matrix(
-            [
-                [self.content[y][x] + other.content[y][x] for x in range(self.width)]
-                for y in range(self.height)
-            ]
-        )
+        if out is not None:
+            out._prepare_output(self.height, self.width)
+        if resolve_backend(backend) == "numpy":
+            if out is None:
+                return Matrix._from_ndarray(self._to_ndarray() + other._to_ndarray())
+            numpy.add(
+                self._to_ndarray(), other._to_ndarray(), out=out._to_writable_ndarray()
+            )
+            return out
+        if out is None:
+            return Matrix._from_array(
+                array("d", map(add, self._flat(), other._flat())),
+                self.height,
+                self.width,
+            )
+        # row by row, so only one row is allocated at a time; a row of the result
+        # depends only on the same rows of the operands, so `out` may be an operand
+        data, width = out._data, self.width
+        for i in range(self.height):
+            data[i * width : (i + 1) * width] = array(
+                "d", map(add, self._row(i), other._row(i))
+            )
+        return out
+
+    def scale(
+        self,
+        factor: Union[int, float],
+        backend: Optional[str] = None,
+        out: Optional["Matrix"] = None,
+    ) -> "Matrix":
+        """
+        Multiplies every element of the matrix by a number.
+
+        Parameters:
+        -----------
+        factor : Union[int, float]
+            The number to multiply by.
+        backend : Optional[str]
+            "python" or "numpy", overrides the global backend for this call.
+        out : Optional[Matrix]
+            A matrix of the same size to write the result into (may be the current matrix).
+
+        Returns:
+        --------
+        Matrix
+            A new scaled matrix, or `out`.
 
-    def __mul__(self, other: "Matrix") -> "Matrix":
+        Exceptions:
+        -----------
+        Exception
+            If the size of `out` does not match.
+        """
+        if out is not None:
+            out._prepare_output(self.height, self.width)
+        if resolve_backend(backend) == "numpy":
+            if out is None:
+                return Matrix._from_ndarray(self._to_ndarray() * factor)
+            numpy.multiply(self._to_ndarray(), factor, out=out._to_writable_ndarray())
+            return out
+        if out is None:
+            return Matrix._from_array(
+                array("d", map(mul, self._flat(), repeat(factor))),
+                self.height,
+                self.width,
+            )
+        data, width = out._data, self.width
+        for i in range(self.height):
+            data[i * width : (i + 1) * width] = array(
+                "d", map(mul, self._row(i), repeat(factor))
+            )
+        return out
+
+    def multiply(
+        self,
+        other: "Matrix",
+        backend: Optional[str] = None,
+        workers: int = 1,
+        algorithm: str = "auto",
+        out: Optional["Matrix"] = None,
+    ) -> "Matrix":
         """
         Multiplies the current matrix with another matrix.
 
@@ -96,46 +869,266 @@ class Matrix:
         matrix matches the number of rows in the second matrix. Returns a new matrix containing
         the result of the multiplication.
 
+        The "python" backend transposes the right operand once, so every element of the
+        result is the dot product of two contiguous arrays. The product is computed by
+        one of the algorithms: "naive" (row by row), "blocked" (tile by tile, see
+        `_multiply_blocked`) or "strassen" (Strassen-Winograd recursion down to
+        `STRASSEN_CUTOFF`, see `_strassen`); "auto" picks one with `choose_algorithm`.
+        The "numpy" backend calls ``numpy.matmul``.
+
+        With ``workers > 1`` the "python" backend splits the rows of the result between
+        worker processes (see `_multiply_parallel`) once the product needs at least
+        `PARALLEL_THRESHOLD` multiplications; smaller products stay serial. The "numpy"
+        backend has no worker processes (``numpy.matmul`` may use a multithreaded BLAS),
+        so it rejects ``workers > 1``.
+
         Parameters:
         -----------
         other : Matrix
             The second matrix to multiply with the current matrix.
+        backend : Optional[str]
+            "python" or "numpy", overrides the global backend for this call.
+        workers : int
+            The number of worker processes for the "python" backend, defaults to 1 (serial).
+        algorithm : str
+            "auto", "naive", "blocked" or "strassen" for the serial "python" backend
+            (checked, but not used, by the "numpy" backend).
+        out : Optional[Matrix]
+            A matrix of the size of the product to write the result into (may be one of the operands).
+            The "numpy" backend and the "naive" and "blocked" algorithms write into its storage
+            directly, "strassen" and the parallel product copy their result into it.
 
         Returns:
         --------
         Matrix
-            A new matrix representing the result of multiplying the two matrices.
+            A new matrix representing the result of multiplying the two matrices, or `out`.
 
         Exceptions:
         -----------
         Exception
-            If the number of columns in the first matrix does not match the number of rows in the second.
+            If the number of columns in the first matrix does not match the number of rows
+            in the second, or if the size of `out` does not match.
+        ValueError
+            If the algorithm is unknown, or if ``workers > 1`` with the "numpy" backend.
         """
-        if self.height != other.width:
+        if self.width != other.height:
             raise Exception("Matrix dimensions not fit for multiplication")
-        return Matrix(
-            [
-                [
-                    sum(
-                        self.content[i][k] * other.content[k][j]
-                        for k in range(self.width)
-                    )
-                    for j in range(other.width)
-                ]
-                for i in range(self.height)
-            ]
-        )
+        return self._product(other, backend, workers, algorithm, out)
 
-    def trans(self) -> "Matrix":
+    def _product(
+        self,
+        other: "Matrix",
+        backend: Optional[str] = None,
+        workers: int = 1,
+        algorithm: str = "auto",
+        out: Optional["Matrix"] = None,
+    ) -> "Matrix":
         """
-        Transposes the current matrix.
+        Computes the product without checking the shapes (``self.width == other.height`` is assumed).
+        """
+        if algorithm not in ALGORITHMS:
+            raise ValueError(
+                f"Unknown algorithm '{algorithm}', expected one of {ALGORITHMS}"
+            )
+        if out is not None:
+            out._prepare_output(self.height, other.width)
+        if resolve_backend(backend) == "numpy":
+            if workers > 1:
+                raise ValueError("workers > 1 requires the python backend")
+            if out is None:
+                return Matrix._from_ndarray(
+                    numpy.matmul(self._to_ndarray(), other._to_ndarray())
+                )
+            numpy.matmul(
+                self._to_ndarray(), other._to_ndarray(), out=out._to_writable_ndarray()
+            )
+            return out
+        if workers > 1 and self.height * self.width * other.width >= PARALLEL_THRESHOLD:
+            product = _multiply_parallel(self, other, workers)
+            return Matrix._result(product._data, self.height, other.width, out)
+        if algorithm == "auto":
+            algorithm = choose_algorithm(self.height, self.width, other.width)
+        # the rows and the columns are copies, so the kernels may write into `out`
+        # even if it is one of the operands
+        rows = [self._row(i) for i in range(self.height)]
+        columns = [other._column(j) for j in range(other.width)]
+        target = None if out is None else out._data
+        if algorithm == "naive":
+            result = _multiply_naive(rows, columns, target)
+        elif algorithm == "strassen":
+            result = _multiply_strassen(rows, columns, self.width)
+        else:
+            result = _multiply_blocked(rows, columns, target)
+        if out is not None and result is out._data:
+            return out
+        return Matrix._result(result, self.height, other.width, out)
+
+    def matvec(
+        self,
+        vector: "Vector",
+        backend: Optional[str] = None,
+        out: Optional["Vector"] = None,
+    ) -> "Vector":
+        """
+        Multiplies the current matrix by a column vector.
+
+        The vector is used as is, without converting it into a matrix: every
+        coordinate of the result is the dot product of a row with the coordinates.
+        The rows are read through a ``memoryview`` over the storage, so neither the
+        matrix (including a transposition view) nor the vector is copied.
+
+        Parameters:
+        -----------
+        vector : Vector
+            The vector with as many coordinates as the matrix has columns.
+        backend : Optional[str]
+            "python" or "numpy", overrides the global backend for this call.
+        out : Optional[Vector]
+            A vector with as many coordinates as the matrix has rows to write the
+            result into, e.g. to reuse it between iterations.
+
+        Returns:
+        --------
+        Vector
+            A new vector with as many coordinates as the matrix has rows, or `out`.
+
+        Exceptions:
+        -----------
+        Exception
+            If the number of coordinates does not match the number of columns,
+            or if the size of `out` does not match.
+
+        Example:
+        --------
+        >>> Matrix([[1, 2], [3, 4]]).matvec(Vector([1, 1]))
+        Vector([3.0, 7.0])
+        """
+        return self._vector_product(vector, False, backend, out)
+
+    def vecmat(
+        self,
+        vector: "Vector",
+        backend: Optional[str] = None,
+        out: Optional["Vector"] = None,
+    ) -> "Vector":
+        """
+        Multiplies a row vector by the current matrix.
+
+        Same as `matvec` for the transposed matrix: every coordinate of the result
+        is the dot product of a column with the coordinates, nothing is copied.
+
+        Parameters:
+        -----------
+        vector : Vector
+            The vector with as many coordinates as the matrix has rows.
+        backend : Optional[str]
+            "python" or "numpy", overrides the global backend for this call.
+        out : Optional[Vector]
+            A vector with as many coordinates as the matrix has columns to write
+            the result into.
+
+        Returns:
+        --------
+        Vector
+            A new vector with as many coordinates as the matrix has columns, or `out`.
+
+        Exceptions:
+        -----------
+        Exception
+            If the number of coordinates does not match the number of rows,
+            or if the size of `out` does not match.
+
+        Example:
+        --------
+        >>> Matrix([[1, 2], [3, 4]]).vecmat(Vector([1, 1]))
+        Vector([4.0, 6.0])
+        """
+        return self._vector_product(vector, True, backend, out)
+
+    def _vector_product(
+        self,
+        vector: "Vector",
+        transposed: bool,
+        backend: Optional[str],
+        out: Optional["Vector"],
+    ) -> "Vector":
+        """
+        Computes the dot products of the rows (or of the columns if `transposed`)
+        with the vector.
+        """
+        from project.vector import Vector
+
+        if transposed:
+            count, length = self.width, self.height
+            line_stride, step = self._col_stride, self._row_stride
+        else:
+            count, length = self.height, self.width
+            line_stride, step = self._row_stride, self._col_stride
+        if len(vector.coordinates) != length:
+            raise Exception("Matrix dimensions not fit for multiplication")
+        if out is not None and len(out.coordinates) != count:
+            raise Exception(f"Output vector must be of size {count}")
+        if resolve_backend(backend) == "numpy":
+            matrix = self._to_ndarray().T if transposed else self._to_ndarray()
+            coordinates = numpy.frombuffer(vector.coordinates, dtype=numpy.float64)
+            if out is None:
+                return Vector(array("d", (matrix @ coordinates).tobytes()))
+            numpy.matmul(
+                matrix,
+                coordinates,
+                out=numpy.frombuffer(out._writable(), dtype=numpy.float64),
+            )
+            return out
+        coordinates = vector.coordinates
+        with memoryview(self._data) as view:
+            result = array(
+                "d",
+                [
+                    sum(
+                        map(
+                            mul,
+                            view[start : start + length * step : step],
+                            coordinates,
+                        ),
+                        0.0,
+                    )
+                    for start in map(mul, range(count), repeat(line_stride))
+                ],
+            )
+        if out is None:
+            return Vector(result)
+        out._writable()[:] = result
+        return out
+
+    def trans(
+        self, backend: Optional[str] = None, out: Optional["Matrix"] = None
+    ) -> "Matrix":
+        """
+        Transposes the current matrix.
+
+        Swaps rows with columns without copying anything: the result is a view over
+        the same storage with swapped strides. The storage is copied only when either
+        matrix is mutated (copy-on-write) or when `copy` is called, so transposing
+        before a multiplication costs O(1). With `out` the transposition is written
+        into the storage of `out` instead.
 
-        Swaps rows with columns and returns a new matrix.
+        Parameters:
+        -----------
+        backend : Optional[str]
+            "python" or "numpy", overrides the global backend for writing into `out`;
+            the view is the same for every backend.
+        out : Optional[Matrix]
+            A matrix of the transposed size to write the result into.
 
         Returns:
         --------
         Matrix
-            A new transposed matrix.
+            A transposed matrix (a view), or `out`.
+
+        Exceptions:
+        -----------
+        Exception
+            If the size of `out` does not match.
 
         Example:
         --------
@@ -144,9 +1137,1041 @@ class Matrix:
         The transposed matrix will be:
         [[1, 4], [2, 5], [3, 6]]
         """
-        return Matrix(
-            [
-                [self.content[x][y] for x in range(self.height)]
-                for y in range(self.width)
-            ]
+        if out is not None:
+            out._prepare_output(self.width, self.height)
+            if resolve_backend(backend) == "numpy":
+                numpy.copyto(out._to_writable_ndarray(), self._to_ndarray().T)
+                return out
+            if out._data is not self._data:
+                for j in range(self.width):
+                    out._data[j * self.height : (j + 1) * self.height] = self._column(j)
+                return out
+            # transposing a square matrix into itself would overwrite columns
+            # before they are read, so the result is built aside
+            data = array("d")
+            for j in range(self.width):
+                data.extend(self._column(j))
+            return Matrix._result(data, self.width, self.height, out)
+        resolve_backend(backend)
+        view = Matrix.__new__(Matrix)
+        view._data = self._data
+        view.height = self.width
+        view.width = self.height
+        view._row_stride = self._col_stride
+        view._col_stride = self._row_stride
+        view._shared = True
+        self._shared = True
+        return view
+
+
+def _pack_header(height: int, width: int) -> bytes:
+    """
+    Builds the header of the binary matrix format.
+    """
+    return _FILE_HEADER.pack(_FILE_MAGIC, b"d", height, width)
+
+
+def _unpack_header(header: bytes) -> Tuple[int, int]:
+    """
+    Parses the header of the binary matrix format and returns the shape.
+
+    Exceptions:
+    -----------
+    Exception
+        If the header is not a valid matrix header.
+    """
+    if len(header) != _FILE_HEADER.size:
+        raise Exception("File is not a matrix file")
+    magic, dtype, height, width = _FILE_HEADER.unpack(header)
+    if magic != _FILE_MAGIC:
+        raise Exception("File is not a matrix file")
+    if dtype != b"d":
+        raise Exception(f"Unsupported matrix file dtype {dtype!r}")
+    return height, width
+
+
+class MappedMatrix:
+    """
+    A matrix stored in a file of the binary matrix format (see `Matrix.to_file`)
+    and accessed through ``mmap``.
+
+    Only the parts that are being read are paged into memory, so the matrix can be
+    larger than the RAM. `trans` and `multiply` work tile by tile
+    (`FILE_BLOCK_SIZE x FILE_BLOCK_SIZE`) and write the result into another file,
+    so the peak memory depends on the tile size rather than on the matrix size.
+    The elements are accessed in the native byte order, as the format is little-endian
+    this assumes a little-endian machine.
+
+    Attributes:
+    -----------
+    path : str
+        The path of the file.
+    height : int
+        The number of rows in the matrix.
+    width : int
+        The number of columns in the matrix.
+
+    Methods:
+    --------
+    open(path: str, writable: bool = False) -> 'MappedMatrix':
+        Maps an existing matrix file.
+
+    create(path: str, height: int, width: int) -> 'MappedMatrix':
+        Creates a zero matrix file of the given shape and maps it.
+
+    read_rows(start: int, end: int) -> Matrix:
+        Loads the given rows into memory.
+
+    trans(path: str) -> 'MappedMatrix':
+        Transposes the matrix into a new file.
+
+    multiply(other: 'MappedMatrix', path: str) -> 'MappedMatrix':
+        Multiplies the matrix by another one into a new file.
+
+    close() -> None:
+        Unmaps the file.
+    """
+
+    def __init__(self, path: str, writable: bool = False) -> None:
+        """
+        Maps an existing matrix file.
+
+        Parameters:
+        -----------
+        path : str
+            The path of the file.
+        writable : bool
+            Whether the elements may be changed (the changes go to the file).
+
+        Exceptions:
+        -----------
+        Exception
+            If the file is not in the binary matrix format.
+        """
+        self.path: str = path
+        self._file = open(path, "r+b" if writable else "rb")
+        self.height, self.width = _unpack_header(self._file.read(_FILE_HEADER.size))
+        self._mmap = mmap.mmap(
+            self._file.fileno(),
+            0,
+            access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ,
+        )
+        self._view: Any = memoryview(self._mmap)[_FILE_HEADER.size :].cast("d")
+
+    @classmethod
+    def open(cls, path: str, writable: bool = False) -> "MappedMatrix":
+        """
+        Maps an existing matrix file (same as the constructor).
+        """
+        return cls(path, writable)
+
+    @classmethod
+    def create(cls, path: str, height: int, width: int) -> "MappedMatrix":
+        """
+        Creates a file with a zero matrix of the given shape and maps it for writing.
+
+        Parameters:
+        -----------
+        path : str
+            The path of the file.
+        height : int
+            The number of rows.
+        width : int
+            The number of columns.
+
+        Returns:
+        --------
+        MappedMatrix
+            The writable mapped matrix.
+        """
+        with open(path, "wb") as file:
+            file.write(_pack_header(height, width))
+            file.truncate(_FILE_HEADER.size + 8 * height * width)
+        return cls(path, writable=True)
+
+    def close(self) -> None:
+        """
+        Flushes the changes and unmaps the file.
+        """
+        self._view.release()
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "MappedMatrix":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __getitem__(self, index: Tuple[int, int]) -> float:
+        """
+        Returns the element at the given position.
+        """
+        i, j = index
+        if not (0 <= i < self.height and 0 <= j < self.width):
+            raise IndexError("Matrix index out of range")
+        return self._view[i * self.width + j]
+
+    def __setitem__(self, index: Tuple[int, int], value: Union[int, float]) -> None:
+        """
+        Replaces the element at the given position (the matrix must be writable).
+        """
+        i, j = index
+        if not (0 <= i < self.height and 0 <= j < self.width):
+            raise IndexError("Matrix index out of range")
+        self._view[i * self.width + j] = float(value)
+
+    def _read_tile(self, i0: int, i1: int, j0: int, j1: int) -> List[array]:
+        """
+        Reads the rows ``i0..i1`` restricted to the columns ``j0..j1``.
+        """
+        return [
+            array("d", self._view[i * self.width + j0 : i * self.width + j1].tobytes())
+            for i in range(i0, i1)
+        ]
+
+    def _write_tile(self, i0: int, j0: int, j1: int, tile: array) -> None:
+        """
+        Writes a row-major tile with ``j1 - j0`` columns starting at the row ``i0``.
+        """
+        size = j1 - j0
+        for r in range(len(tile) // size if size else 0):
+            start = (i0 + r) * self.width + j0
+            self._view[start : start + size] = tile[r * size : (r + 1) * size]
+
+    def read_rows(self, start: int, end: int) -> Matrix:
+        """
+        Loads the rows ``start..end`` into an in-memory `Matrix`.
+
+        Parameters:
+        -----------
+        start : int
+            The first row.
+        end : int
+            The row after the last one.
+
+        Returns:
+        --------
+        Matrix
+            The loaded rows.
+        """
+        end = min(end, self.height)
+        return Matrix._from_array(
+            array("d", self._view[start * self.width : end * self.width].tobytes()),
+            end - start,
+            self.width,
         )
+
+    def to_matrix(self) -> Matrix:
+        """
+        Loads the whole matrix into memory.
+        """
+        return self.read_rows(0, self.height)
+
+    def trans(self, path: str) -> "MappedMatrix":
+        """
+        Transposes the matrix into a new file tile by tile.
+
+        Parameters:
+        -----------
+        path : str
+            The path of the result file.
+
+        Returns:
+        --------
+        MappedMatrix
+            The transposed matrix (writable).
+        """
+        result = MappedMatrix.create(path, self.width, self.height)
+        block = FILE_BLOCK_SIZE
+        for i0 in range(0, self.height, block):
+            i1 = min(i0 + block, self.height)
+            for j0 in range(0, self.width, block):
+                j1 = min(j0 + block, self.width)
+                tile = array("d")
+                for row in self._read_tile(i0, i1, j0, j1):
+                    tile.extend(row)
+                transposed = array("d")
+                for j in range(j1 - j0):
+                    transposed.extend(tile[j :: j1 - j0])
+                result._write_tile(j0, i0, i1, transposed)
+        return result
+
+    def multiply(self, other: "MappedMatrix", path: str) -> "MappedMatrix":
+        """
+        Multiplies the matrix by another one into a new file tile by tile.
+
+        Every tile of the result is accumulated over the tiles of the inner
+        dimension; for each of them a tile of the left operand and the columns of a
+        tile of the right operand are loaded and multiplied by `_multiply_blocked`.
+
+        Parameters:
+        -----------
+        other : MappedMatrix
+            The right operand.
+        path : str
+            The path of the result file.
+
+        Returns:
+        --------
+        MappedMatrix
+            The product (writable).
+
+        Exceptions:
+        -----------
+        Exception
+            If the number of columns in the first matrix does not match the number of rows in the second.
+        """
+        if self.width != other.height:
+            raise Exception("Matrix dimensions not fit for multiplication")
+        result = MappedMatrix.create(path, self.height, other.width)
+        block = FILE_BLOCK_SIZE
+        for i0 in range(0, self.height, block):
+            i1 = min(i0 + block, self.height)
+            for j0 in range(0, other.width, block):
+                j1 = min(j0 + block, other.width)
+                accumulator = array("d", bytes(8 * (i1 - i0) * (j1 - j0)))
+                for k0 in range(0, self.width, block):
+                    k1 = min(k0 + block, self.width)
+                    rows = self._read_tile(i0, i1, k0, k1)
+                    right = array("d")
+                    for row in other._read_tile(k0, k1, j0, j1):
+                        right.extend(row)
+                    columns = [right[j :: j1 - j0] for j in range(j1 - j0)]
+                    accumulator = array(
+                        "d", map(add, accumulator, _multiply_blocked(rows, columns))
+                    )
+                result._write_tile(i0, j0, j1, accumulator)
+        return result
+
+
+def _chain_order(dimensions: List[int]) -> List[List[int]]:
+    """
+    Finds the optimal parenthesization of a matrix chain (dynamic programming).
+
+    Parameters:
+    -----------
+    dimensions : List[int]
+        The matrix ``i`` of the chain has the shape ``dimensions[i] x dimensions[i + 1]``.
+
+    Returns:
+    --------
+    List[List[int]]
+        ``split[i][j]`` is the factor after which the chain ``i..j`` is split.
+    """
+    count = len(dimensions) - 1
+    cost = [[0] * count for _ in range(count)]
+    split = [[0] * count for _ in range(count)]
+    for length in range(2, count + 1):
+        for i in range(count - length + 1):
+            j = i + length - 1
+            cost[i][j] = -1
+            for k in range(i, j):
+                candidate = (
+                    cost[i][k]
+                    + cost[k + 1][j]
+                    + dimensions[i] * dimensions[k + 1] * dimensions[j + 1]
+                )
+                if cost[i][j] < 0 or candidate < cost[i][j]:
+                    cost[i][j] = candidate
+                    split[i][j] = k
+    return split
+
+
+class MatrixExpression(ABC):
+    """
+    A lazy matrix expression built from `Matrix.lazy`.
+
+    ``+``, ``*`` and `trans` build a tree instead of computing intermediate
+    matrices, operands may be expressions or plain matrices. `evaluate`
+    computes the value:
+
+    - a sum of any number of terms is computed in a single pass over the elements;
+    - a chain of products is computed in the order minimizing the number of
+      multiplications (matrix-chain parenthesization);
+    - transposition is pushed down to the matrices and costs nothing (see `Matrix.trans`).
+
+    Attributes:
+    -----------
+    height : int
+        The number of rows of the result.
+    width : int
+        The number of columns of the result.
+    """
+
+    height: int
+    width: int
+
+    def _terms(self) -> List["MatrixExpression"]:
+        """
+        Returns the expressions summed by this expression.
+        """
+        return [self]
+
+    def _factors(self) -> List["MatrixExpression"]:
+        """
+        Returns the expressions multiplied by this expression.
+        """
+        return [self]
+
+    def __add__(self, other: Any) -> "MatrixExpression":
+        """
+        Builds the sum of two expressions.
+
+        Exceptions:
+        -----------
+        Exception
+            If the sizes of the two operands do not match.
+        """
+        operand = _as_expression(other)
+        if operand is None:
+            return NotImplemented
+        if self.width != operand.width or self.height != operand.height:
+            raise Exception(
+                "In order to find the sum of two matrices they must be the same size"
+            )
+        return _MatrixSum(self._terms() + operand._terms())
+
+    def __radd__(self, other: Any) -> "MatrixExpression":
+        """
+        Builds the sum of a matrix and an expression.
+        """
+        operand = _as_expression(other)
+        if operand is None:
+            return NotImplemented
+        return operand + self
+
+    def __mul__(self, other: Any) -> "MatrixExpression":
+        """
+        Builds the product of two expressions.
+
+        Exceptions:
+        -----------
+        Exception
+            If the number of columns of the left operand does not match the number of rows of the right one.
+        """
+        operand = _as_expression(other)
+        if operand is None:
+            return NotImplemented
+        if self.width != operand.height:
+            raise Exception("Matrix dimensions not fit for multiplication")
+        return _MatrixProduct(self._factors() + operand._factors())
+
+    def __rmul__(self, other: Any) -> "MatrixExpression":
+        """
+        Builds the product of a matrix and an expression.
+        """
+        operand = _as_expression(other)
+        if operand is None:
+            return NotImplemented
+        return operand * self
+
+    @abstractmethod
+    def trans(self) -> "MatrixExpression":
+        """
+        Builds the transposition of the expression.
+        """
+
+    @abstractmethod
+    def evaluate(self, backend: Optional[str] = None) -> Matrix:
+        """
+        Computes the value of the expression.
+
+        Parameters:
+        -----------
+        backend : Optional[str]
+            "python" or "numpy", overrides the global backend for this call.
+
+        Returns:
+        --------
+        Matrix
+            The value of the expression.
+        """
+
+
+class _MatrixLeaf(MatrixExpression):
+    """
+    An expression consisting of a single matrix.
+    """
+
+    def __init__(self, matrix: Matrix) -> None:
+        self.matrix: Matrix = matrix
+        self.height = matrix.height
+        self.width = matrix.width
+
+    def trans(self) -> MatrixExpression:
+        return _MatrixLeaf(self.matrix.trans())
+
+    def evaluate(self, backend: Optional[str] = None) -> Matrix:
+        return self.matrix
+
+
+class _MatrixSum(MatrixExpression):
+    """
+    A sum of several expressions of the same size.
+    """
+
+    def __init__(self, terms: List[MatrixExpression]) -> None:
+        self.terms: List[MatrixExpression] = terms
+        self.height = terms[0].height
+        self.width = terms[0].width
+
+    def _terms(self) -> List[MatrixExpression]:
+        return self.terms
+
+    def trans(self) -> MatrixExpression:
+        return _MatrixSum([term.trans() for term in self.terms])
+
+    def evaluate(self, backend: Optional[str] = None) -> Matrix:
+        values = [term.evaluate(backend) for term in self.terms]
+        if resolve_backend(backend) == "numpy":
+            result = numpy.array(values[0]._to_ndarray())
+            for value in values[1:]:
+                numpy.add(result, value._to_ndarray(), out=result)
+            return Matrix._from_ndarray(result)
+        flats = [value._flat() for value in values]
+        elements: Iterator[float] = iter(flats[0])
+        for flat in flats[1:]:
+            elements = map(add, elements, flat)
+        return Matrix._from_array(array("d", elements), self.height, self.width)
+
+
+class _MatrixProduct(MatrixExpression):
+    """
+    A chain of products of several expressions.
+    """
+
+    def __init__(self, factors: List[MatrixExpression]) -> None:
+        self.factors: List[MatrixExpression] = factors
+        self.height = factors[0].height
+        self.width = factors[-1].width
+
+    def _factors(self) -> List[MatrixExpression]:
+        return self.factors
+
+    def trans(self) -> MatrixExpression:
+        return _MatrixProduct([factor.trans() for factor in reversed(self.factors)])
+
+    def evaluate(self, backend: Optional[str] = None) -> Matrix:
+        values = [factor.evaluate(backend) for factor in self.factors]
+        split = _chain_order([value.height for value in values] + [self.width])
+
+        def multiply(i: int, j: int) -> Matrix:
+            if i == j:
+                return values[i]
+            k = split[i][j]
+            return multiply(i, k)._product(multiply(k + 1, j), backend)
+
+        return multiply(0, len(values) - 1)
+
+
+def _as_expression(operand: Any) -> Optional[MatrixExpression]:
+    """
+    Converts an operand of a lazy operation to an expression (None for unsupported types).
+    """
+    if isinstance(operand, MatrixExpression):
+        return operand
+    if isinstance(operand, Matrix):
+        return _MatrixLeaf(operand)
+    return None
+
+
+class COOMatrix:
+    """
+    A sparse matrix in the coordinate (COO) format, meant for construction.
+
+    Every non-zero element is stored as a triple (row, column, value) in three
+    parallel arrays, so appending an element is O(1). Duplicated positions are
+    summed when the matrix is converted to CSR.
+
+    Attributes:
+    -----------
+    height : int
+        The number of rows in the matrix.
+    width : int
+        The number of columns in the matrix.
+    rows : array
+        Row indices of the stored elements.
+    columns : array
+        Column indices of the stored elements.
+    values : array
+        Values of the stored elements.
+
+    Methods:
+    --------
+    insert(row: int, column: int, value: Union[int, float]) -> None:
+        Adds an element to the matrix.
+
+    to_csr() -> 'CSRMatrix':
+        Converts the matrix to the CSR format.
+
+    to_matrix() -> Matrix:
+        Converts the matrix to a dense `Matrix`.
+    """
+
+    def __init__(self, height: int, width: int) -> None:
+        """
+        Initializes an empty (all zeros) sparse matrix of the given shape.
+
+        Parameters:
+        -----------
+        height : int
+            The number of rows.
+        width : int
+            The number of columns.
+        """
+        self.height: int = height
+        self.width: int = width
+        self.rows: array = array("q")
+        self.columns: array = array("q")
+        self.values: array = array("d")
+
+    @property
+    def nnz(self) -> int:
+        """
+        The number of stored elements.
+        """
+        return len(self.values)
+
+    def insert(self, row: int, column: int, value: Union[int, float]) -> None:
+        """
+        Adds an element to the matrix. Zeros are not stored.
+
+        Parameters:
+        -----------
+        row : int
+            The row of the element.
+        column : int
+            The column of the element.
+        value : Union[int, float]
+            The value of the element, added to the value already stored at this position.
+
+        Exceptions:
+        -----------
+        IndexError
+            If the position is out of the matrix bounds.
+        """
+        if not (0 <= row < self.height and 0 <= column < self.width):
+            raise IndexError("Matrix index out of range")
+        if value != 0:
+            self.rows.append(row)
+            self.columns.append(column)
+            self.values.append(value)
+
+    def to_csr(self) -> "CSRMatrix":
+        """
+        Converts the matrix to the CSR format.
+
+        The elements are bucketed by row with a counting sort, sorted by column
+        inside every row, and duplicated positions are summed.
+
+        Returns:
+        --------
+        CSRMatrix
+            The same matrix in the CSR format.
+        """
+        buckets: List[List[Tuple[int, float]]] = [[] for _ in range(self.height)]
+        for row, column, value in zip(self.rows, self.columns, self.values):
+            buckets[row].append((column, value))
+        indptr = array("q", [0])
+        indices = array("q")
+        values = array("d")
+        for bucket in buckets:
+            bucket.sort(key=itemgetter(0))
+            last_column = -1
+            for column, value in bucket:
+                if column == last_column:
+                    values[-1] += value
+                else:
+                    indices.append(column)
+                    values.append(value)
+                    last_column = column
+            indptr.append(len(values))
+        return CSRMatrix._from_arrays(
+            indptr, indices, values, self.height, self.width
+        )._without_zeros()
+
+    def to_matrix(self) -> Matrix:
+        """
+        Converts the matrix to a dense `Matrix`.
+
+        Returns:
+        --------
+        Matrix
+            The dense matrix with the same elements.
+        """
+        data = array("d", bytes(8 * self.height * self.width))
+        for row, column, value in zip(self.rows, self.columns, self.values):
+            data[row * self.width + column] += value
+        return Matrix._from_array(data, self.height, self.width)
+
+
+class CSRMatrix:
+    """
+    A sparse matrix in the compressed sparse row (CSR) format, meant for arithmetic.
+
+    The non-zero elements of the row ``i`` are ``values[indptr[i]:indptr[i + 1]]``,
+    their columns are ``indices[indptr[i]:indptr[i + 1]]`` in increasing order.
+    Memory and the cost of every operation depend on the number of non-zero
+    elements rather than on ``width * height``.
+
+    Attributes:
+    -----------
+    height : int
+        The number of rows in the matrix.
+    width : int
+        The number of columns in the matrix.
+    indptr : array
+        Offsets of the rows in `indices` and `values` (``height + 1`` elements).
+    indices : array
+        Column indices of the non-zero elements.
+    values : array
+        Values of the non-zero elements.
+
+    Methods:
+    --------
+    from_matrix(matrix: Matrix) -> 'CSRMatrix':
+        Creates a sparse matrix from a dense one.
+
+    to_matrix() -> Matrix:
+        Converts the matrix to a dense `Matrix`.
+
+    __add__(other: 'CSRMatrix') -> 'CSRMatrix':
+        Adds two sparse matrices.
+
+    __mul__(other: Union['CSRMatrix', Matrix]) -> Union['CSRMatrix', Matrix]:
+        Multiplies the matrix by a sparse or a dense matrix.
+
+    __rmul__(other: Matrix) -> Matrix:
+        Multiplies a dense matrix by the sparse one.
+
+    trans() -> 'CSRMatrix':
+        Transposes the matrix.
+    """
+
+    def __init__(self, content: List[List[Union[int, float]]] = []) -> None:
+        """
+        Initializes a sparse matrix from a two-dimensional list, aligning the rows like `Matrix` does.
+
+        Parameters:
+        -----------
+        content : List[List[Union[int, float]]], optional
+            A two-dimensional list of numbers. Defaults to an empty list.
+        """
+        width: int = 0
+        for row in content:
+            width = max(len(row), width)
+        indptr = array("q", [0])
+        indices = array("q")
+        values = array("d")
+        for row in content:
+            for j, value in enumerate(row):
+                if value != 0:
+                    indices.append(j)
+                    values.append(value)
+            indptr.append(len(values))
+        self._set_arrays(indptr, indices, values, len(content), width)
+
+    @classmethod
+    def _from_arrays(
+        cls, indptr: array, indices: array, values: array, height: int, width: int
+    ) -> "CSRMatrix":
+        """
+        Creates a sparse matrix directly over the CSR arrays without copying them.
+        """
+        matrix = cls.__new__(cls)
+        matrix._set_arrays(indptr, indices, values, height, width)
+        return matrix
+
+    def _set_arrays(
+        self, indptr: array, indices: array, values: array, height: int, width: int
+    ) -> None:
+        """
+        Attaches the CSR arrays with the given shape to the matrix.
+        """
+        self.indptr: array = indptr
+        self.indices: array = indices
+        self.values: array = values
+        self.height: int = height
+        self.width: int = width
+
+    def _without_zeros(self) -> "CSRMatrix":
+        """
+        Removes the explicitly stored zeros (e.g. left after cancellation) in place.
+        """
+        if 0.0 not in self.values:
+            return self
+        indptr = array("q", [0])
+        indices = array("q")
+        values = array("d")
+        for i in range(self.height):
+            for p in range(self.indptr[i], self.indptr[i + 1]):
+                if self.values[p] != 0:
+                    indices.append(self.indices[p])
+                    values.append(self.values[p])
+            indptr.append(len(values))
+        self._set_arrays(indptr, indices, values, self.height, self.width)
+        return self
+
+    @classmethod
+    def from_matrix(cls, matrix: Matrix) -> "CSRMatrix":
+        """
+        Creates a sparse matrix from a dense one.
+
+        Parameters:
+        -----------
+        matrix : Matrix
+            The dense matrix.
+
+        Returns:
+        --------
+        CSRMatrix
+            The sparse matrix with the same elements.
+        """
+        indptr = array("q", [0])
+        indices = array("q")
+        values = array("d")
+        for i in range(matrix.height):
+            for j, value in enumerate(matrix._row(i)):
+                if value != 0:
+                    indices.append(j)
+                    values.append(value)
+            indptr.append(len(values))
+        return cls._from_arrays(indptr, indices, values, matrix.height, matrix.width)
+
+    def to_matrix(self) -> Matrix:
+        """
+        Converts the matrix to a dense `Matrix`.
+
+        Returns:
+        --------
+        Matrix
+            The dense matrix with the same elements.
+        """
+        data = array("d", bytes(8 * self.height * self.width))
+        for i in range(self.height):
+            start = i * self.width
+            for p in range(self.indptr[i], self.indptr[i + 1]):
+                data[start + self.indices[p]] = self.values[p]
+        return Matrix._from_array(data, self.height, self.width)
+
+    def to_coo(self) -> COOMatrix:
+        """
+        Converts the matrix to the COO format.
+
+        Returns:
+        --------
+        COOMatrix
+            The same matrix in the COO format.
+        """
+        coo = COOMatrix(self.height, self.width)
+        for i in range(self.height):
+            count = self.indptr[i + 1] - self.indptr[i]
+            coo.rows.extend([i] * count)
+        coo.columns = array("q", self.indices)
+        coo.values = array("d", self.values)
+        return coo
+
+    @property
+    def nnz(self) -> int:
+        """
+        The number of stored (non-zero) elements.
+        """
+        return len(self.values)
+
+    @property
+    def content(self) -> List[List[float]]:
+        """
+        The matrix as a dense two-dimensional list.
+        """
+        return self.to_matrix().content
+
+    def __getitem__(self, index: Tuple[int, int]) -> float:
+        """
+        Returns the element at the given position (binary search inside the row).
+
+        Parameters:
+        -----------
+        index : Tuple[int, int]
+            The row and the column of the element.
+
+        Returns:
+        --------
+        float
+            The element of the matrix.
+        """
+        i, j = index
+        if not (0 <= i < self.height and 0 <= j < self.width):
+            raise IndexError("Matrix index out of range")
+        start = self.indptr[i]
+        end = self.indptr[i + 1]
+        p = bisect_left(self.indices, j, start, end)
+        if p < end and self.indices[p] == j:
+            return self.values[p]
+        return 0.0
+
+    def __add__(self, other: "CSRMatrix") -> "CSRMatrix":
+        """
+        Adds two sparse matrices by merging their rows.
+
+        Parameters:
+        -----------
+        other : CSRMatrix
+            The second matrix to be added.
+
+        Returns:
+        --------
+        CSRMatrix
+            A new sparse matrix representing the sum.
+
+        Exceptions:
+        -----------
+        Exception
+            If the sizes of the two matrices do not match.
+        """
+        if self.width != other.width or self.height != other.height:
+            raise Exception(
+                "In order to find the sum of two matrices they must be the same size"
+            )
+        indptr = array("q", [0])
+        indices = array("q")
+        values = array("d")
+        for i in range(self.height):
+            p, p_end = self.indptr[i], self.indptr[i + 1]
+            q, q_end = other.indptr[i], other.indptr[i + 1]
+            while p < p_end or q < q_end:
+                j_self = self.indices[p] if p < p_end else self.width
+                j_other = other.indices[q] if q < q_end else self.width
+                if j_self == j_other:
+                    value = self.values[p] + other.values[q]
+                    p += 1
+                    q += 1
+                elif j_self < j_other:
+                    value = self.values[p]
+                    p += 1
+                else:
+                    value = other.values[q]
+                    q += 1
+                if value != 0:
+                    indices.append(min(j_self, j_other))
+                    values.append(value)
+            indptr.append(len(values))
+        return CSRMatrix._from_arrays(indptr, indices, values, self.height, self.width)
+
+    def __mul__(self, other: Any) -> Any:
+        """
+        Multiplies the matrix by a sparse or a dense matrix.
+
+        The sparse product is computed row by row (Gustavson's algorithm), touching
+        only the pairs of non-zero elements that contribute to the result.
+
+        Parameters:
+        -----------
+        other : Union[CSRMatrix, Matrix]
+            The second matrix to multiply with the current matrix.
+
+        Returns:
+        --------
+        Union[CSRMatrix, Matrix]
+            A sparse matrix for a sparse operand and a dense `Matrix` for a dense one.
+
+        Exceptions:
+        -----------
+        Exception
+            If the number of columns in the first matrix does not match the number of rows in the second.
+        """
+        if not isinstance(other, (CSRMatrix, Matrix)):
+            return NotImplemented
+        if self.width != other.height:
+            raise Exception("Matrix dimensions not fit for multiplication")
+        if isinstance(other, Matrix):
+            return self._multiply_dense(other)
+        indptr = array("q", [0])
+        indices = array("q")
+        values = array("d")
+        for i in range(self.height):
+            accumulator: Dict[int, float] = {}
+            for p in range(self.indptr[i], self.indptr[i + 1]):
+                a = self.values[p]
+                k = self.indices[p]
+                for q in range(other.indptr[k], other.indptr[k + 1]):
+                    j = other.indices[q]
+                    accumulator[j] = accumulator.get(j, 0.0) + a * other.values[q]
+            for j in sorted(accumulator):
+                if accumulator[j] != 0:
+                    indices.append(j)
+                    values.append(accumulator[j])
+            indptr.append(len(values))
+        return CSRMatrix._from_arrays(indptr, indices, values, self.height, other.width)
+
+    def _multiply_dense(self, other: Matrix) -> Matrix:
+        """
+        Multiplies the matrix by a dense one: every row of the result is a
+        combination of the rows of `other` selected by the non-zero elements.
+        """
+        width = other.width
+        result = array("d", bytes(8 * self.height * width))
+        other_rows = [other._row(k) for k in range(other.height)]
+        for i in range(self.height):
+            row = [0.0] * width
+            for p in range(self.indptr[i], self.indptr[i + 1]):
+                a = self.values[p]
+                row = list(
+                    map(add, row, map(mul, repeat(a), other_rows[self.indices[p]]))
+                )
+            result[i * width : (i + 1) * width] = array("d", row)
+        return Matrix._from_array(result, self.height, width)
+
+    def __rmul__(self, other: Any) -> Any:
+        """
+        Multiplies a dense matrix by the sparse one.
+
+        The product is computed as ``(self^T * other^T)^T``, so it costs two dense
+        transpositions plus ``other.height * nnz`` multiplications.
+
+        Parameters:
+        -----------
+        other : Matrix
+            The dense left operand.
+
+        Returns:
+        --------
+        Matrix
+            A new dense matrix representing the product.
+
+        Exceptions:
+        -----------
+        Exception
+            If the number of columns in the first matrix does not match the number of rows in the second.
+        """
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        if other.width != self.height:
+            raise Exception("Matrix dimensions not fit for multiplication")
+        return (self.trans() * other.trans()).trans()
+
+    def trans(self) -> "CSRMatrix":
+        """
+        Transposes the matrix with a counting sort of the elements by column.
+
+        Returns:
+        --------
+        CSRMatrix
+            A new transposed sparse matrix.
+        """
+        counts = [0] * (self.width + 1)
+        for j in self.indices:
+            counts[j + 1] += 1
+        for j in range(self.width):
+            counts[j + 1] += counts[j]
+        indptr = array("q", counts)
+        indices = array("q", bytes(8 * self.nnz))
+        values = array("d", bytes(8 * self.nnz))
+        position = counts[:-1]
+        for i in range(self.height):
+            for p in range(self.indptr[i], self.indptr[i + 1]):
+                j = self.indices[p]
+                indices[position[j]] = i
+                values[position[j]] = self.values[p]
+                position[j] += 1
+        return CSRMatrix._from_arrays(indptr, indices, values, self.width, self.height)
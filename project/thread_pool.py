@@ -1,126 +1,564 @@
+import multiprocessing
+import pickle
+import queue
+import sys
 import threading
-from typing import Callable, Any, List, Dict, Optional
+import time
+from array import array
+from collections import deque
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Any, Deque, Iterable, Iterator, List, Dict, Optional, Tuple
 
+# the number of the latest scaling decisions kept by a ThreadPool for `get_stats`
+STATS_EVENTS = 64
 
-class PoolThread(threading.Thread):
+
+class Future:
     """
-    A worker thread that belongs to a thread pool. The thread runs a task when assigned and
-    frees itself back to the pool upon task completion.
+    A handle to the result of a task enqueued into a thread pool. The result (or the
+    exception raised by the task) is stored in the handle when the task finishes.
     """
 
-    def __init__(
+    def __init__(self) -> None:
+        """
+        Initialize an unfinished Future.
+        """
+        self._condition: threading.Condition = threading.Condition()
+        self._done: bool = False
+        self._result: Any = None
+        self._exception: Optional[BaseException] = None
+        self._callbacks: List[Callable[["Future"], Any]] = []
+
+    def _finish(
+        self, result: Any = None, exception: Optional[BaseException] = None
+    ) -> None:
+        """
+        Store the outcome of the task, wake up the waiting threads and run the callbacks.
+
+        :param result: The value returned by the task.
+        :param exception: The exception raised by the task, if any.
+        """
+        with self._condition:
+            self._result = result
+            self._exception = exception
+            self._done = True
+            self._condition.notify_all()
+            callbacks = self._callbacks
+            self._callbacks = []
+        for callback in callbacks:
+            self._run_callback(callback)
+
+    def _run_callback(self, callback: Callable[["Future"], Any]) -> None:
+        """
+        Run a completion callback, reporting its exception instead of propagating it.
+
+        :param callback: The callback to run.
+        """
+        try:
+            callback(self)
+        except Exception:
+            threading.excepthook(
+                threading.ExceptHookArgs((*sys.exc_info(), threading.current_thread()))
+            )
+
+    def _wait(self, timeout: Optional[float]) -> None:
+        """
+        Wait for the task to finish. A worker of a work-stealing pool runs other tasks of
+        its pool while waiting (see `ThreadPool`), so a task may wait for its subtasks
+        without blocking a worker.
+
+        :param timeout: The maximum time to wait in seconds, None to wait without a limit.
+        :raises TimeoutError: If the task did not finish in time.
+        """
+        if not self._done:
+            thread = threading.current_thread()
+            if isinstance(thread, PoolThread) and thread._pool._work_stealing:
+                deadline = None if timeout is None else time.monotonic() + timeout
+                thread._help(self, deadline)
+                if deadline is not None:
+                    timeout = max(0.0, deadline - time.monotonic())
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._done, timeout):
+                raise TimeoutError("Task did not finish in time")
+
+    def done(self) -> bool:
+        """
+        Check whether the task has finished.
+
+        :return: True if the task returned or raised an exception.
+        """
+        return self._done
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        """
+        Wait for the task to finish and return its result.
+
+        :param timeout: The maximum time to wait in seconds, None to wait without a limit.
+        :return: The value returned by the task.
+        :raises TimeoutError: If the task did not finish in time.
+        :raises Exception: The exception raised by the task.
+        """
+        self._wait(timeout)
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    def exception(self, timeout: Optional[float] = None) -> Optional[BaseException]:
+        """
+        Wait for the task to finish and return the exception it raised.
+
+        :param timeout: The maximum time to wait in seconds, None to wait without a limit.
+        :return: The exception raised by the task, or None if it returned normally.
+        :raises TimeoutError: If the task did not finish in time.
+        """
+        self._wait(timeout)
+        return self._exception
+
+    def add_done_callback(self, callback: Callable[["Future"], Any]) -> None:
+        """
+        Call a function with the Future when the task finishes (immediately if it already has).
+        The callback runs in the thread that finished the task.
+
+        :param callback: The function taking the finished Future.
+        """
+        with self._condition:
+            if not self._done:
+                self._callbacks.append(callback)
+                return
+        self._run_callback(callback)
+
+
+def as_completed(
+    futures: Iterable[Future], timeout: Optional[float] = None
+) -> Iterator[Future]:
+    """
+    Yield the futures as their tasks finish, the finished ones first.
+
+    :param futures: The futures to wait for.
+    :param timeout: The maximum total time to wait in seconds, None to wait without a limit.
+    :return: An iterator over the futures in the order of completion.
+    :raises TimeoutError: If not all tasks finished in time.
+    """
+    pending = set(futures)
+    finished: "queue.Queue[Future]" = queue.Queue()
+    for future in pending:
+        future.add_done_callback(finished.put)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    for left in range(len(pending), 0, -1):
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        try:
+            yield finished.get(timeout=remaining)
+        except queue.Empty:
+            raise TimeoutError(f"{left} tasks did not finish in time") from None
+
+
+class _TaskQueue:
+    """
+    The FIFO queue of pending tasks shared by the workers of a pool.
+
+    The tasks are kept in a ``collections.deque``, whose ``append`` and ``popleft`` are O(1)
+    and atomic, so the queue itself needs no lock to put or take a task: consumers take
+    the condition only to sleep while the queue is empty, and a producer notifies it only
+    if some consumer is waiting. The pool still puts tasks under its own lock (see
+    `ThreadPool.enqueue`), but a worker taking a task never needs that lock.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty queue.
+        """
+        self._items: Deque[Any] = deque()
+        self._condition: threading.Condition = threading.Condition(threading.Lock())
+        self.waiting: int = 0
+
+    def __len__(self) -> int:
+        """
+        Return the number of tasks waiting for a worker.
+
+        :return: The number of queued tasks.
+        """
+        return len(self._items)
+
+    def put(self, item: Any) -> None:
+        """
+        Append an item to the end of the queue and wake up one waiting consumer.
+
+        :param item: The item to append.
+        """
+        self._items.append(item)
+        if self.waiting:
+            with self._condition:
+                self._condition.notify()
+
+    def wake(self) -> None:
+        """
+        Wake up one waiting consumer, e.g. after a task was put somewhere it can steal from.
+        """
+        if self.waiting:
+            with self._condition:
+                self._condition.notify()
+
+    def oldest(self) -> Any:
+        """
+        Return the item at the front of the queue without removing it.
+
+        :return: The item, or None if the queue is empty.
+        """
+        try:
+            return self._items[0]
+        except IndexError:
+            return None
+
+    def get(
         self,
-        pool: "ThreadPool",
-        number: int,
-        target: Optional[Callable[..., Any]] = None,
-        args: tuple = (),
-        kwargs: dict = {},
-    ):
+        block: bool = True,
+        steal: Optional[Callable[[], Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
         """
-        Initialize the PoolThread with a thread pool, thread number, and an optional task.
+        Remove and return the item from the front of the queue.
+
+        :param block: Whether to wait for an item if the queue is empty.
+        :param steal: A function returning an item found elsewhere (or None) that is tried
+            whenever the queue is empty; a producer of such items has to call `wake`.
+        :param timeout: The maximum time to wait in seconds, None to wait without a limit.
+        :return: The item.
+        :raises queue.Empty: If the queue is empty (and nothing was stolen) and `block`
+            is False or the timeout expired.
+        """
+        try:
+            return self._items.popleft()
+        except IndexError:
+            item = None if steal is None else steal()
+            if item is not None:
+                return item
+            if not block:
+                raise queue.Empty from None
+        with self._condition:
+            # the consumer is counted before the queue is checked again, so an item put
+            # after the check is always followed by a notification
+            self.waiting += 1
+            deadline = None if timeout is None else time.monotonic() + timeout
+            try:
+                while True:
+                    try:
+                        return self._items.popleft()
+                    except IndexError:
+                        item = None if steal is None else steal()
+                        if item is not None:
+                            return item
+                        if deadline is None:
+                            self._condition.wait()
+                            continue
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise queue.Empty from None
+                        self._condition.wait(remaining)
+            finally:
+                self.waiting -= 1
+
+
+class PoolThread(threading.Thread):
+    """
+    A long-lived worker thread that belongs to a thread pool. The thread takes tasks from
+    the task queue of the pool one by one and blocks on the queue while there are none.
+    If the pool has a keepalive timeout, the thread retires after being idle that long.
+    """
+
+    def __init__(self, pool: "ThreadPool", number: int):
+        """
+        Initialize the PoolThread with a thread pool and a thread number.
 
         :param pool: The thread pool managing this thread.
         :param number: The index number of this thread in the pool.
-        :param target: The task (function) for the thread to execute.
-        :param args: The arguments to pass to the task.
-        :param kwargs: The keyword arguments to pass to the task.
-        """
-        super().__init__()
-        self._target: Optional[Callable[..., Any]] = target
-        self._args: tuple = args
-        self._kwargs: dict = kwargs
+        """
+        super().__init__(daemon=True)
         self._pool: "ThreadPool" = pool
         self._thread_number: int = number
+        self._task_queue: _TaskQueue = pool._task_queue
+        self._local: Deque[Dict[str, Any]] = deque()
+        self._workers: List[PoolThread] = pool._threads
+        self._steal: Optional[Callable[[], Optional[Dict[str, Any]]]] = (
+            self._steal_task if pool._work_stealing else None
+        )
+        self.busy: bool = True
 
-    def set_task(
-        self,
-        target: Optional[Callable[..., Any]] = None,
-        args: tuple = (),
-        kwargs: dict = {},
-    ) -> None:
+    def _steal_task(self) -> Optional[Dict[str, Any]]:
         """
-        Set the task (function) for the thread to execute.
+        Take the newest task from the own deque, or the oldest task from the deque of
+        another worker (work-stealing mode).
 
-        :param target: The task (function) to run.
-        :param args: The arguments to pass to the task.
-        :param kwargs: The keyword arguments to pass to the task.
+        :return: The task, or None if all deques are empty.
         """
-        self._target = target
-        self._args = args
-        self._kwargs = kwargs
+        try:
+            return self._local.pop()
+        except IndexError:
+            pass
+        for thread in self._workers:
+            if thread is self:
+                continue
+            try:
+                return thread._local.popleft()
+            except IndexError:
+                continue
+        return None
 
-    def run(self) -> None:
+    def _next_task(self) -> Optional[Dict[str, Any]]:
+        """
+        Take the next task from the queue (or from the deques of the workers in the
+        work-stealing mode), waiting for one if there is none.
+
+        :return: The task, or None if the thread has to stop.
+        """
+        if self._steal is not None:
+            task = self._steal()
+            if task is not None:
+                return task
+        try:
+            return self._task_queue.get(block=False, steal=self._steal)
+        except queue.Empty:
+            self.busy = False
+        while True:
+            try:
+                task = self._task_queue.get(
+                    steal=self._steal, timeout=self._pool._keepalive
+                )
+                break
+            except queue.Empty:
+                if self._pool._retire(self):
+                    return None
+        self.busy = True
+        return task
+
+    def _execute(self, task: Dict[str, Any]) -> None:
         """
-        Run the assigned task, then free the thread back to the pool.
+        Run a task and store its outcome in its Future. Any exception, including
+        ``SystemExit`` and ``KeyboardInterrupt``, goes to the Future and the worker keeps
+        running.
+
+        :param task: The task to run.
         """
         try:
-            if self._target is not None:
-                self._target(*self._args, **self._kwargs)
+            result = task["func"](*task["args"], **task["kwargs"])
+        except BaseException as error:
+            task["future"]._finish(exception=error)
+        else:
+            task["future"]._finish(result)
         finally:
-            self._pool.free_thread(self._thread_number)
+            self._pool._task_finished()
+
+    def _help(self, future: Future, deadline: Optional[float]) -> None:
+        """
+        Run the tasks of the pool until the future is done, there are no tasks left
+        to run or the deadline has passed (work-stealing mode).
+
+        :param future: The future the thread is waiting for.
+        :param deadline: The ``time.monotonic()`` value to stop at, None for no limit.
+        """
+        while not future.done() and (deadline is None or time.monotonic() < deadline):
+            try:
+                task = self._task_queue.get(block=False, steal=self._steal)
+            except queue.Empty:
+                return
+            self._execute(task)
+
+    def run(self) -> None:
+        """
+        Run the tasks from the queue until the pool stops the thread.
+        """
+        while True:
+            task = self._next_task()
+            if task is None:
+                break
+            self._execute(task)
 
 
 class ThreadPool:
     """
     A thread pool that manages a set of worker threads, which can execute tasks concurrently.
     Tasks can be enqueued, and the pool will manage their execution.
+
+    The workers are started lazily (one per enqueued task while no started worker is idle,
+    up to the thread count) and then stay alive, taking tasks from a FIFO queue, so a task
+    costs a queue handoff instead of a thread start.
+
+    In the work-stealing mode every worker also owns a deque. Tasks enqueued by a worker
+    go to its own deque, which it runs newest first, while idle workers steal the oldest
+    tasks from the deques of the others, so subtasks of recursive (fork/join) workloads
+    do not contend on the shared queue. A worker waiting for a Future runs other tasks
+    meanwhile, so a task can wait for its own subtasks without deadlocking the pool.
+
+    The number of running workers is elastic between `min_threads` and the thread count.
+    A worker is started when the number of queued tasks nobody is waiting for reaches
+    `spawn_threshold`, or when the oldest queued task has waited longer than `max_wait`
+    (watched by a monitor thread, so this also happens while every worker is busy and
+    nothing is enqueued). With a `keepalive` timeout a worker idle for that long retires (down to `min_threads`),
+    so a bursty load keeps only the workers it needs. The decisions are reported by
+    `get_stats`.
     """
 
-    def __init__(self, thread_count: int):
+    def __init__(
+        self,
+        thread_count: int,
+        work_stealing: bool = False,
+        min_threads: int = 0,
+        keepalive: Optional[float] = None,
+        spawn_threshold: int = 1,
+        max_wait: Optional[float] = None,
+    ):
         """
         Initialize the ThreadPool with a set number of threads.
 
-        :param thread_count: The number of threads in the pool.
+        :param thread_count: The number of threads in the pool (the maximum number
+            of running workers).
+        :param work_stealing: Whether tasks enqueued by workers go to per-worker deques.
+        :param min_threads: The number of workers that never retire.
+        :param keepalive: The idle time in seconds after which a worker retires, None to keep
+            the workers alive until the pool is disposed.
+        :param spawn_threshold: The number of queued tasks without a waiting worker that
+            starts another worker.
+        :param max_wait: The time in seconds a task may wait in the queue before another
+            worker is started, None to scale by the queue depth only.
+        :raises ValueError: If the bounds or the timeouts are invalid.
         """
+        if not 0 <= min_threads <= thread_count:
+            raise ValueError("min_threads must be between 0 and thread_count")
+        if spawn_threshold < 1:
+            raise ValueError("spawn_threshold must be positive")
+        if (keepalive is not None and keepalive <= 0) or (
+            max_wait is not None and max_wait < 0
+        ):
+            raise ValueError("keepalive must be positive and max_wait not negative")
         self._thread_count: int = thread_count
-        self._threads: List[PoolThread] = [
-            PoolThread(self, _) for _ in range(self._thread_count)
-        ]
-        self._task_queue: List[Dict[str, Any]] = []
+        self._work_stealing: bool = work_stealing
+        self._min_threads: int = min_threads
+        self._keepalive: Optional[float] = keepalive
+        self._spawn_threshold: int = spawn_threshold
+        self._max_wait: Optional[float] = max_wait
+        self._task_queue: _TaskQueue = _TaskQueue()
+        self._threads: List[PoolThread] = []
+        self._threads.extend(PoolThread(self, _) for _ in range(self._thread_count))
+        self._started: int = 0
+        self._peak: int = 0
+        self._spawned: Dict[str, int] = {"depth": 0, "latency": 0}
+        self._retired: int = 0
+        self._events: Deque[Tuple[float, str, str, int]] = deque(maxlen=STATS_EVENTS)
+        self._unfinished: int = 0
+        self._lock: threading.Lock = threading.Lock()
+        self._all_done: threading.Condition = threading.Condition(self._lock)
         self._disposed: bool = False
+        self._monitor: Optional[threading.Thread] = (
+            None
+            if max_wait is None
+            else threading.Thread(target=self._watch_latency, daemon=True)
+        )
+        self._monitor_wakeup: threading.Condition = threading.Condition(self._lock)
+        self._monitor_idle: bool = False
 
-    def _setup_task(self, func: Callable[..., Any], args: tuple, kwargs: dict) -> bool:
+    def _task_finished(self) -> None:
+        """
+        Count a finished task. After the last active task wake up the threads waiting in
+        `join` and clean up the pool if it was disposed meanwhile.
         """
-        Assign a task to an available thread if one is free.
+        with self._lock:
+            self._unfinished -= 1
+            if self._unfinished == 0:
+                self._all_done.notify_all()
+                if self._disposed:
+                    self._stop_workers()
 
-        :param func: The task (function) to execute.
-        :param args: The arguments for the task.
-        :param kwargs: The keyword arguments for the task.
-        :return: True if a thread was available and the task was assigned, False otherwise.
+    def _spawn(self, reason: str) -> None:
         """
-        for i in range(self._thread_count):
-            if not self._threads[i].is_alive():
-                self._threads[i].set_task(func, args, kwargs)
-                self._threads[i].start()
-                return True
-        return False
+        Start a worker in a free slot and record the decision (called with the lock held).
 
-    def free_thread(self, thread_number: int) -> None:
+        :param reason: "depth" or "latency", the trigger of the decision.
         """
-        Free a thread after it completes its task and assign a new task if one is available in the queue.
+        for thread in self._threads:
+            if thread.ident is None:
+                thread.start()
+                break
+        self._started += 1
+        self._peak = max(self._peak, self._started)
+        self._spawned[reason] += 1
+        self._events.append((time.monotonic(), "spawn", reason, self._started))
 
-        :param thread_number: The index number of the thread that finished its task.
+    def _watch_latency(self) -> None:
         """
-        self._threads[thread_number] = PoolThread(self, thread_number)
-        if len(self._task_queue) > 0:
-            next_task = self._task_queue.pop()
-            self._threads[thread_number].set_task(
-                next_task["func"],
-                next_task["args"],
-                next_task["kwargs"],
-            )
-            self._threads[thread_number].start()
-        elif self._disposed and not self._has_active_tasks():
-            self._die()
+        The loop of the monitor thread: sleep until the oldest queued task has waited
+        `max_wait`, then start a worker if no idle one is about to take the task. While
+        nothing is queued or the pool is full, sleep until `enqueue` or `_retire` wakes
+        the monitor up. The loop ends when the pool is disposed.
+        """
+        max_wait = self._max_wait
+        assert max_wait is not None
+        with self._lock:
+            while not self._disposed:
+                oldest = self._task_queue.oldest()
+                if oldest is None or self._started >= self._thread_count:
+                    self._monitor_idle = True
+                    self._monitor_wakeup.wait()
+                    self._monitor_idle = False
+                    continue
+                age = time.monotonic() - oldest["enqueued"]
+                if age < max_wait:
+                    self._monitor_wakeup.wait(max_wait - age)
+                    continue
+                if len(self._task_queue) > self._task_queue.waiting:
+                    self._spawn("latency")
+                # the task is taken soon, by the new worker or by an idle one
+                self._monitor_wakeup.wait(max_wait)
+
+    def _wake_monitor(self) -> None:
+        """
+        Wake up the idle monitor thread (called with the lock held).
+        """
+        if self._monitor_idle:
+            self._monitor_wakeup.notify()
+
+    def _retire(self, thread: PoolThread) -> bool:
+        """
+        Decide whether an idle worker retires after the keepalive timeout. The slot of
+        a retiring worker gets a new thread, so it can be started again.
+
+        :param thread: The idle worker.
+        :return: True if the worker has to stop.
+        """
+        with self._lock:
+            if (
+                self._disposed
+                or self._started <= self._min_threads
+                or len(self._task_queue) > 0
+            ):
+                return False
+            self._started -= 1
+            self._retired += 1
+            self._events.append((time.monotonic(), "retire", "idle", self._started))
+            self._wake_monitor()
+            number = thread._thread_number
+            self._threads[number] = PoolThread(self, number)
+            return True
 
     def _die(self) -> None:
         """
-        Clean up all resources and clear the thread pool when it is disposed.
+        Mark the pool as disposed and clean it up if there are no active tasks.
+        """
+        with self._lock:
+            self._disposed = True
+            self._monitor_wakeup.notify()
+            if self._unfinished == 0:
+                self._stop_workers()
+
+    def _stop_workers(self) -> None:
+        """
+        Stop the started workers and clean up all resources (called with the lock held).
         """
-        self._threads.clear()
-        self._task_queue.clear()
-        del self._threads
-        del self._task_queue
+        if hasattr(self, "_threads"):
+            for _ in range(self._started):
+                self._task_queue.put(None)
+            self._threads.clear()
+            del self._threads
+            del self._task_queue
 
     def get_threads_amount(self) -> int:
         """
@@ -130,42 +568,143 @@ class ThreadPool:
         """
         return len(self._threads)
 
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get the state of the pool and its scaling decisions.
+
+        :return: A dictionary with the number of running workers ("threads"), the bounds
+            ("min_threads", "max_threads"), the most workers running at once ("peak_threads"),
+            the idle workers ("idle"), the queued and unfinished tasks ("queued", "active"),
+            the number of started workers by trigger ("spawned": {"depth", "latency"}),
+            the number of retired workers ("retired") and the latest decisions ("events":
+            ``(time.monotonic(), "spawn" or "retire", reason, running workers)`` tuples).
+        """
+        with self._lock:
+            task_queue = getattr(self, "_task_queue", None)
+            return {
+                "threads": self._started if task_queue is not None else 0,
+                "min_threads": self._min_threads,
+                "max_threads": self._thread_count,
+                "peak_threads": self._peak,
+                "idle": 0 if task_queue is None else task_queue.waiting,
+                "queued": 0 if task_queue is None else len(task_queue),
+                "active": self._unfinished,
+                "spawned": dict(self._spawned),
+                "retired": self._retired,
+                "events": list(self._events),
+            }
+
     def _has_active_tasks(self) -> bool:
         """
-        Check if there are any threads currently working on a task.
+        Check if there are any tasks that are queued or being executed.
 
         :return: True if there are active tasks, False otherwise.
         """
-        return any(thread.is_alive() for thread in self._threads)
+        return self._unfinished > 0
 
-    def dispose(self) -> None:
+    def dispose(self, wait: bool = False) -> None:
         """
         Mark the thread pool for disposal. If there are no active tasks or tasks in the queue,
-        the pool will be cleaned up.
+        the pool will be cleaned up, otherwise it is cleaned up by the worker finishing
+        the last task.
+
+        :param wait: Whether to block until the remaining tasks are finished.
         """
-        self._disposed = True
-        if not self._has_active_tasks() and len(self._task_queue) == 0:
-            self._die()
+        self._die()
+        if wait:
+            self.join()
 
     def enqueue(
         self,
         func: Optional[Callable[..., Any]] = None,
         args: list = [],
         kwargs: dict = {},
-    ) -> None:
+    ) -> Future:
         """
-        Enqueue a task to be executed by a thread. If no thread is available, the task is added to a queue.
+        Enqueue a task to be executed by a thread. The task is handed to an idle worker,
+        or a new worker is started if there is none and the pool is not full; otherwise
+        the task waits in the queue (or in the deque of the enqueuing worker in the
+        work-stealing mode).
+
+        The task is counted and put under the pool lock, which is also taken by a worker
+        after every finished task, so the check against a concurrent `dispose`, the count
+        `join` waits for and the decision to start a worker stay consistent.
 
         :param func: The task (function) to execute.
         :param args: The arguments for the task.
         :param kwargs: The keyword arguments for the task.
+        :return: The Future receiving the result of the task.
         """
-        if self._disposed:
-            raise Exception("Cannot use disposed thread pool")
         if func is None:
             raise ValueError("Task function cannot be None")
-        if not self._setup_task(func, tuple(args), kwargs):
-            self._task_queue.append({"func": func, "args": args, "kwargs": kwargs})
+        with self._lock:
+            if self._disposed:
+                raise Exception("Cannot use disposed thread pool")
+            future = Future()
+            task = {
+                "func": func,
+                "args": tuple(args),
+                "kwargs": kwargs,
+                "future": future,
+                "enqueued": time.monotonic(),
+            }
+            self._unfinished += 1
+            worker = threading.current_thread()
+            if (
+                self._work_stealing
+                and isinstance(worker, PoolThread)
+                and worker._pool is self
+            ):
+                worker._local.append(task)
+                self._task_queue.wake()
+                backlog = int(self._task_queue.waiting == 0)
+            else:
+                self._task_queue.put(task)
+                backlog = len(self._task_queue) - self._task_queue.waiting
+            if backlog > 0 and self._started < self._thread_count:
+                if backlog >= self._spawn_threshold or self._started == 0:
+                    self._spawn("depth")
+            if self._monitor is not None:
+                if self._monitor.ident is None:
+                    self._monitor.start()
+                self._wake_monitor()
+        return future
+
+    def map(
+        self,
+        func: Callable[[Any], Any],
+        iterable: Iterable[Any],
+        timeout: Optional[float] = None,
+    ) -> Iterator[Any]:
+        """
+        Enqueue the function for every item right away and return an iterator over the results
+        in the order of the items, each yielded as soon as it (and the preceding ones) is ready.
+
+        :param func: The function of one argument.
+        :param iterable: The arguments.
+        :param timeout: The maximum total time to wait in seconds, None to wait without a limit.
+        :return: An iterator over the results.
+        :raises TimeoutError: If a result is not ready in time.
+        :raises Exception: The exception raised by the function for an item.
+        """
+        futures = [self.enqueue(func, args=[item]) for item in iterable]
+        return self._results(futures, timeout)
+
+    @staticmethod
+    def _results(futures: List[Future], timeout: Optional[float]) -> Iterator[Any]:
+        """
+        Yield the results of the futures in their order (see `map`).
+
+        :param futures: The futures of the enqueued tasks.
+        :param timeout: The maximum total time to wait in seconds, None to wait without a limit.
+        :return: An iterator over the results.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for future in futures:
+            if deadline is None:
+                yield future.result()
+            else:
+                yield future.result(max(0.0, deadline - time.monotonic()))
 
     def __str__(self) -> str:
         """
@@ -175,15 +714,439 @@ class ThreadPool:
         """
         log = ""
         for i in range(self._thread_count):
-            status = "working" if self._threads[i].is_alive() else "waiting"
+            thread = self._threads[i]
+            status = "working" if thread.is_alive() and thread.busy else "waiting"
             log += f"Thread {i + 1} in state {status}"
             if i != self._thread_count - 1:
                 log += "\n"
         return log
 
-    def join(self) -> None:
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for all active tasks to complete before exiting. The caller sleeps on a condition
+        variable notified by the worker finishing the last task, so waiting takes no CPU time.
+
+        :param timeout: The maximum time to wait in seconds, None to wait without a limit.
+        :return: True if all tasks are finished, False if the timeout expired first.
+        """
+        with self._all_done:
+            return self._all_done.wait_for(lambda: self._unfinished == 0, timeout)
+
+
+class SharedBuffer:
+    """
+    A typed array placed into shared memory, so it is passed to worker processes by name
+    instead of being pickled and sent through a pipe.
+
+    Pass a SharedBuffer in the arguments of a `ProcessPool` task to let the task read the
+    data without copying it (`view`). The process that created the buffer owns it and
+    frees the shared memory in `close`.
+    """
+
+    def __init__(self, data: array) -> None:
+        """
+        Copy an array into a new block of shared memory.
+
+        :param data: The array to share.
+        """
+        self.typecode: str = data.typecode
+        self.length: int = len(data)
+        self._auto: bool = False
+        self._owner: bool = True
+        self._memory: SharedMemory = SharedMemory(create=True, size=max(1, self.nbytes))
+        self._data()[:] = memoryview(data).cast("B")
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The size of the data in bytes.
+        """
+        return self.length * array(self.typecode).itemsize
+
+    @classmethod
+    def _attach(
+        cls, name: str, typecode: str, length: int, auto: bool
+    ) -> "SharedBuffer":
+        """
+        Attach to a block of shared memory created by another process (used by pickle).
+        """
+        buffer = cls.__new__(cls)
+        buffer.typecode = typecode
+        buffer.length = length
+        buffer._auto = auto
+        buffer._owner = False
+        buffer._memory = SharedMemory(name=name)
+        _attached_buffers.append(buffer)
+        return buffer
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """
+        Pickle the buffer as the name of its shared memory.
+        """
+        return (
+            SharedBuffer._attach,
+            (self._memory.name, self.typecode, self.length, self._auto),
+        )
+
+    def view(self) -> memoryview:
+        """
+        Return a memoryview of the data in shared memory (no copy). The view has to be
+        released before the buffer is closed.
+
+        :return: The memoryview with the format of the array.
+        """
+        return self._data().cast(self.typecode)  # type: ignore[call-overload]
+
+    def to_array(self) -> array:
+        """
+        Copy the data into a new array.
+
+        :return: The array.
+        """
+        result = array(self.typecode)
+        result.frombytes(self._data())
+        return result
+
+    def _data(self) -> memoryview:
         """
-        Wait for all active tasks to complete before exiting.
+        Return the bytes of the data in shared memory.
         """
-        while self._has_active_tasks():
+        buffer = self._memory.buf
+        assert buffer is not None
+        return buffer[: self.nbytes]
+
+    def close(self) -> None:
+        """
+        Detach from the shared memory, and free it if this process created the buffer.
+        """
+        self._memory.close()
+        if self._owner:
+            self._memory.unlink()
+
+
+# the buffers attached while unpickling the current batch of a worker process
+_attached_buffers: List[SharedBuffer] = []
+
+
+def _unshare(value: Any) -> Any:
+    """
+    Replace a buffer shared automatically by `ProcessPool.enqueue` with an array copy.
+    """
+    if isinstance(value, SharedBuffer) and value._auto:
+        return value.to_array()
+    return value
+
+
+def _run_batch(payload: bytes) -> bytes:
+    """
+    Run a pickled batch of tasks in a worker process and return the pickled outcomes.
+
+    :param payload: A pickled list of ``(task_id, func, args, kwargs)``.
+    :return: A pickled list of ``(task_id, result, exception)``.
+    """
+    batch = pickle.loads(payload)
+    outcomes = []
+    outcome: Tuple[int, Any, Optional[BaseException]]
+    for task_id, func, args, kwargs in batch:
+        try:
+            result = func(
+                *map(_unshare, args),
+                **{key: _unshare(value) for key, value in kwargs.items()},
+            )
+            outcome = (task_id, result, None)
+        except BaseException as error:
+            outcome = (task_id, None, error)
+        try:
+            pickle.dumps(outcome)
+        except Exception as error:
+            outcome = (
+                task_id,
+                None,
+                Exception(f"Task outcome is not picklable: {error!r}"),
+            )
+        outcomes.append(outcome)
+    for buffer in _attached_buffers:
+        try:
+            buffer.close()
+        except BufferError:
             pass
+    _attached_buffers.clear()
+    return pickle.dumps(outcomes)
+
+
+def _process_worker(tasks: Any, results: Any) -> None:
+    """
+    The main loop of a worker process: run batches of tasks until None is received, then
+    report the exit with None.
+
+    :param tasks: The queue of pickled batches.
+    :param results: The queue of pickled outcomes.
+    """
+    while True:
+        payload = tasks.get()
+        if payload is None:
+            break
+        results.put(_run_batch(payload))
+    results.put(None)
+
+
+class ProcessPool:
+    """
+    A pool of persistent worker processes with the API of `ThreadPool` (`enqueue` returning
+    a `Future`, `map`, `join`, `dispose`), for CPU-bound tasks that gain nothing from threads
+    because of the GIL. Tasks and their results have to be picklable.
+
+    The processes are started with the first task and then stay alive. Tasks are sent in
+    batches: while every process is busy, enqueued tasks are collected (up to the batch size)
+    and pickled together, so pickling and pipe transfers are amortized over the batch. Arrays
+    of at least `share_threshold` bytes in the arguments are passed through shared memory;
+    use `SharedBuffer` explicitly to let tasks read a buffer without copying it at all.
+    """
+
+    def __init__(
+        self, process_count: int, batch_size: int = 16, share_threshold: int = 1 << 16
+    ):
+        """
+        Initialize the ProcessPool with a set number of processes.
+
+        :param process_count: The number of processes in the pool.
+        :param batch_size: The maximum number of tasks sent to a process at once.
+        :param share_threshold: The size in bytes from which array arguments are passed
+            through shared memory.
+        """
+        self._process_count: int = process_count
+        self._batch_size: int = batch_size
+        self._share_threshold: int = share_threshold
+        context = multiprocessing.get_context()
+        self._tasks: Any = context.Queue()
+        self._results: Any = context.Queue()
+        self._processes: List[Any] = [
+            context.Process(
+                target=_process_worker, args=(self._tasks, self._results), daemon=True
+            )
+            for _ in range(process_count)
+        ]
+        self._collector: threading.Thread = threading.Thread(
+            target=self._collect, daemon=True
+        )
+        self._started: bool = False
+        self._batch: List[Tuple[int, Callable[..., Any], tuple, dict]] = []
+        self._pending: Dict[int, Tuple[Future, List[SharedBuffer]]] = {}
+        self._next_id: int = 0
+        self._sent: int = 0
+        self._unfinished: int = 0
+        self._lock: threading.Lock = threading.Lock()
+        self._all_done: threading.Condition = threading.Condition(self._lock)
+        self._disposed: bool = False
+        self._stopped: bool = False
+
+    def get_processes_amount(self) -> int:
+        """
+        Get the number of processes in the pool.
+
+        :return: The number of processes.
+        """
+        return self._process_count
+
+    def _share(self, value: Any, buffers: List[SharedBuffer]) -> Any:
+        """
+        Replace a large array with a buffer in shared memory.
+
+        :param value: An argument of a task.
+        :param buffers: The list collecting the buffers created for the task.
+        :return: The argument to pickle.
+        """
+        if (
+            isinstance(value, array)
+            and len(value) * value.itemsize >= self._share_threshold
+        ):
+            buffer = SharedBuffer(value)
+            buffer._auto = True
+            buffers.append(buffer)
+            return buffer
+        return value
+
+    def _flush(self) -> List[Tuple[Future, Any, Optional[BaseException]]]:
+        """
+        Pickle the collected tasks and send them to the processes as one batch (called with
+        the lock held). Tasks that cannot be pickled fail with the pickling error.
+
+        :return: The outcomes of the failed tasks, to be passed to `_complete`.
+        """
+        batch, self._batch = self._batch, []
+        failed = []
+        try:
+            payload = pickle.dumps(batch)
+        except Exception:
+            picklable = []
+            for task in batch:
+                try:
+                    pickle.dumps(task)
+                    picklable.append(task)
+                except Exception as error:
+                    failed.append(self._pop(task[0], None, error))
+            if not picklable:
+                return failed
+            payload = pickle.dumps(picklable)
+        self._tasks.put(payload)
+        self._sent += 1
+        return failed
+
+    def _pop(
+        self, task_id: int, result: Any, error: Optional[BaseException]
+    ) -> Tuple[Future, Any, Optional[BaseException]]:
+        """
+        Remove a finished task and free its shared buffers (called with the lock held).
+
+        :return: The Future of the task with its outcome.
+        """
+        future, buffers = self._pending.pop(task_id)
+        for buffer in buffers:
+            buffer.close()
+        return future, result, error
+
+    def _complete(
+        self, outcomes: List[Tuple[Future, Any, Optional[BaseException]]]
+    ) -> None:
+        """
+        Complete the futures of finished tasks (called without the lock, so done-callbacks
+        can use the pool), then count the tasks as finished. After the last active task wake
+        up the threads waiting in `join` and stop the processes if the pool was disposed.
+
+        :param outcomes: The futures with the outcomes of their tasks.
+        """
+        if not outcomes:
+            return
+        for future, result, error in outcomes:
+            future._finish(result, error)
+        with self._lock:
+            self._unfinished -= len(outcomes)
+            if self._unfinished == 0:
+                self._all_done.notify_all()
+                if self._disposed:
+                    self._stop()
+
+    def _collect(self) -> None:
+        """
+        Receive the outcomes of the batches, complete the futures and send the collected
+        tasks to the process that has become free.
+        """
+        running = len(self._processes)
+        while running:
+            payload = self._results.get()
+            if payload is None:
+                running -= 1
+                continue
+            with self._lock:
+                outcomes = [
+                    self._pop(task_id, result, error)
+                    for task_id, result, error in pickle.loads(payload)
+                ]
+                self._sent -= 1
+                if self._batch:
+                    outcomes.extend(self._flush())
+            self._complete(outcomes)
+        for process in self._processes:
+            process.join()
+
+    def _stop(self) -> None:
+        """
+        Stop the processes and the collector thread (called with the lock held).
+        """
+        if self._stopped:
+            return
+        self._stopped = True
+        if not self._started:
+            return
+        for _ in self._processes:
+            self._tasks.put(None)
+
+    def enqueue(
+        self,
+        func: Optional[Callable[..., Any]] = None,
+        args: list = [],
+        kwargs: dict = {},
+    ) -> Future:
+        """
+        Enqueue a task to be executed by a process. The task is sent right away if some process
+        is idle, otherwise it is sent in a batch with the following tasks.
+
+        :param func: The task (a picklable function) to execute.
+        :param args: The arguments for the task.
+        :param kwargs: The keyword arguments for the task.
+        :return: The Future receiving the result of the task.
+        """
+        if func is None:
+            raise ValueError("Task function cannot be None")
+        with self._lock:
+            if self._disposed:
+                raise Exception("Cannot use disposed process pool")
+            if not self._started:
+                # the processes have to share the tracker of the shared memory with this
+                # process, otherwise their own trackers would unlink it when they exit
+                resource_tracker.ensure_running()
+                for process in self._processes:
+                    process.start()
+                self._collector.start()
+                self._started = True
+            buffers: List[SharedBuffer] = []
+            task_id = self._next_id
+            self._next_id += 1
+            self._batch.append(
+                (
+                    task_id,
+                    func,
+                    tuple(self._share(value, buffers) for value in args),
+                    {key: self._share(value, buffers) for key, value in kwargs.items()},
+                )
+            )
+            future = Future()
+            self._pending[task_id] = (future, buffers)
+            self._unfinished += 1
+            failed = []
+            if self._sent < self._process_count or len(self._batch) >= self._batch_size:
+                failed = self._flush()
+        self._complete(failed)
+        return future
+
+    def map(
+        self,
+        func: Callable[[Any], Any],
+        iterable: Iterable[Any],
+        timeout: Optional[float] = None,
+    ) -> Iterator[Any]:
+        """
+        Enqueue the function for every item right away and return an iterator over the results
+        in the order of the items (see `ThreadPool.map`).
+
+        :param func: The picklable function of one argument.
+        :param iterable: The arguments.
+        :param timeout: The maximum total time to wait in seconds, None to wait without a limit.
+        :return: An iterator over the results.
+        """
+        futures = [self.enqueue(func, args=[item]) for item in iterable]
+        return ThreadPool._results(futures, timeout)
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for all active tasks to complete.
+
+        :param timeout: The maximum time to wait in seconds, None to wait without a limit.
+        :return: True if all tasks are finished, False if the timeout expired first.
+        """
+        with self._all_done:
+            return self._all_done.wait_for(lambda: self._unfinished == 0, timeout)
+
+    def dispose(self, wait: bool = False) -> None:
+        """
+        Mark the process pool for disposal. The processes are stopped once the active tasks
+        are finished.
+
+        :param wait: Whether to block until the remaining tasks are finished.
+        """
+        with self._lock:
+            self._disposed = True
+            if self._unfinished == 0:
+                self._stop()
+        if wait:
+            self.join()
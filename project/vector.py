@@ -1,33 +1,69 @@
-from typing import Union, List
+from array import array
+from itertools import repeat
+from operator import itemgetter, mul
+from typing import Any, Dict, Iterable, Union, List, Optional, Tuple
+import heapq
 import math
+import random
+
+from project.backend import numpy, resolve_backend
+from project.matrix import Matrix
 
 
 class Vector:
     """
     A class to represent a vector and perform operations with it.
 
+    The class uses ``__slots__`` (no per-instance ``__dict__``) and keeps the coordinates
+    in a typed ``array('d')``: a 3-dimensional vector takes 168 bytes instead of
+    248 bytes for an instance with a ``__dict__`` and a list of floats
+    (measured by ``scripts/benchmark_vector_memory.py``).
+
+    With ``cache_norm=True`` the length is computed once and kept until the vector is
+    changed through item assignment or by assigning `coordinates`; `coordinates` is then
+    a read-only ``memoryview``, so the array cannot be changed in place behind the cache.
+    Together with `normalized` this reduces repeated `get_angle` calls to a single dot
+    product each.
+
     Attributes:
     -----------
-    coordinates : List[Union[int, float]]
-        A list of vector coordinates (can contain both integers and floating-point numbers).
+    coordinates : Union[array, memoryview]
+        An ``array('d')`` of vector coordinates (a read-only ``memoryview`` of doubles
+        with ``cache_norm=True``).
 
     Methods:
     --------
-    __init__(coordinates: List[Union[int, float]] = []) -> None:
+    __init__(coordinates: Iterable[Union[int, float]] = [], cache_norm: bool = False) -> None:
         Initializes the vector with the given coordinates.
 
-    scalar_product(vector1: 'Vector', vector2: 'Vector') -> Union[int, float]:
+    __getitem__(index: int) -> float, __setitem__(index: int, value: Union[int, float]) -> None:
+        Reads and changes a coordinate (the change invalidates the cached length).
+
+    scalar_product(vector1: 'Vector', vector2: 'Vector', backend: Optional[str] = None, accurate: bool = False) -> float:
         Calculates the dot product of two vectors.
 
-    get_angle(vector1: 'Vector', vector2: 'Vector') -> float:
+    get_angle(vector1: 'Vector', vector2: 'Vector', backend: Optional[str] = None, accurate: bool = False) -> float:
         Calculates the angle between two vectors in degrees.
 
-    length() -> float:
+    outer(vector1: 'Vector', vector2: 'Vector', backend: Optional[str] = None) -> Matrix:
+        Calculates the outer product of two vectors.
+
+    length(backend: Optional[str] = None, accurate: bool = False) -> float:
         Calculates the length (Euclidean norm) of the vector.
+
+    normalized(backend: Optional[str] = None) -> 'Vector':
+        Returns the unit vector of the same direction.
     """
 
+    __slots__ = ("_coordinates", "_norm", "_cache_norm")
+
     @staticmethod
-    def scalar_product(vector1: "Vector", vector2: "Vector") -> Union[int, float]:
+    def scalar_product(
+        vector1: "Vector",
+        vector2: "Vector",
+        backend: Optional[str] = None,
+        accurate: bool = False,
+    ) -> float:
         """
         Calculates the dot product of two vectors.
 
@@ -40,10 +76,16 @@ class Vector:
             The first vector.
         vector2 : Vector
             The second vector.
+        backend : Optional[str]
+            "python" or "numpy", overrides the global backend for this call.
+        accurate : bool, optional
+            Whether the products are summed with ``math.fsum`` (correctly rounded,
+            no cancellation error) instead of the fast running sum; the backend
+            is ignored in this mode. Default is False.
 
         Returns:
         --------
-        Union[int, float]
+        float
             The result of the dot product of two vectors.
 
         Exceptions:
@@ -56,24 +98,31 @@ class Vector:
         >>> v1 = Vector([1, 2, 3])
         >>> v2 = Vector([4, 5, 6])
         >>> Vector.scalar_product(v1, v2)
-        32
+        32.0
         """
         if len(vector1.coordinates) != len(vector2.coordinates):
             raise Exception("vectors must have same amount of dimensions")
-        product: Union[int, float] = 0
-        for i in range(len(vector1.coordinates)):
-            product += vector1.coordinates[i] * vector2.coordinates[i]
-        return product
+        if accurate:
+            return math.fsum(map(mul, vector1.coordinates, vector2.coordinates))
+        if resolve_backend(backend) == "numpy":
+            return float(numpy.dot(vector1.coordinates, vector2.coordinates))
+        return sum(map(mul, vector1.coordinates, vector2.coordinates), 0.0)
 
     @staticmethod
-    def get_angle(vector1: "Vector", vector2: "Vector") -> float:
+    def get_angle(
+        vector1: "Vector",
+        vector2: "Vector",
+        backend: Optional[str] = None,
+        accurate: bool = False,
+    ) -> float:
         """
         Calculates the angle between two vectors in degrees.
 
         The angle is calculated using the formula:
         cos(theta) = (A * B) / (|A| * |B|), where * is the dot product,
-        and |A| and |B| are the lengths of the vectors. The angle is then
-        converted to degrees.
+        and |A| and |B| are the lengths of the vectors. The cosine is clamped to
+        [-1, 1], so rounding on nearly parallel vectors cannot make ``math.acos``
+        fail. The angle is then converted to degrees.
 
         Parameters:
         -----------
@@ -81,6 +130,11 @@ class Vector:
             The first vector.
         vector2 : Vector
             The second vector.
+        backend : Optional[str]
+            "python" or "numpy", overrides the global backend for this call.
+        accurate : bool, optional
+            Whether the dot product and the lengths are computed in the accurate
+            mode (see `scalar_product` and `length`). Default is False.
 
         Returns:
         --------
@@ -99,37 +153,139 @@ class Vector:
         >>> Vector.get_angle(v1, v2)
         90.0
         """
-        return math.degrees(
-            math.acos(
-                Vector.scalar_product(vector1, vector2)
-                / (vector1.length() * vector2.length())
-            )
+        cosine = Vector.scalar_product(vector1, vector2, backend, accurate) / (
+            vector1.length(backend, accurate) * vector2.length(backend, accurate)
         )
+        return math.degrees(math.acos(max(-1.0, min(1.0, cosine))))
+
+    @staticmethod
+    def outer(
+        vector1: "Vector", vector2: "Vector", backend: Optional[str] = None
+    ) -> Matrix:
+        """
+        Calculates the outer product of two vectors.
+
+        The element ``(i, j)`` of the result is ``vector1[i] * vector2[j]``. The rows
+        are written straight into the storage of the matrix, no intermediate
+        one-row matrices are built.
+
+        Parameters:
+        -----------
+        vector1 : Vector
+            The vector giving the rows of the result.
+        vector2 : Vector
+            The vector giving the columns of the result.
+        backend : Optional[str]
+            "python" or "numpy", overrides the global backend for this call.
+
+        Returns:
+        --------
+        Matrix
+            A matrix with ``len(vector1)`` rows and ``len(vector2)`` columns.
+
+        Example:
+        --------
+        >>> Vector.outer(Vector([1, 2]), Vector([3, 4, 5])).content
+        [[3.0, 4.0, 5.0], [6.0, 8.0, 10.0]]
+        """
+        height, width = len(vector1.coordinates), len(vector2.coordinates)
+        if resolve_backend(backend) == "numpy":
+            return Matrix._from_ndarray(
+                numpy.outer(vector1.coordinates, vector2.coordinates)
+            )
+        data = array("d")
+        for value in vector1.coordinates:
+            data.extend(map(mul, repeat(value, width), vector2.coordinates))
+        return Matrix._from_array(data, height, width)
 
-    def __init__(self, coordinates: List[Union[int, float]] = []) -> None:
+    def __init__(
+        self, coordinates: Iterable[Union[int, float]] = [], cache_norm: bool = False
+    ) -> None:
         """
         Initializes the vector with the given coordinates.
 
         Parameters:
         -----------
-        coordinates : List[Union[int, float]], optional
-            A list of vector coordinates, default is an empty list.
+        coordinates : Iterable[Union[int, float]], optional
+            Vector coordinates (a list, an array or any iterable of numbers), copied
+            into an ``array('d')``; default is an empty list.
+        cache_norm : bool, optional
+            Whether the length is cached between calls, default is False.
 
         Example:
         --------
         >>> v = Vector([1, 2, 3])
         >>> v.coordinates
-        [1, 2, 3]
+        array('d', [1.0, 2.0, 3.0])
+        """
+        self._coordinates: Any = array("d", coordinates)
+        self._cache_norm: bool = cache_norm
+        self._norm: Optional[float] = None
+
+    @property
+    def coordinates(self) -> Any:
+        """
+        The coordinates as an ``array('d')``, or as a read-only ``memoryview`` of doubles
+        if the length is cached; assigning an iterable replaces them.
+        """
+        if self._cache_norm:
+            return memoryview(self._coordinates).toreadonly()
+        return self._coordinates
+
+    @coordinates.setter
+    def coordinates(self, values: Iterable[Union[int, float]]) -> None:
+        self._coordinates = array("d", values)
+        self._norm = None
+
+    def _writable(self) -> array:
+        """
+        Returns the coordinate array to be changed in place and drops the cached length.
+        """
+        self._norm = None
+        return self._coordinates
+
+    def __len__(self) -> int:
+        """
+        Returns the number of coordinates.
+        """
+        return len(self.coordinates)
+
+    def __getitem__(self, index: int) -> float:
+        """
+        Returns the coordinate with the given index.
+        """
+        return self.coordinates[index]
+
+    def __setitem__(self, index: int, value: Union[int, float]) -> None:
+        """
+        Changes the coordinate with the given index and drops the cached length.
+        """
+        self._coordinates[index] = value
+        self._norm = None
+
+    def __repr__(self) -> str:
         """
-        self.coordinates: List[Union[int, float]] = coordinates
+        Returns the representation of the vector, e.g. ``Vector([1.0, 2.0])``.
+        """
+        return f"{type(self).__name__}({list(self.coordinates)})"
 
-    def length(self) -> float:
+    def length(self, backend: Optional[str] = None, accurate: bool = False) -> float:
         """
         Calculates the length (Euclidean norm) of the vector.
 
         The length (magnitude) of the vector is calculated as the square root
         of the sum of the squares of its coordinates.
 
+        Parameters:
+        -----------
+        backend : Optional[str]
+            "python" or "numpy", overrides the global backend for this call.
+        accurate : bool, optional
+            Whether the length is computed with ``math.hypot``, which neither
+            overflows nor underflows on extreme coordinates and is accurate to
+            about one ulp; the backend and a cached length are ignored in this
+            mode, the result replaces the cached length. Default is False.
+
         Returns:
         --------
         float
@@ -141,7 +297,785 @@ class Vector:
         >>> v.length()
         5.0
         """
-        length: float = 0
-        for i in range(len(self.coordinates)):
-            length += self.coordinates[i] ** 2
-        return length**0.5
+        if accurate:
+            norm = math.hypot(*self.coordinates)
+        elif self._norm is not None:
+            return self._norm
+        elif resolve_backend(backend) == "numpy":
+            norm = float(numpy.linalg.norm(self.coordinates))
+        else:
+            norm = math.sqrt(sum(map(mul, self.coordinates, self.coordinates)))
+        if self._cache_norm:
+            self._norm = norm
+        return norm
+
+    def normalized(self, backend: Optional[str] = None) -> "Vector":
+        """
+        Returns the unit vector of the same direction.
+
+        The result caches its length, so the angle between two normalized vectors
+        costs a single dot product after the first call.
+
+        Parameters:
+        -----------
+        backend : Optional[str]
+            "python" or "numpy", overrides the global backend for this call.
+
+        Returns:
+        --------
+        Vector
+            A new vector of length 1 (of the same class as the current one).
+
+        Exceptions:
+        -----------
+        ZeroDivisionError
+            If the vector has a length of zero.
+
+        Example:
+        --------
+        >>> Vector([3, 4]).normalized()
+        Vector([0.6000000000000001, 0.8])
+        """
+        factor = 1 / self.length(backend)
+        return type(self)(map(mul, self.coordinates, repeat(factor)), cache_norm=True)
+
+
+class FrozenVector(Vector):
+    """
+    An immutable vector that can be used as a dictionary key or a set element.
+
+    The coordinates are kept in an immutable ``bytes`` object (in the slot that holds
+    the array of a `Vector`) and exposed as a ``memoryview`` of doubles over it,
+    attributes cannot be reassigned, and the hash and the length are computed once
+    and cached. Frozen vectors are equal only to frozen vectors with the same
+    coordinates: a mutable `Vector` has no value equality or hash, so it never equals
+    a frozen one.
+    """
+
+    __slots__ = ("_hash",)
+
+    _hash: int
+
+    def __init__(
+        self, coordinates: Iterable[Union[int, float]] = [], cache_norm: bool = True
+    ) -> None:
+        """
+        Initializes the vector with the given coordinates.
+
+        Parameters:
+        -----------
+        coordinates : Iterable[Union[int, float]], optional
+            Vector coordinates, default is an empty list.
+        cache_norm : bool, optional
+            Accepted for compatibility with `Vector`, the length is always cached.
+        """
+        values = array("d", coordinates)
+        object.__setattr__(self, "_coordinates", values.tobytes())
+        object.__setattr__(self, "_hash", hash(tuple(values)))
+        object.__setattr__(self, "_cache_norm", True)
+        object.__setattr__(self, "_norm", None)
+
+    @property
+    def coordinates(self) -> Any:
+        """
+        The coordinates as a read-only ``memoryview`` of doubles.
+        """
+        return memoryview(self._coordinates).cast("d")
+
+    @coordinates.setter
+    def coordinates(self, values: Iterable[Union[int, float]]) -> None:
+        raise AttributeError("FrozenVector is immutable")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Forbids changing the attributes (except for caching the length).
+        """
+        if name != "_norm":
+            raise AttributeError("FrozenVector is immutable")
+        object.__setattr__(self, name, value)
+
+    def __setitem__(self, index: int, value: Union[int, float]) -> None:
+        """
+        Forbids changing the coordinates.
+        """
+        raise AttributeError("FrozenVector is immutable")
+
+    def _writable(self) -> array:
+        """
+        Forbids changing the coordinates in place.
+        """
+        raise AttributeError("FrozenVector is immutable")
+
+    def __hash__(self) -> int:
+        """
+        Returns the cached hash of the coordinates.
+        """
+        return self._hash
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Compares the coordinates with another frozen vector.
+        """
+        if not isinstance(other, FrozenVector):
+            return NotImplemented
+        return self.coordinates.tolist() == other.coordinates.tolist()
+
+
+class VectorBatch:
+    """
+    A collection of vectors of the same dimension stored in one contiguous ``array('d')``
+    (N x D, row-major), with operations computed over the whole batch at once.
+
+    Attributes:
+    -----------
+    dimension : int
+        The number of coordinates of every vector.
+
+    Methods:
+    --------
+    __init__(vectors: List[Vector] = [], dimension: int = 0) -> None:
+        Copies the vectors into the batch storage.
+
+    append(vector: Vector) -> None:
+        Adds a vector to the batch.
+
+    norms(backend: Optional[str] = None) -> array:
+        Calculates the lengths of all vectors.
+
+    dot(other: Union[Vector, 'VectorBatch'], backend: Optional[str] = None) -> array:
+        Calculates the dot products of all vectors with a vector or with another batch.
+
+    normalized(backend: Optional[str] = None) -> 'VectorBatch':
+        Returns the batch of unit vectors.
+
+    pairwise_angles(other: Optional['VectorBatch'] = None, backend: Optional[str] = None) -> Matrix:
+        Calculates the angles between every pair of vectors in degrees.
+    """
+
+    def __init__(self, vectors: List[Vector] = [], dimension: int = 0) -> None:
+        """
+        Initializes the batch with copies of the given vectors.
+
+        Parameters:
+        -----------
+        vectors : List[Vector], optional
+            The vectors of the batch, default is an empty list.
+        dimension : int, optional
+            The dimension of the vectors, taken from the first vector if there are any.
+
+        Exceptions:
+        -----------
+        Exception
+            If the vectors have different numbers of dimensions.
+        """
+        self.dimension: int = len(vectors[0].coordinates) if vectors else dimension
+        self._data: array = array("d")
+        for vector in vectors:
+            self.append(vector)
+
+    @classmethod
+    def _from_array(cls, data: array, dimension: int) -> "VectorBatch":
+        """
+        Creates a batch directly over a row-major storage without copying it.
+        """
+        batch = cls.__new__(cls)
+        batch.dimension = dimension
+        batch._data = data
+        return batch
+
+    def __len__(self) -> int:
+        """
+        Returns the number of vectors in the batch.
+        """
+        return len(self._data) // self.dimension if self.dimension else 0
+
+    def __getitem__(self, index: int) -> Vector:
+        """
+        Returns a copy of the vector with the given index.
+        """
+        if not 0 <= index < len(self):
+            raise IndexError("VectorBatch index out of range")
+        return Vector(self._row(index))
+
+    def _row(self, index: int) -> array:
+        """
+        Returns a copy of the coordinates of the vector with the given index.
+        """
+        return self._data[index * self.dimension : (index + 1) * self.dimension]
+
+    def _to_ndarray(self) -> Any:
+        """
+        Returns a NumPy view over the storage (no data is copied).
+        """
+        return numpy.frombuffer(self._data, dtype=numpy.float64).reshape(
+            len(self), self.dimension
+        )
+
+    def append(self, vector: Vector) -> None:
+        """
+        Adds a copy of the vector to the batch.
+
+        Parameters:
+        -----------
+        vector : Vector
+            The vector to add.
+
+        Exceptions:
+        -----------
+        Exception
+            If the vector has a different number of dimensions.
+        """
+        if len(vector.coordinates) != self.dimension:
+            raise Exception("vectors must have same amount of dimensions")
+        self._data.extend(vector.coordinates)
+
+    def norms(self, backend: Optional[str] = None) -> array:
+        """
+        Calculates the lengths (Euclidean norms) of all vectors in one pass.
+
+        Parameters:
+        -----------
+        backend : Optional[str]
+            "python" or "numpy", overrides the global backend for this call.
+
+        Returns:
+        --------
+        array
+            The lengths of the vectors in the order of the batch.
+        """
+        if resolve_backend(backend) == "numpy":
+            return array("d", numpy.linalg.norm(self._to_ndarray(), axis=1).tobytes())
+        result = array("d")
+        for i in range(len(self)):
+            row = self._row(i)
+            result.append(math.sqrt(sum(map(mul, row, row))))
+        return result
+
+    def dot(
+        self, other: Union[Vector, "VectorBatch"], backend: Optional[str] = None
+    ) -> array:
+        """
+        Calculates dot products for the whole batch.
+
+        Parameters:
+        -----------
+        other : Union[Vector, VectorBatch]
+            A vector (the product with every vector of the batch is calculated) or a batch
+            of the same size (the products of the vectors with the same index are calculated).
+        backend : Optional[str]
+            "python" or "numpy", overrides the global backend for this call.
+
+        Returns:
+        --------
+        array
+            The dot products in the order of the batch.
+
+        Exceptions:
+        -----------
+        Exception
+            If the dimensions or the sizes of the batches do not match.
+        """
+        if isinstance(other, Vector):
+            if len(other.coordinates) != self.dimension:
+                raise Exception("vectors must have same amount of dimensions")
+            if resolve_backend(backend) == "numpy":
+                values = self._to_ndarray() @ numpy.asarray(
+                    other.coordinates, dtype=numpy.float64
+                )
+                return array("d", values.tobytes())
+            return array(
+                "d",
+                [
+                    sum(map(mul, self._row(i), other.coordinates))
+                    for i in range(len(self))
+                ],
+            )
+        if other.dimension != self.dimension:
+            raise Exception("vectors must have same amount of dimensions")
+        if len(other) != len(self):
+            raise Exception("batches must have same amount of vectors")
+        if resolve_backend(backend) == "numpy":
+            values = numpy.einsum("ij,ij->i", self._to_ndarray(), other._to_ndarray())
+            return array("d", values.tobytes())
+        return array(
+            "d",
+            [sum(map(mul, self._row(i), other._row(i))) for i in range(len(self))],
+        )
+
+    def normalized(self, backend: Optional[str] = None) -> "VectorBatch":
+        """
+        Divides every vector by its length.
+
+        Parameters:
+        -----------
+        backend : Optional[str]
+            "python" or "numpy", overrides the global backend for this call.
+
+        Returns:
+        --------
+        VectorBatch
+            A new batch of unit vectors.
+
+        Exceptions:
+        -----------
+        ZeroDivisionError
+            If one of the vectors has a length of zero.
+        """
+        norms = self.norms(backend)
+        if 0.0 in norms:
+            raise ZeroDivisionError("cannot normalize a zero vector")
+        if resolve_backend(backend) == "numpy":
+            values = self._to_ndarray() / numpy.frombuffer(norms)[:, None]
+            return VectorBatch._from_array(array("d", values.tobytes()), self.dimension)
+        data = array("d")
+        for i in range(len(self)):
+            data.extend(map(mul, self._row(i), repeat(1 / norms[i])))
+        return VectorBatch._from_array(data, self.dimension)
+
+    def pairwise_angles(
+        self, other: Optional["VectorBatch"] = None, backend: Optional[str] = None
+    ) -> Matrix:
+        """
+        Calculates the angles between every vector of the batch and every vector of
+        another batch (or of the same batch) in degrees.
+
+        The vectors are normalized once, the cosines are the product of the two
+        normalized batches as matrices, and they are clamped to [-1, 1] before ``acos``.
+
+        Parameters:
+        -----------
+        other : Optional[VectorBatch]
+            The second batch, the current batch if omitted.
+        backend : Optional[str]
+            "python" or "numpy", overrides the global backend for this call.
+
+        Returns:
+        --------
+        Matrix
+            ``len(self) x len(other)`` matrix of angles in degrees.
+
+        Exceptions:
+        -----------
+        Exception
+            If the dimensions of the batches do not match.
+        ZeroDivisionError
+            If one of the vectors has a length of zero.
+        """
+        if other is not None and other.dimension != self.dimension:
+            raise Exception("vectors must have same amount of dimensions")
+        left = self.normalized(backend)
+        right = left if other is None else other.normalized(backend)
+        cosines = Matrix._from_array(left._data, len(left), self.dimension)._product(
+            Matrix._from_array(right._data, len(right), self.dimension).trans(),
+            backend,
+        )
+        angles = array(
+            "d",
+            [
+                math.degrees(math.acos(max(-1.0, min(1.0, cosine))))
+                for cosine in cosines._flat()
+            ],
+        )
+        return Matrix._from_array(angles, cosines.height, cosines.width)
+
+
+class _KDNode:
+    """
+    A node of `KDTree`: a vector splitting the space by one coordinate.
+    """
+
+    __slots__ = ("vector", "axis", "left", "right")
+
+    def __init__(self, vector: Vector, axis: int) -> None:
+        self.vector: Vector = vector
+        self.axis: int = axis
+        self.left: Optional["_KDNode"] = None
+        self.right: Optional["_KDNode"] = None
+
+
+class KDTree:
+    """
+    A k-d tree over vectors for nearest neighbour queries by the Euclidean distance.
+
+    Every node splits the space by one coordinate (cycling through the dimensions),
+    the tree built from a list of vectors is balanced by median splits. Queries skip
+    the subtrees that cannot contain a closer vector, which makes them logarithmic
+    on average for low dimensions (up to ~20); for high dimensions use `LSHIndex`.
+    For cosine similarity build the tree over normalized vectors (see `Vector.normalized`):
+    the Euclidean order of unit vectors is the order of the angles between them.
+
+    Methods:
+    --------
+    __init__(vectors: List[Vector] = [], dimension: int = 0) -> None:
+        Builds a balanced tree over the vectors.
+
+    insert(vector: Vector) -> None:
+        Adds a vector to the tree.
+
+    knn(query: Vector, k: int) -> List[Tuple[float, Vector]]:
+        Finds the k nearest vectors.
+
+    radius(query: Vector, radius: float) -> List[Tuple[float, Vector]]:
+        Finds all vectors within the distance.
+    """
+
+    def __init__(self, vectors: List[Vector] = [], dimension: int = 0) -> None:
+        """
+        Builds a balanced tree over the vectors.
+
+        Parameters:
+        -----------
+        vectors : List[Vector], optional
+            The vectors to index, default is an empty list.
+        dimension : int, optional
+            The dimension of the vectors, taken from the first vector if there are any.
+
+        Exceptions:
+        -----------
+        Exception
+            If the vectors have different numbers of dimensions.
+        """
+        self.dimension: int = len(vectors[0].coordinates) if vectors else dimension
+        for vector in vectors:
+            self._check_dimension(vector)
+        self._size: int = len(vectors)
+        self._root: Optional[_KDNode] = self._build(list(vectors), 0)
+
+    def _check_dimension(self, vector: Vector) -> None:
+        """
+        Checks that the vector has the dimension of the tree.
+        """
+        if len(vector.coordinates) != self.dimension:
+            raise Exception("vectors must have same amount of dimensions")
+
+    def _build(self, vectors: List[Vector], depth: int) -> Optional[_KDNode]:
+        """
+        Builds a subtree splitting the vectors by the median of the coordinate ``depth % dimension``.
+        """
+        if not vectors:
+            return None
+        axis = depth % self.dimension if self.dimension else 0
+        vectors.sort(key=lambda vector: vector.coordinates[axis])
+        middle = len(vectors) // 2
+        node = _KDNode(vectors[middle], axis)
+        node.left = self._build(vectors[:middle], depth + 1)
+        node.right = self._build(vectors[middle + 1 :], depth + 1)
+        return node
+
+    def __len__(self) -> int:
+        """
+        Returns the number of vectors in the tree.
+        """
+        return self._size
+
+    def insert(self, vector: Vector) -> None:
+        """
+        Adds a vector to the tree (without rebalancing).
+
+        Parameters:
+        -----------
+        vector : Vector
+            The vector to add.
+
+        Exceptions:
+        -----------
+        Exception
+            If the vector has a different number of dimensions.
+        """
+        self._check_dimension(vector)
+        self._size += 1
+        if self._root is None:
+            self._root = _KDNode(vector, 0)
+            return
+        node = self._root
+        while True:
+            axis = node.axis
+            next_axis = (axis + 1) % self.dimension if self.dimension else 0
+            if vector.coordinates[axis] < node.vector.coordinates[axis]:
+                if node.left is None:
+                    node.left = _KDNode(vector, next_axis)
+                    return
+                node = node.left
+            else:
+                if node.right is None:
+                    node.right = _KDNode(vector, next_axis)
+                    return
+                node = node.right
+
+    def knn(self, query: Vector, k: int) -> List[Tuple[float, Vector]]:
+        """
+        Finds the k vectors nearest to the query.
+
+        Parameters:
+        -----------
+        query : Vector
+            The query vector.
+        k : int
+            The number of neighbours.
+
+        Returns:
+        --------
+        List[Tuple[float, Vector]]
+            Pairs (distance, vector) sorted by the distance, at most k of them.
+
+        Exceptions:
+        -----------
+        Exception
+            If the query has a different number of dimensions.
+        """
+        self._check_dimension(query)
+        coordinates = query.coordinates
+        # a max-heap by the distance: the farthest of the current neighbours is on top
+        heap: List[Tuple[float, int, Vector]] = []
+        # subtrees with the lower bounds of the distances to their vectors
+        stack: List[Tuple[Optional[_KDNode], float]] = [(self._root, 0.0)]
+        while stack and k > 0:
+            node, bound = stack.pop()
+            if node is None or (len(heap) == k and bound >= -heap[0][0]):
+                continue
+            distance = math.dist(coordinates, node.vector.coordinates)
+            if len(heap) < k:
+                heapq.heappush(heap, (-distance, id(node), node.vector))
+            elif distance < -heap[0][0]:
+                heapq.heapreplace(heap, (-distance, id(node), node.vector))
+            difference = coordinates[node.axis] - node.vector.coordinates[node.axis]
+            near, far = (
+                (node.left, node.right) if difference < 0 else (node.right, node.left)
+            )
+            stack.append((far, abs(difference)))
+            stack.append((near, bound))
+        return sorted(
+            ((-distance, vector) for distance, _, vector in heap), key=itemgetter(0)
+        )
+
+    def radius(self, query: Vector, radius: float) -> List[Tuple[float, Vector]]:
+        """
+        Finds all vectors within the given distance from the query.
+
+        Parameters:
+        -----------
+        query : Vector
+            The query vector.
+        radius : float
+            The maximum distance.
+
+        Returns:
+        --------
+        List[Tuple[float, Vector]]
+            Pairs (distance, vector) sorted by the distance.
+
+        Exceptions:
+        -----------
+        Exception
+            If the query has a different number of dimensions.
+        """
+        self._check_dimension(query)
+        coordinates = query.coordinates
+        found: List[Tuple[float, Vector]] = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            distance = math.dist(coordinates, node.vector.coordinates)
+            if distance <= radius:
+                found.append((distance, node.vector))
+            difference = coordinates[node.axis] - node.vector.coordinates[node.axis]
+            if difference - radius <= 0:
+                stack.append(node.left)
+            if difference + radius >= 0:
+                stack.append(node.right)
+        found.sort(key=itemgetter(0))
+        return found
+
+
+class LSHIndex:
+    """
+    A locality-sensitive hashing index over vectors for nearest neighbour queries by angle.
+
+    Every table hashes a vector to the signs of its dot products with ``bits`` random
+    hyperplanes (random projections), so vectors with a small angle between them
+    fall into the same bucket with a high probability. A query only compares the
+    vectors from its buckets (and from the buckets differing in one bit, if there
+    are too few candidates), which is sublinear in the size of the collection; the
+    candidates are ranked by the exact angle. The answer is approximate: more
+    tables increase the recall, more bits make the buckets smaller.
+
+    Methods:
+    --------
+    __init__(dimension: int, vectors: List[Vector] = [], tables: int = 8, bits: int = 12, seed: Optional[int] = None) -> None:
+        Creates the index and adds the vectors.
+
+    insert(vector: Vector) -> None:
+        Adds a vector to the index.
+
+    knn(query: Vector, k: int) -> List[Tuple[float, Vector]]:
+        Finds approximately the k vectors with the smallest angles to the query.
+
+    radius(query: Vector, max_angle: float) -> List[Tuple[float, Vector]]:
+        Finds the candidate vectors within the angle.
+    """
+
+    def __init__(
+        self,
+        dimension: int,
+        vectors: List[Vector] = [],
+        tables: int = 8,
+        bits: int = 12,
+        seed: Optional[int] = None,
+    ) -> None:
+        """
+        Creates the index and adds the vectors.
+
+        Parameters:
+        -----------
+        dimension : int
+            The dimension of the vectors.
+        vectors : List[Vector], optional
+            The vectors to index, default is an empty list.
+        tables : int, optional
+            The number of hash tables, default is 8.
+        bits : int, optional
+            The number of hyperplanes per table, default is 12.
+        seed : Optional[int]
+            The seed of the random hyperplanes.
+        """
+        self.dimension: int = dimension
+        self.bits: int = bits
+        generator = random.Random(seed)
+        self._planes: List[VectorBatch] = [
+            VectorBatch(
+                [
+                    Vector([generator.gauss(0, 1) for _ in range(dimension)])
+                    for _ in range(bits)
+                ],
+                dimension,
+            )
+            for _ in range(tables)
+        ]
+        self._buckets: List[Dict[int, List[Vector]]] = [{} for _ in range(tables)]
+        self._size: int = 0
+        for vector in vectors:
+            self.insert(vector)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of vectors in the index.
+        """
+        return self._size
+
+    def _signatures(self, vector: Vector) -> List[int]:
+        """
+        Hashes the vector in every table: bit ``i`` is set if it lies on the positive
+        side of the hyperplane ``i``.
+        """
+        if len(vector.coordinates) != self.dimension:
+            raise Exception("vectors must have same amount of dimensions")
+        signatures = []
+        for planes in self._planes:
+            signature = 0
+            for product in planes.dot(vector, "python"):
+                signature = (signature << 1) | (product > 0)
+            signatures.append(signature)
+        return signatures
+
+    def insert(self, vector: Vector) -> None:
+        """
+        Adds a vector to the index.
+
+        Parameters:
+        -----------
+        vector : Vector
+            The vector to add.
+
+        Exceptions:
+        -----------
+        Exception
+            If the vector has a different number of dimensions.
+        """
+        for buckets, signature in zip(self._buckets, self._signatures(vector)):
+            buckets.setdefault(signature, []).append(vector)
+        self._size += 1
+
+    def _candidates(self, query: Vector, k: int) -> List[Vector]:
+        """
+        Collects the vectors from the buckets of the query, probing the buckets that
+        differ in one bit if there are fewer than k of them.
+        """
+        signatures = self._signatures(query)
+        seen: Dict[int, Vector] = {}
+        for buckets, signature in zip(self._buckets, signatures):
+            for vector in buckets.get(signature, []):
+                seen[id(vector)] = vector
+        if len(seen) < k:
+            for buckets, signature in zip(self._buckets, signatures):
+                for bit in range(self.bits):
+                    for vector in buckets.get(signature ^ (1 << bit), []):
+                        seen[id(vector)] = vector
+        return list(seen.values())
+
+    def _rank(self, query: Vector, vectors: List[Vector]) -> List[Tuple[float, Vector]]:
+        """
+        Sorts the vectors by the exact angle to the query (zero vectors are skipped).
+        """
+        query_length = query.length()
+        ranked = []
+        for vector in vectors:
+            length = vector.length()
+            if length == 0 or query_length == 0:
+                continue
+            cosine = Vector.scalar_product(query, vector, "python") / (
+                query_length * length
+            )
+            ranked.append(
+                (math.degrees(math.acos(max(-1.0, min(1.0, cosine)))), vector)
+            )
+        ranked.sort(key=itemgetter(0))
+        return ranked
+
+    def knn(self, query: Vector, k: int) -> List[Tuple[float, Vector]]:
+        """
+        Finds approximately the k vectors with the smallest angles to the query.
+
+        Parameters:
+        -----------
+        query : Vector
+            The query vector.
+        k : int
+            The number of neighbours.
+
+        Returns:
+        --------
+        List[Tuple[float, Vector]]
+            Pairs (angle in degrees, vector) sorted by the angle, at most k of them.
+
+        Exceptions:
+        -----------
+        Exception
+            If the query has a different number of dimensions.
+        """
+        return self._rank(query, self._candidates(query, k))[:k]
+
+    def radius(self, query: Vector, max_angle: float) -> List[Tuple[float, Vector]]:
+        """
+        Finds the vectors from the buckets of the query within the given angle.
+
+        Parameters:
+        -----------
+        query : Vector
+            The query vector.
+        max_angle : float
+            The maximum angle in degrees.
+
+        Returns:
+        --------
+        List[Tuple[float, Vector]]
+            Pairs (angle in degrees, vector) sorted by the angle.
+
+        Exceptions:
+        -----------
+        Exception
+            If the query has a different number of dimensions.
+        """
+        ranked = self._rank(query, self._candidates(query, 0))
+        return [(angle, vector) for angle, vector in ranked if angle <= max_angle]
@@ -0,0 +1,303 @@
+import mmap
+import os
+import sys
+from array import array
+from typing import Iterable, Iterator
+
+from project.vector import Vector, VectorBatch
+
+DTYPES = ("f", "d")
+CHUNK_SIZE = 1024
+
+
+def _check_dtype(dtype: str) -> int:
+    """
+    Checks the element type of a raw binary file and returns its size in bytes.
+    """
+    if dtype not in DTYPES:
+        raise ValueError(f"Unknown dtype '{dtype}', expected one of {DTYPES}")
+    return array(dtype).itemsize
+
+
+def _binary_chunks(
+    path: str, dimension: int, dtype: str, chunk_size: int
+) -> Iterator[array]:
+    """
+    Maps a raw binary file and yields ``array('d')`` buffers of at most
+    `chunk_size` vectors, so only one chunk is converted at a time.
+    """
+    if dimension <= 0 or chunk_size <= 0:
+        raise ValueError("dimension and chunk_size must be positive")
+    row_size = _check_dtype(dtype) * dimension
+    size = os.path.getsize(path)
+    if size % row_size:
+        raise Exception("File size is not a multiple of the vector size")
+    if size == 0:
+        return
+    with open(path, "rb") as file, mmap.mmap(
+        file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped:
+        view = memoryview(mapped)
+        try:
+            step = row_size * chunk_size
+            for start in range(0, size, step):
+                data = array(dtype)
+                data.frombytes(view[start : start + step])
+                if sys.byteorder == "big":
+                    data.byteswap()
+                yield data if dtype == "d" else array("d", data)
+        finally:
+            view.release()
+
+
+def read_binary(
+    path: str, dimension: int, dtype: str = "d", chunk_size: int = CHUNK_SIZE
+) -> Iterator[Vector]:
+    """
+    Lazily reads vectors from a raw binary file.
+
+    The file holds the coordinates of the vectors one after another as little-endian
+    float32 (``dtype="f"``) or float64 (``dtype="d"``) values, without any header.
+    The file is mapped with ``mmap`` and converted `chunk_size` vectors at a time,
+    so the memory used does not depend on the size of the file.
+
+    Parameters:
+    -----------
+    path : str
+        The path of the file to read.
+    dimension : int
+        The number of coordinates of every vector.
+    dtype : str, optional
+        "f" for float32 or "d" for float64 values, default is "d".
+    chunk_size : int, optional
+        The number of vectors converted at once, default is `CHUNK_SIZE`.
+
+    Returns:
+    --------
+    Iterator[Vector]
+        The vectors in the order they are stored.
+
+    Exceptions:
+    -----------
+    ValueError
+        If the dtype is unknown or the dimension is not positive.
+    Exception
+        If the file size is not a multiple of the vector size.
+
+    Example:
+    --------
+    >>> write_binary("vectors.bin", [Vector([1, 2]), Vector([3, 4])])
+    2
+    >>> list(read_binary("vectors.bin", 2))
+    [Vector([1.0, 2.0]), Vector([3.0, 4.0])]
+    """
+    for data in _binary_chunks(path, dimension, dtype, chunk_size):
+        for start in range(0, len(data), dimension):
+            yield Vector(data[start : start + dimension])
+
+
+def read_binary_batches(
+    path: str, dimension: int, dtype: str = "d", chunk_size: int = CHUNK_SIZE
+) -> Iterator[VectorBatch]:
+    """
+    Lazily reads a raw binary file (see `read_binary`) as batches of vectors.
+
+    Every chunk is copied into the batch storage in one go, no `Vector` objects
+    are created.
+
+    Parameters:
+    -----------
+    path : str
+        The path of the file to read.
+    dimension : int
+        The number of coordinates of every vector.
+    dtype : str, optional
+        "f" for float32 or "d" for float64 values, default is "d".
+    chunk_size : int, optional
+        The number of vectors in every batch (the last one may be shorter),
+        default is `CHUNK_SIZE`.
+
+    Returns:
+    --------
+    Iterator[VectorBatch]
+        The batches in the order the vectors are stored.
+
+    Exceptions:
+    -----------
+    ValueError
+        If the dtype is unknown or the dimension is not positive.
+    Exception
+        If the file size is not a multiple of the vector size.
+    """
+    for data in _binary_chunks(path, dimension, dtype, chunk_size):
+        yield VectorBatch._from_array(data, dimension)
+
+
+def write_binary(path: str, vectors: Iterable[Vector], dtype: str = "d") -> int:
+    """
+    Writes vectors to a raw binary file (see `read_binary`) one by one.
+
+    Parameters:
+    -----------
+    path : str
+        The path of the file to write.
+    vectors : Iterable[Vector]
+        The vectors to write, any iterable (e.g. a generator) of vectors
+        of the same dimension.
+    dtype : str, optional
+        "f" for float32 or "d" for float64 values, default is "d".
+
+    Returns:
+    --------
+    int
+        The number of written vectors.
+
+    Exceptions:
+    -----------
+    ValueError
+        If the dtype is unknown.
+    Exception
+        If the vectors have different numbers of dimensions.
+    """
+    _check_dtype(dtype)
+    count = 0
+    dimension = None
+    with open(path, "wb") as file:
+        for vector in vectors:
+            if dimension is None:
+                dimension = len(vector.coordinates)
+            elif len(vector.coordinates) != dimension:
+                raise Exception("vectors must have same amount of dimensions")
+            data = array(dtype, vector.coordinates)
+            if sys.byteorder == "big":
+                data.byteswap()
+            data.tofile(file)
+            count += 1
+    return count
+
+
+def read_csv(path: str, delimiter: str = ",") -> Iterator[Vector]:
+    """
+    Lazily reads vectors from a text file with one vector per line.
+
+    The lines are read one at a time, empty lines are skipped. All lines must
+    have the number of coordinates of the first one.
+
+    Parameters:
+    -----------
+    path : str
+        The path of the file to read.
+    delimiter : str, optional
+        The separator of the coordinates, default is ",".
+
+    Returns:
+    --------
+    Iterator[Vector]
+        The vectors in the order of the lines.
+
+    Exceptions:
+    -----------
+    ValueError
+        If a coordinate is not a number.
+    Exception
+        If the lines have different numbers of coordinates.
+
+    Example:
+    --------
+    >>> write_csv("vectors.csv", [Vector([1, 2]), Vector([3, 4])])
+    2
+    >>> list(read_csv("vectors.csv"))
+    [Vector([1.0, 2.0]), Vector([3.0, 4.0])]
+    """
+    dimension = None
+    with open(path) as file:
+        for line in file:
+            if not line.strip():
+                continue
+            vector = Vector(map(float, line.split(delimiter)))
+            if dimension is None:
+                dimension = len(vector.coordinates)
+            elif len(vector.coordinates) != dimension:
+                raise Exception("vectors must have same amount of dimensions")
+            yield vector
+
+
+def read_csv_batches(
+    path: str, delimiter: str = ",", chunk_size: int = CHUNK_SIZE
+) -> Iterator[VectorBatch]:
+    """
+    Lazily reads a text file (see `read_csv`) as batches of vectors.
+
+    Parameters:
+    -----------
+    path : str
+        The path of the file to read.
+    delimiter : str, optional
+        The separator of the coordinates, default is ",".
+    chunk_size : int, optional
+        The number of vectors in every batch (the last one may be shorter),
+        default is `CHUNK_SIZE`.
+
+    Returns:
+    --------
+    Iterator[VectorBatch]
+        The batches in the order of the lines.
+
+    Exceptions:
+    -----------
+    ValueError
+        If a coordinate is not a number or chunk_size is not positive.
+    Exception
+        If the lines have different numbers of coordinates.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    data = array("d")
+    count = 0
+    # fixed by the first line, a non-empty line has at least one coordinate
+    dimension = 0
+    with open(path) as file:
+        for line in file:
+            if not line.strip():
+                continue
+            size = len(data)
+            data.extend(map(float, line.split(delimiter)))
+            if not dimension:
+                dimension = len(data)
+            elif len(data) - size != dimension:
+                raise Exception("vectors must have same amount of dimensions")
+            count += 1
+            if count == chunk_size:
+                yield VectorBatch._from_array(data, dimension)
+                data = array("d")
+                count = 0
+    if count:
+        yield VectorBatch._from_array(data, dimension)
+
+
+def write_csv(path: str, vectors: Iterable[Vector], delimiter: str = ",") -> int:
+    """
+    Writes vectors to a text file with one vector per line (see `read_csv`).
+
+    The coordinates are written with ``repr``, so reading them back is exact.
+
+    Parameters:
+    -----------
+    path : str
+        The path of the file to write.
+    vectors : Iterable[Vector]
+        The vectors to write, any iterable (e.g. a generator) of vectors.
+    delimiter : str, optional
+        The separator of the coordinates, default is ",".
+
+    Returns:
+    --------
+    int
+        The number of written vectors.
+    """
+    count = 0
+    with open(path, "w") as file:
+        for vector in vectors:
+            file.write(delimiter.join(map(repr, vector.coordinates)) + "\n")
+            count += 1
+    return count
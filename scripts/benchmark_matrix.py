@@ -0,0 +1,63 @@
+import argparse
+import random
+import sys
+import time
+from typing import Callable, List
+
+import shared
+
+sys.path.insert(0, str(shared.ROOT))
+
+from project.matrix import Matrix
+
+
+def naive_multiply(a: Matrix, b: Matrix) -> List[List[float]]:
+    """
+    The reference triple loop that walks the right operand column-wise.
+    """
+    left = a.content
+    right = b.content
+    return [
+        [sum(left[i][k] * right[k][j] for k in range(a.width)) for j in range(b.width)]
+        for i in range(a.height)
+    ]
+
+
+def random_matrix(size: int) -> Matrix:
+    return Matrix([[random.random() for _ in range(size)] for _ in range(size)])
+
+
+def measure(func: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark of Matrix multiplication")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[256, 512, 1024])
+    parser.add_argument(
+        "--workers", type=int, default=1, help="also measure the process-parallel mode"
+    )
+    args = parser.parse_args()
+
+    header = f"{'size':>6} {'naive, s':>10} {'blocked, s':>11} {'speedup':>8}"
+    if args.workers > 1:
+        header += f" {'parallel, s':>12} {'speedup':>8}"
+    print(header)
+    for size in args.sizes:
+        a = random_matrix(size)
+        b = random_matrix(size)
+        naive = measure(lambda: naive_multiply(a, b))
+        blocked = measure(lambda: a.multiply(b, backend="python"))
+        line = f"{size:>6} {naive:>10.3f} {blocked:>11.3f} {naive / blocked:>7.1f}x"
+        if args.workers > 1:
+            parallel = measure(
+                lambda: a.multiply(b, backend="python", workers=args.workers)
+            )
+            line += f" {parallel:>12.3f} {naive / parallel:>7.1f}x"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
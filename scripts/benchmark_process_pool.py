@@ -0,0 +1,60 @@
+import argparse
+import sys
+import time
+from array import array
+from typing import Union
+
+import shared
+
+sys.path.insert(0, str(shared.ROOT))
+
+from project.thread_pool import ProcessPool, ThreadPool
+
+
+def work(data: array, rounds: int) -> float:
+    """
+    A CPU-bound task in pure Python: repeated sums of squares of the array.
+    """
+    total = 0.0
+    for _ in range(rounds):
+        total += sum(x * x for x in data)
+    return total
+
+
+def run(
+    pool: Union[ThreadPool, ProcessPool], tasks: int, data: array, rounds: int
+) -> float:
+    """
+    Runs `tasks` tasks in the pool and waits for the results.
+
+    :return: The elapsed time in seconds.
+    """
+    start = time.perf_counter()
+    futures = [pool.enqueue(work, args=[data, rounds]) for _ in range(tasks)]
+    results = [future.result() for future in futures]
+    elapsed = time.perf_counter() - start
+    pool.dispose()
+    assert len(set(results)) == 1, "the tasks returned different results"
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="CPU-bound tasks in ThreadPool and ProcessPool"
+    )
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--tasks", type=int, default=64)
+    parser.add_argument("--size", type=int, default=100_000, help="array length")
+    parser.add_argument("--rounds", type=int, default=2)
+    args = parser.parse_args()
+
+    data = array("d", range(args.size))
+    print(f"{'workers':>7} {'threads, s':>10} {'processes, s':>12}")
+    for workers in args.workers:
+        threads = run(ThreadPool(workers), args.tasks, data, args.rounds)
+        processes = run(ProcessPool(workers), args.tasks, data, args.rounds)
+        print(f"{workers:>7} {threads:>10.3f} {processes:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import argparse
+import random
+import sys
+import time
+from typing import Callable, Optional
+
+import shared
+
+sys.path.insert(0, str(shared.ROOT))
+
+from project import matrix
+from project.matrix import Matrix
+
+
+def random_matrix(size: int) -> Matrix:
+    return Matrix([[random.random() for _ in range(size)] for _ in range(size)])
+
+
+def measure(func: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Finds the size from which Strassen-Winograd beats the blocked multiplication"
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[128, 192, 256, 384, 512, 768]
+    )
+    parser.add_argument("--cutoff", type=int, default=matrix.STRASSEN_CUTOFF)
+    args = parser.parse_args()
+    matrix.STRASSEN_CUTOFF = args.cutoff
+
+    crossover: Optional[int] = None
+    print(f"cutoff: {args.cutoff}")
+    print(f"{'size':>6} {'naive, s':>10} {'blocked, s':>11} {'strassen, s':>12}")
+    for size in args.sizes:
+        a = random_matrix(size)
+        b = random_matrix(size)
+        times = [
+            measure(lambda: a.multiply(b, backend="python", algorithm=algorithm))
+            for algorithm in ("naive", "blocked", "strassen")
+        ]
+        print(f"{size:>6} {times[0]:>10.3f} {times[1]:>11.3f} {times[2]:>12.3f}")
+        if crossover is None and times[2] < min(times[:2]):
+            crossover = size
+    if crossover is None:
+        print("Strassen-Winograd was not faster for the measured sizes")
+    else:
+        print(f"Strassen-Winograd is faster from size {crossover}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import argparse
+import sys
+import threading
+import time
+from typing import List
+
+import shared
+
+sys.path.insert(0, str(shared.ROOT))
+
+from project.thread_pool import ThreadPool
+
+
+def run(producers: int, workers: int, tasks: int) -> float:
+    """
+    Enqueues `tasks` tasks from every producer thread at once and waits for all of them.
+    Checks that every task ran exactly once and that the tasks of every producer ran
+    in the order they were enqueued when there is one worker.
+
+    :return: The elapsed time in seconds.
+    """
+    pool = ThreadPool(workers)
+    results: List[List[int]] = [[] for _ in range(producers)]
+    start_barrier = threading.Barrier(producers + 1)
+
+    def produce(number: int) -> None:
+        append = results[number].append
+        start_barrier.wait()
+        for i in range(tasks):
+            pool.enqueue(append, args=[i])
+
+    threads = [
+        threading.Thread(target=produce, args=(number,)) for number in range(producers)
+    ]
+    for thread in threads:
+        thread.start()
+    start_barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    pool.join()
+    elapsed = time.perf_counter() - start
+    pool.dispose()
+    for result in results:
+        assert len(result) == tasks, "a task was lost or ran twice"
+        if workers == 1:
+            assert result == list(range(tasks)), "the tasks ran out of order"
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Throughput of ThreadPool under many producers and many workers"
+    )
+    parser.add_argument("--producers", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--tasks", type=int, default=20_000, help="per producer")
+    args = parser.parse_args()
+
+    print(f"{'producers':>9} {'workers':>8} {'tasks':>8} {'time, s':>8} {'tasks/s':>9}")
+    for producers in args.producers:
+        for workers in args.workers:
+            elapsed = run(producers, workers, args.tasks)
+            total = producers * args.tasks
+            print(
+                f"{producers:>9} {workers:>8} {total:>8} {elapsed:>8.3f} "
+                f"{total / elapsed:>9.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
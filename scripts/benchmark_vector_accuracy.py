@@ -0,0 +1,52 @@
+import argparse
+import random
+import sys
+import timeit
+
+import shared
+
+sys.path.insert(0, str(shared.ROOT))
+
+from project.vector import Vector
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Throughput of the fast and the accurate vector kernels"
+    )
+    parser.add_argument("--count", type=int, default=10_000)
+    parser.add_argument("--dimensions", type=int, nargs="+", default=[3, 16, 128])
+    args = parser.parse_args()
+
+    print(
+        f"{'dimension':>9} {'operation':>14} {'fast, op/s':>12} "
+        f"{'accurate, op/s':>15} {'slowdown':>9}"
+    )
+    for dimension in args.dimensions:
+        vectors = [
+            Vector([random.uniform(-1, 1) for _ in range(dimension)])
+            for _ in range(args.count + 1)
+        ]
+        pairs = list(zip(vectors, vectors[1:]))
+        operations = {
+            "scalar_product": lambda accurate: [
+                Vector.scalar_product(v1, v2, "python", accurate) for v1, v2 in pairs
+            ],
+            "length": lambda accurate: [
+                vector.length("python", accurate) for vector in vectors
+            ],
+            "get_angle": lambda accurate: [
+                Vector.get_angle(v1, v2, "python", accurate) for v1, v2 in pairs
+            ],
+        }
+        for name, operation in operations.items():
+            fast = min(timeit.repeat(lambda: operation(False), number=1, repeat=3))
+            accurate = min(timeit.repeat(lambda: operation(True), number=1, repeat=3))
+            print(
+                f"{dimension:>9} {name:>14} {args.count / fast:>12.0f} "
+                f"{args.count / accurate:>15.0f} {accurate / fast:>8.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
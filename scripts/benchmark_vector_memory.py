@@ -0,0 +1,55 @@
+import argparse
+import random
+import sys
+import tracemalloc
+from typing import Callable, List
+
+import shared
+
+sys.path.insert(0, str(shared.ROOT))
+
+from project.vector import FrozenVector, Vector
+
+
+class DictVector:
+    """
+    The previous representation: an instance with a ``__dict__`` and a list of floats.
+    """
+
+    def __init__(self, coordinates: List[float]) -> None:
+        self.coordinates = coordinates
+
+
+def bytes_per_vector(factory: Callable[[List[float]], object], rows: list) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    vectors = [factory([value * 1.0 for value in row]) for row in rows]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del vectors
+    return (after - before) / len(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory taken by one vector")
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--dimensions", type=int, nargs="+", default=[3, 16, 128])
+    args = parser.parse_args()
+
+    print(f"{'dimension':>9} {'dict + list':>12} {'Vector':>8} {'FrozenVector':>13}")
+    for dimension in args.dimensions:
+        rows = [
+            tuple(random.random() for _ in range(dimension)) for _ in range(args.count)
+        ]
+        sizes = [
+            bytes_per_vector(factory, rows)
+            for factory in (DictVector, Vector, FrozenVector)
+        ]
+        print(
+            f"{dimension:>9} {sizes[0]:>12.0f} {sizes[1]:>8.0f} {sizes[2]:>13.0f}"
+            " (bytes per vector)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+import argparse
+import random
+import sys
+import time
+from typing import Callable, List
+
+import shared
+
+sys.path.insert(0, str(shared.ROOT))
+
+from project.matrix import Matrix
+from project.thread_pool import ThreadPool
+
+
+def random_rows(size: int) -> List[List[float]]:
+    return [[random.random() for _ in range(size)] for _ in range(size)]
+
+
+def multiply_block(rows: List[List[float]], columns: List[List[float]]) -> Matrix:
+    """
+    Multiplies a block of rows of the left matrix by a block of columns of the right one.
+    """
+    return Matrix(rows).multiply(Matrix(columns).trans(), backend="python")
+
+
+def fork_join(
+    pool: ThreadPool, rows: List[List[float]], columns: List[List[float]], leaf: int
+) -> List[List[float]]:
+    """
+    Splits the larger of the two blocks in halves and multiplies the halves as subtasks
+    until the blocks are at most `leaf` wide, then joins the results.
+    """
+    if len(rows) <= leaf and len(columns) <= leaf:
+        return multiply_block(rows, columns).content
+    if len(rows) >= len(columns):
+        middle = len(rows) // 2
+        top = pool.enqueue(fork_join, args=[pool, rows[:middle], columns, leaf])
+        bottom = pool.enqueue(fork_join, args=[pool, rows[middle:], columns, leaf])
+        return top.result() + bottom.result()
+    middle = len(columns) // 2
+    left = pool.enqueue(fork_join, args=[pool, rows, columns[:middle], leaf])
+    right = pool.enqueue(fork_join, args=[pool, rows, columns[middle:], leaf])
+    return [a + b for a, b in zip(left.result(), right.result())]
+
+
+def flat(
+    pool: ThreadPool, rows: List[List[float]], columns: List[List[float]], leaf: int
+) -> List[List[float]]:
+    """
+    Enqueues every block product from the calling thread into the shared queue.
+    """
+    futures = [
+        [
+            pool.enqueue(
+                multiply_block, args=[rows[i : i + leaf], columns[j : j + leaf]]
+            )
+            for j in range(0, len(columns), leaf)
+        ]
+        for i in range(0, len(rows), leaf)
+    ]
+    result: List[List[float]] = []
+    for line in futures:
+        blocks = [future.result().content for future in line]
+        result.extend(sum(parts, []) for parts in zip(*blocks))
+    return result
+
+
+def measure(func: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Fork/join blocked Matrix multiplication on ThreadPool"
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[128, 256])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--leaf", type=int, default=32)
+    args = parser.parse_args()
+
+    print(
+        f"{'size':>6} {'serial, s':>10} {'shared queue, s':>16} "
+        f"{'work stealing, s':>17} {'tasks':>7}"
+    )
+    for size in args.sizes:
+        rows = random_rows(size)
+        columns = random_rows(size)
+        expected = multiply_block(rows, columns).content
+        serial = measure(lambda: multiply_block(rows, columns))
+
+        results: List[List[List[float]]] = []
+        pool = ThreadPool(args.workers)
+        shared_queue = measure(
+            lambda: results.append(flat(pool, rows, columns, args.leaf))
+        )
+        pool.dispose()
+
+        pool = ThreadPool(args.workers, work_stealing=True)
+        stealing = measure(
+            lambda: results.append(
+                pool.enqueue(fork_join, args=[pool, rows, columns, args.leaf]).result()
+            )
+        )
+        pool.dispose()
+        for result in results:
+            assert all(
+                abs(x - y) < 1e-9
+                for row, expected_row in zip(result, expected)
+                for x, y in zip(row, expected_row)
+            ), "the blocked product is wrong"
+
+        tasks = 2 * (size // args.leaf) ** 2 - 1
+        print(
+            f"{size:>6} {serial:>10.3f} {shared_queue:>16.3f} {stealing:>17.3f} "
+            f"{tasks:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+import pytest
+from project.backend import BACKENDS, numpy_available
+
+
+@pytest.fixture(
+    params=[backend for backend in BACKENDS if backend == "python" or numpy_available()]
+)
+def backend(request):
+    """
+    Runs the test once for every backend available here ("numpy" only if NumPy is installed).
+    """
+    return request.param
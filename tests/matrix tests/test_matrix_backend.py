@@ -0,0 +1,46 @@
+import pytest
+from project import backend
+from project.matrix import Matrix
+
+
+def test_python_backend_matches_expected_results():
+    matrix1 = Matrix([[1, 2], [3, 4]])
+    matrix2 = Matrix([[5, 6], [7, 8]])
+    assert matrix1.add(matrix2, backend="python").content == [[6, 8], [10, 12]]
+    assert matrix1.multiply(matrix2, backend="python").content == [[19, 22], [43, 50]]
+    assert matrix1.trans(backend="python").content == [[1, 3], [2, 4]]
+
+
+def test_numpy_backend_matches_python_backend():
+    pytest.importorskip("numpy")
+    matrix1 = Matrix([[1, 2, 3], [4, 5, 6]])
+    matrix2 = Matrix([[1, 2], [3, 4], [5, 6]])
+    for operation in (
+        lambda b: matrix1.add(matrix1, backend=b),
+        lambda b: matrix1.multiply(matrix2, backend=b),
+        lambda b: matrix1.trans(backend=b),
+    ):
+        assert (
+            operation("numpy").content == operation("python").content
+        ), "Результаты numpy и python должны совпадать"
+
+
+def test_set_backend():
+    previous = backend.get_backend()
+    try:
+        backend.set_backend("python")
+        assert backend.get_backend() == "python", "Глобальный бэкенд должен меняться"
+        assert (Matrix([[1]]) * Matrix([[2]])).content == [[2]]
+    finally:
+        backend.set_backend(previous)
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError, match="Unknown backend"):
+        Matrix([[1]]).trans(backend="fortran")
+
+
+def test_numpy_backend_without_numpy(monkeypatch):
+    monkeypatch.setattr(backend, "numpy", None)
+    with pytest.raises(Exception, match="NumPy backend is not available"):
+        Matrix([[1]]).trans(backend="numpy")
@@ -0,0 +1,56 @@
+import pytest
+from project.matrix import Matrix, _chain_order
+
+
+def test_lazy_expression_matches_eager_evaluation():
+    a = Matrix([[1, 2], [3, 4]])
+    b = Matrix([[0, 1], [1, 0]])
+    c = Matrix([[2, 0], [1, 3]])
+    d = Matrix([[1, 1], [1, 1]])
+    expression = (a.lazy() + b) * c.trans() + d
+    assert expression.evaluate().content == ((a + b) * c.trans() + d).content
+    assert expression.evaluate(backend="python").content == [[3, 11], [9, 17]]
+
+
+def test_lazy_expression_does_not_compute_until_evaluated():
+    a = Matrix([[1, 2], [3, 4]])
+    expression = a.lazy() + a + a
+    assert expression.height == 2 and expression.width == 2
+    assert len(expression.terms) == 3, "Сложения должны объединяться в одну сумму"
+    assert expression.evaluate().content == [[3, 6], [9, 12]]
+
+
+def test_lazy_transposition_is_pushed_down():
+    a = Matrix([[1, 2, 3]])
+    b = Matrix([[1], [2], [3]])
+    expression = (a.lazy() * b * a).trans()
+    assert (
+        expression.evaluate().content == ((a.lazy() * b * a).evaluate()).trans().content
+    )
+
+
+def test_matrix_chain_order():
+    # (10x100) * (100x5) * (5x50): ((AB)C) costs 7500, (A(BC)) costs 75000
+    split = _chain_order([10, 100, 5, 50])
+    assert split[0][2] == 1, "Сначала должно вычисляться произведение AB"
+
+
+def test_lazy_rectangular_chain():
+    a = Matrix([[1, 2, 3], [4, 5, 6]])
+    b = Matrix([[1], [0], [1]])
+    c = Matrix([[1, 2, 3, 4]])
+    assert (a.lazy() * b * c).evaluate().content == [
+        [4, 8, 12, 16],
+        [10, 20, 30, 40],
+    ]
+
+
+def test_lazy_expression_shape_errors():
+    a = Matrix([[1, 2]])
+    with pytest.raises(
+        Exception,
+        match="In order to find the sum of two matrices they must be the same size",
+    ):
+        a.lazy() + a.trans()
+    with pytest.raises(Exception, match="Matrix dimensions not fit for multiplication"):
+        a.lazy() * a
@@ -0,0 +1,56 @@
+import pytest
+from project import matrix
+from project.matrix import Matrix, MappedMatrix
+
+
+def test_matrix_file_round_trip(tmp_path):
+    path = str(tmp_path / "matrix.bin")
+    Matrix([[1, 2, 3], [4, 5, 6]]).to_file(path)
+    assert Matrix.from_file(path).content == [[1, 2, 3], [4, 5, 6]]
+    with open(path, "rb") as file:
+        assert file.read(4) == b"MTRX", "Файл должен начинаться с заголовка"
+
+
+def test_matrix_file_of_transposition_view(tmp_path):
+    path = str(tmp_path / "matrix.bin")
+    Matrix([[1, 2, 3], [4, 5, 6]]).trans().to_file(path)
+    assert Matrix.from_file(path).content == [[1, 4], [2, 5], [3, 6]]
+
+
+def test_invalid_matrix_file(tmp_path):
+    path = tmp_path / "matrix.bin"
+    path.write_bytes(b"not a matrix file at all")
+    with pytest.raises(Exception, match="File is not a matrix file"):
+        Matrix.from_file(str(path))
+
+
+def test_mapped_matrix_access(tmp_path):
+    path = str(tmp_path / "matrix.bin")
+    Matrix([[1, 2], [3, 4]]).to_file(path)
+    with MappedMatrix.open(path, writable=True) as mapped:
+        assert mapped[1, 0] == 3
+        mapped[1, 0] = 7
+    assert Matrix.from_file(path).content == [[1, 2], [7, 4]], "Изменения в файле"
+
+
+def test_mapped_matrix_transposition_and_multiplication(tmp_path, monkeypatch):
+    monkeypatch.setattr(matrix, "FILE_BLOCK_SIZE", 2)
+    left = Matrix([[i * 5 + j for j in range(5)] for i in range(3)])
+    right = Matrix([[(i + j) % 4 for j in range(4)] for i in range(5)])
+    left.to_file(str(tmp_path / "left.bin"))
+    right.to_file(str(tmp_path / "right.bin"))
+    with MappedMatrix.open(str(tmp_path / "left.bin")) as a, MappedMatrix.open(
+        str(tmp_path / "right.bin")
+    ) as b:
+        with a.trans(str(tmp_path / "trans.bin")) as transposed:
+            assert transposed.to_matrix().content == left.trans().content
+        with a.multiply(b, str(tmp_path / "product.bin")) as product:
+            assert (
+                product.to_matrix().content
+                == left.multiply(right, backend="python").content
+            )
+            assert product.read_rows(1, 2).content == [product.to_matrix().content[1]]
+        with pytest.raises(
+            Exception, match="Matrix dimensions not fit for multiplication"
+        ):
+            a.multiply(a, str(tmp_path / "error.bin"))
@@ -0,0 +1,70 @@
+import pytest
+from project.matrix import Matrix
+
+
+def test_add_into_output(backend):
+    matrix1 = Matrix([[1, 2], [3, 4]])
+    out = Matrix([[0, 0], [0, 0]])
+    storage = out._data
+    result = matrix1.add(Matrix([[5, 6], [7, 8]]), backend=backend, out=out)
+    assert result is out, "Результат должен быть записан в out"
+    assert out._data is storage, "Хранилище out не должно пересоздаваться"
+    assert out.content == [[6, 8], [10, 12]]
+
+
+def test_multiply_and_transpose_into_output(backend):
+    matrix1 = Matrix([[1, 2], [3, 4]])
+    matrix2 = Matrix([[5, 6], [7, 8]])
+    out = Matrix([[0, 0], [0, 0]])
+    matrix1.multiply(matrix2, backend=backend, out=out)
+    assert out.content == [[19, 22], [43, 50]]
+    matrix1.trans(backend=backend, out=out)
+    assert out.content == [[1, 3], [2, 4]]
+    matrix1.multiply(matrix2, backend=backend, out=matrix1)
+    assert matrix1.content == [[19, 22], [43, 50]], "out может совпадать с операндом"
+
+
+@pytest.mark.parametrize("algorithm", ["naive", "blocked"])
+def test_python_kernels_write_into_output(monkeypatch, algorithm):
+    result = Matrix._result
+
+    def copy_forbidden(data, height, width, out):
+        assert out is None, "Ядро должно писать прямо в out, без промежуточной копии"
+        return result(data, height, width, out)
+
+    monkeypatch.setattr(Matrix, "_result", staticmethod(copy_forbidden))
+    matrix1 = Matrix([[1, 2, 3], [4, 5, 6]])
+    matrix2 = Matrix([[1, 0], [0, 1], [1, 1]])
+    out = Matrix([[0, 0], [0, 0]])
+    storage = out._data
+    matrix1.multiply(matrix2, backend="python", algorithm=algorithm, out=out)
+    assert out.content == [[4, 5], [10, 11]] and out._data is storage
+    out.add(out, backend="python", out=out)
+    out.scale(0.5, backend="python", out=out)
+    assert out.content == [[4, 5], [10, 11]] and out._data is storage
+    transposed = Matrix([[0, 0], [0, 0], [0, 0]])
+    matrix1.trans(backend="python", out=transposed)
+    assert transposed.content == [[1, 4], [2, 5], [3, 6]]
+
+
+def test_inplace_operators():
+    matrix = Matrix([[1, 2], [3, 4]])
+    storage = matrix._data
+    matrix += Matrix([[1, 1], [1, 1]])
+    matrix *= 2
+    assert matrix._data is storage, "Операции должны выполняться на месте"
+    assert matrix.content == [[4, 6], [8, 10]]
+
+
+def test_inplace_add_does_not_change_transposition_view():
+    matrix = Matrix([[1, 2], [3, 4]])
+    view = matrix.trans()
+    matrix += matrix
+    assert view.content == [[1, 3], [2, 4]], "Представление не должно измениться"
+    assert matrix.content == [[2, 4], [6, 8]]
+
+
+def test_output_with_wrong_size():
+    matrix = Matrix([[1, 2], [3, 4]])
+    with pytest.raises(Exception, match="Output matrix must be of size 2x2"):
+        matrix.add(matrix, out=Matrix([[0]]))
@@ -0,0 +1,119 @@
+import random
+from array import array
+import pytest
+from project import linalg
+from project.matrix import Matrix
+from project.vector import Vector
+
+
+def random_matrix(size, seed=1):
+    generator = random.Random(seed)
+    return Matrix(
+        [[generator.uniform(-1, 1) for _ in range(size)] for _ in range(size)]
+    )
+
+
+def assert_close(actual, expected):
+    for row, expected_row in zip(actual, expected):
+        assert row == pytest.approx(expected_row, abs=1e-9)
+
+
+def test_lu_factors():
+    matrix = Matrix([[1, 2, 3], [4, 5, 6], [7, 8, 10]])
+    factorization = linalg.lu(matrix)
+    assert factorization.permutation[0] == 2, "Главный элемент должен быть наибольшим"
+    product = factorization.lower * factorization.upper
+    permuted = [matrix.content[p] for p in factorization.permutation]
+    assert_close(product.content, permuted)
+    assert linalg.det(matrix) == pytest.approx(-3)
+
+
+def test_solve_vector_and_many_right_hand_sides():
+    matrix = random_matrix(8)
+    x = Vector([i - 3 for i in range(8)])
+    b = matrix.matvec(x)
+    assert linalg.solve(matrix, b).coordinates.tolist() == pytest.approx(
+        x.coordinates.tolist()
+    )
+    rhs = random_matrix(8, seed=2)
+    solution = linalg.solve(matrix, rhs)
+    assert_close(matrix.multiply(solution, backend="python").content, rhs.content)
+
+
+def test_inverse():
+    matrix = random_matrix(6)
+    identity = [[float(i == j) for j in range(6)] for i in range(6)]
+    assert_close(
+        matrix.multiply(linalg.inv(matrix), backend="python").content, identity
+    )
+
+
+def test_factorization_cache():
+    matrix = Matrix([[2, 1], [1, 3]])
+    factorization = linalg.lu(matrix)
+    assert linalg.lu(matrix) is factorization, "Разложение должно кэшироваться"
+    assert linalg.lu(matrix, cache=False) is factorization
+    matrix[0, 0] = 4
+    assert linalg.lu(matrix) is not factorization, "Кэш сбрасывается при изменении"
+    assert linalg.det(matrix) == pytest.approx(11)
+    other = Matrix([[2, 1], [1, 3]])
+    assert linalg.lu(other, cache=False) is not linalg.lu(other, cache=False)
+
+
+def test_cholesky():
+    matrix = Matrix([[4, 2, 2], [2, 5, 3], [2, 3, 6]])
+    factorization = linalg.cholesky(matrix)
+    lower = factorization.lower
+    assert_close((lower * lower.trans()).content, matrix.content)
+    assert factorization.det() == pytest.approx(linalg.det(matrix))
+    b = Vector([1, 2, 3])
+    assert factorization.solve(b).coordinates.tolist() == pytest.approx(
+        linalg.solve(matrix, b).coordinates.tolist()
+    )
+    with pytest.raises(Exception, match="Matrix is not positive definite"):
+        linalg.cholesky(Matrix([[1, 2], [2, 1]]))
+
+
+def test_solve_triangular():
+    lower = Matrix([[2, 0], [1, 4]])
+    assert linalg.solve_triangular(lower, Vector([2, 9])).coordinates.tolist() == [1, 2]
+    upper = lower.trans()
+    assert linalg.solve_triangular(
+        upper, Vector([4, 8]), lower=False
+    ).coordinates.tolist() == [1, 2]
+    assert linalg.solve_triangular(
+        lower, Vector([1, 5]), unit_diagonal=True
+    ).coordinates.tolist() == [1, 4]
+
+
+def test_singular_and_non_square_matrices():
+    singular = Matrix([[1, 2], [2, 4]])
+    with pytest.raises(Exception, match="Matrix is singular"):
+        linalg.solve(singular, Vector([1, 1]))
+    assert linalg.det(singular) == 0
+    with pytest.raises(Exception, match="Matrix must be square"):
+        linalg.det(Matrix([[1, 2, 3], [4, 5, 6]]))
+    with pytest.raises(Exception, match="Matrix is singular"):
+        linalg.solve_triangular(Matrix([[0, 0], [1, 1]]), Vector([1, 1]))
+
+
+def test_factorization_det():
+    triangle = linalg.Factorization(
+        [array("d"), array("d", [1])],
+        None,
+        [array("d", [3]), array("d")],
+        array("d", [2, 4]),
+    )
+    assert triangle.det() == 8, "Единичная диагональ L не меняет определитель"
+    swapped = linalg.Factorization(
+        [array("d"), array("d", [0]), array("d", [0, 0])],
+        array("d", [1, 2, 1]),
+        [array("d", [0, 0]), array("d", [0]), array("d")],
+        array("d", [3, 1, 5]),
+        permutation=[1, 2, 0],
+    )
+    assert swapped.det() == 30, "Цикл длины 3 — чётная перестановка"
+    matrix = random_matrix(6, seed=3)
+    assert linalg.Factorization.det(linalg.lu(matrix)) == pytest.approx(
+        linalg.lu(matrix).det()
+    )
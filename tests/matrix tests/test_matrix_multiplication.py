@@ -24,6 +24,33 @@ def test_matrix_multiplication_with_identity_matrix():
 
 def test_matrix_multiplication_with_incompatible_matrices():
     matrix1 = Matrix([[1, 2], [3, 4]])
-    matrix3 = Matrix([[1, 2, 3], [4, 5, 6]])
+    matrix3 = Matrix([[1, 2], [3, 4], [5, 6]])
     with pytest.raises(Exception, match="Matrix dimensions not fit for multiplication"):
         matrix1 * matrix3
+
+
+def test_matrix_multiplication_with_rectangular_matrices():
+    matrix1 = Matrix([[1, 2, 3], [4, 5, 6]])
+    column = Matrix([[1], [0], [-1]])
+    assert (matrix1 * column).content == [
+        [-2],
+        [-2],
+    ], "Произведение (2x3)·(3x1) должно быть матрицей 2x1"
+    square = Matrix([[1, 2], [3, 4]])
+    assert (square * matrix1).content == [
+        [9, 12, 15],
+        [19, 26, 33],
+    ], "Произведение (2x2)·(2x3) должно быть матрицей 2x3"
+
+
+def test_matrix_multiplication_across_blocks():
+    left = [[i * 3 + k for k in range(3)] for i in range(70)]
+    right = [[k * 70 + j for j in range(70)] for k in range(3)]
+    result = Matrix(left) * Matrix(right)
+    expected = [
+        [sum(left[i][k] * right[k][j] for k in range(3)) for j in range(70)]
+        for i in range(70)
+    ]
+    assert (
+        result.content == expected
+    ), "Умножение больших матриц должно совпадать с наивным алгоритмом"
@@ -0,0 +1,37 @@
+import pytest
+from project import matrix
+from project.matrix import Matrix, choose_algorithm
+
+
+@pytest.mark.parametrize("size", [1, 4, 7, 10])
+def test_algorithms_give_same_result(monkeypatch, size):
+    monkeypatch.setattr(matrix, "STRASSEN_CUTOFF", 2)
+    left = Matrix([[(i * size + j) % 7 for j in range(size)] for i in range(size)])
+    right = Matrix([[(i - j) % 5 for j in range(size)] for i in range(size)])
+    expected = left.multiply(right, backend="python", algorithm="naive").content
+    for algorithm in ("blocked", "strassen", "auto"):
+        result = left.multiply(right, backend="python", algorithm=algorithm)
+        assert (
+            result.content == expected
+        ), f"Алгоритм {algorithm} дал неверный результат"
+
+
+def test_strassen_with_rectangular_matrices(monkeypatch):
+    monkeypatch.setattr(matrix, "STRASSEN_CUTOFF", 1)
+    left = Matrix([[1, 2, 3], [4, 5, 6]])
+    right = Matrix([[1, 2], [3, 4], [5, 6]])
+    result = left.multiply(right, backend="python", algorithm="strassen")
+    assert result.content == [[22, 28], [49, 64]]
+
+
+def test_choose_algorithm():
+    cutoff = matrix.STRASSEN_CUTOFF
+    assert choose_algorithm(8, 8, 8) == "naive"
+    assert choose_algorithm(200, 3, 200) == "blocked"
+    assert choose_algorithm(2 * cutoff, 2 * cutoff, 2 * cutoff) == "strassen"
+    assert choose_algorithm(2 * cutoff, 10 * cutoff, 2 * cutoff) == "blocked"
+
+
+def test_unknown_algorithm(backend):
+    with pytest.raises(ValueError, match="Unknown algorithm"):
+        Matrix([[1]]).multiply(Matrix([[1]]), backend=backend, algorithm="magic")
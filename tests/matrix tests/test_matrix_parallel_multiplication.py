@@ -0,0 +1,34 @@
+import pytest
+from project import matrix
+from project.matrix import Matrix
+
+
+def test_parallel_multiplication(monkeypatch):
+    monkeypatch.setattr(matrix, "PARALLEL_THRESHOLD", 0)
+    left = Matrix([[i + j for j in range(3)] for i in range(5)])
+    right = Matrix([[i * j for j in range(5)] for i in range(3)])
+    expected = left.multiply(right, backend="python")
+    result = left.multiply(right, backend="python", workers=2)
+    assert (
+        result.content == expected.content
+    ), "Параллельное умножение должно совпадать с последовательным"
+    assert not right._shared, "Правый операнд не должен стать разделяемым"
+
+
+def test_small_products_stay_serial(monkeypatch):
+    def fail(*args):
+        raise AssertionError("small products must not start worker processes")
+
+    monkeypatch.setattr(matrix, "_multiply_parallel", fail)
+    result = Matrix([[1, 2], [3, 4]]).multiply(
+        Matrix([[5, 6], [7, 8]]), backend="python", workers=4
+    )
+    assert result.content == [[19, 22], [43, 50]]
+
+
+def test_workers_require_python_backend():
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError, match="python backend"):
+        Matrix([[1, 2], [3, 4]]).multiply(
+            Matrix([[5, 6], [7, 8]]), backend="numpy", workers=2
+        )
@@ -0,0 +1,28 @@
+import pytest
+from project.matrix import Matrix
+
+
+def test_matrix_storage_is_flat():
+    matrix = Matrix([[1, 2, 3], [4, 5, 6]])
+    assert matrix._data.typecode == "d", "Элементы должны храниться в array('d')"
+    assert matrix._data.itemsize == 8, "Каждый элемент должен занимать 8 байт"
+    assert matrix._data.tolist() == [1, 2, 3, 4, 5, 6], "Хранение построчное"
+
+
+def test_matrix_creation_does_not_change_argument():
+    rows = [[1], [2, 3]]
+    Matrix(rows)
+    assert rows == [[1], [2, 3]], "Исходный список не должен изменяться"
+
+
+def test_matrix_item_access():
+    matrix = Matrix([[1, 2], [3, 4]])
+    matrix[1, 0] = 7
+    assert matrix[1, 0] == 7, "Элемент должен быть изменен"
+    assert matrix.content == [[1, 2], [7, 4]], "Изменение должно отражаться в content"
+
+
+def test_matrix_item_access_out_of_range():
+    matrix = Matrix([[1, 2], [3, 4]])
+    with pytest.raises(IndexError, match="Matrix index out of range"):
+        matrix[2, 0]
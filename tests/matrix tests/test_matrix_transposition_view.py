@@ -0,0 +1,33 @@
+from project.matrix import Matrix
+
+
+def test_transposition_shares_storage():
+    matrix = Matrix([[1, 2, 3], [4, 5, 6]])
+    result = matrix.trans()
+    assert result._data is matrix._data, "Транспонирование не должно копировать данные"
+    assert result[2, 1] == 6, "Элементы представления должны быть транспонированы"
+
+
+def test_transposition_view_copy_on_write():
+    matrix = Matrix([[1, 2], [3, 4]])
+    result = matrix.trans()
+    result[0, 1] = 10
+    assert result.content == [[1, 10], [2, 4]], "Представление должно измениться"
+    assert matrix.content == [[1, 2], [3, 4]], "Исходная матрица не должна измениться"
+    matrix[1, 1] = 0
+    assert result.content == [[1, 10], [2, 4]], "Представление не должно измениться"
+
+
+def test_transposition_view_copy():
+    matrix = Matrix([[1, 2, 3], [4, 5, 6]])
+    result = matrix.trans().copy()
+    assert result._data is not matrix._data, "copy() должен создавать новое хранилище"
+    assert result._data.tolist() == [1, 4, 2, 5, 3, 6], "Копия должна быть построчной"
+
+
+def test_operations_with_transposition_views():
+    matrix1 = Matrix([[1, 2], [3, 4]])
+    matrix2 = Matrix([[5, 6], [7, 8]])
+    assert (matrix1 * matrix2.trans()).content == [[17, 23], [39, 53]]
+    assert (matrix1.trans() + matrix2).content == [[6, 9], [9, 12]]
+    assert matrix1.trans().trans().content == [[1, 2], [3, 4]]
@@ -0,0 +1,52 @@
+import pytest
+from project.matrix import Matrix
+from project.vector import FrozenVector, Vector
+
+MATRIX = [[1, 2, 3], [4, 5, 6]]
+
+
+def test_matvec_and_vecmat(backend):
+    matrix = Matrix(MATRIX)
+    assert matrix.matvec(Vector([1, 0, -1]), backend).coordinates.tolist() == [-2, -2]
+    assert matrix.vecmat(Vector([1, 2]), backend).coordinates.tolist() == [9, 12, 15]
+    transposed = matrix.trans()
+    assert transposed.matvec(Vector([1, 2]), backend).coordinates.tolist() == [
+        9,
+        12,
+        15,
+    ], "Умножение транспонированного представления"
+    assert transposed.vecmat(
+        FrozenVector([1, 0, -1]), backend
+    ).coordinates.tolist() == [
+        -2,
+        -2,
+    ]
+
+
+def test_matvec_out(backend):
+    matrix = Matrix([[2, 0], [0, 3]])
+    vector = Vector([1, 1], cache_norm=True)
+    vector.length()
+    for _ in range(3):
+        assert matrix.matvec(vector, backend, out=vector) is vector
+    assert vector.coordinates.tolist() == [8, 27], "Результат в тот же вектор"
+    assert vector.length() == pytest.approx((8**2 + 27**2) ** 0.5)
+    with pytest.raises(Exception, match="Output vector must be of size 2"):
+        matrix.matvec(vector, backend, out=Vector([0]))
+
+
+def test_matrix_vector_operators():
+    matrix = Matrix(MATRIX)
+    assert (matrix * Vector([1, 1, 1])).coordinates.tolist() == [6, 15]
+    assert (Vector([1, 1]) * matrix).coordinates.tolist() == [5, 7, 9]
+    with pytest.raises(Exception, match="Matrix dimensions not fit for multiplication"):
+        matrix * Vector([1, 1])
+    with pytest.raises(Exception, match="Matrix dimensions not fit for multiplication"):
+        matrix.vecmat(Vector([1, 1, 1]))
+
+
+def test_outer_product(backend):
+    result = Vector.outer(Vector([1, 2]), Vector([3, 4, 5]), backend)
+    assert (result.height, result.width) == (2, 3)
+    assert result.content == [[3, 4, 5], [6, 8, 10]], "Неверное внешнее произведение"
+    assert Vector.outer(Vector([]), Vector([1]), backend).content == []
@@ -0,0 +1,67 @@
+import pytest
+from project.matrix import Matrix, CSRMatrix, COOMatrix
+
+
+def test_csr_creation():
+    matrix = CSRMatrix([[0, 2, 0], [0, 0, 0], [3, 0, 4]])
+    assert list(matrix.indptr) == [0, 1, 1, 3], "Неверные смещения строк"
+    assert list(matrix.indices) == [1, 0, 2], "Неверные индексы столбцов"
+    assert list(matrix.values) == [2, 3, 4], "Неверные значения"
+    assert matrix[2, 2] == 4 and matrix[1, 1] == 0, "Неверный доступ к элементам"
+
+
+def test_coo_to_csr_sums_duplicates():
+    coo = COOMatrix(2, 3)
+    coo.insert(1, 2, 5)
+    coo.insert(0, 1, 1)
+    coo.insert(1, 2, 2)
+    coo.insert(0, 0, 0)
+    assert coo.nnz == 3, "Нули не должны храниться"
+    assert coo.to_csr().content == [
+        [0, 1, 0],
+        [0, 0, 7],
+    ], "Повторы должны суммироваться"
+    assert coo.to_matrix().content == [[0, 1, 0], [0, 0, 7]]
+
+
+def test_conversion_to_and_from_matrix():
+    dense = Matrix([[1, 0], [0, 0], [0, 5]])
+    sparse = CSRMatrix.from_matrix(dense)
+    assert sparse.nnz == 2, "Должны храниться только ненулевые элементы"
+    assert sparse.to_matrix().content == dense.content
+    assert sparse.to_coo().to_csr().content == dense.content
+
+
+def test_sparse_addition():
+    matrix1 = CSRMatrix([[1, 0], [0, 2]])
+    matrix2 = CSRMatrix([[0, 3], [0, -2]])
+    result = matrix1 + matrix2
+    assert result.content == [[1, 3], [0, 0]], "Неверный результат сложения"
+    assert result.nnz == 2, "Сократившиеся элементы не должны храниться"
+
+
+def test_sparse_addition_with_different_size():
+    with pytest.raises(
+        Exception,
+        match="In order to find the sum of two matrices they must be the same size",
+    ):
+        CSRMatrix([[1, 0]]) + CSRMatrix([[1], [0]])
+
+
+def test_sparse_multiplication():
+    left = [[1, 0, 2], [0, 3, 0]]
+    right = [[0, 1], [4, 0], [5, 0]]
+    expected = [[10, 1], [12, 0]]
+    assert (CSRMatrix(left) * CSRMatrix(right)).content == expected
+    assert (CSRMatrix(left) * Matrix(right)).content == expected
+    assert (Matrix(left) * CSRMatrix(right)).content == expected
+
+
+def test_sparse_multiplication_with_incompatible_matrices():
+    with pytest.raises(Exception, match="Matrix dimensions not fit for multiplication"):
+        CSRMatrix([[1, 2]]) * CSRMatrix([[1, 2]])
+
+
+def test_sparse_transposition():
+    matrix = CSRMatrix([[1, 0, 2], [0, 3, 0]])
+    assert matrix.trans().content == [[1, 0], [0, 3], [2, 0]]
@@ -0,0 +1,97 @@
+from array import array
+from project.thread_pool import ProcessPool, SharedBuffer
+import pytest
+import sys
+import time
+
+
+def square(x):
+    return x * x
+
+
+def add(x, y=0):
+    return x + y
+
+
+def fail():
+    raise ValueError("bad value")
+
+
+def total(data):
+    return sum(data), type(data).__name__
+
+
+def view_total(buffer):
+    view = buffer.view()
+    result = sum(view)
+    view.release()
+    return result
+
+
+def test_process_pool_result_and_exception():
+    pool = ProcessPool(2)
+    assert pool.get_processes_amount() == 2
+    assert pool.enqueue(add, args=[1], kwargs={"y": 2}).result(timeout=10) == 3
+    with pytest.raises(ValueError, match="bad value"):
+        pool.enqueue(fail).result(timeout=10)
+    pool.dispose(wait=True)
+
+
+def test_process_pool_unpicklable_task():
+    pool = ProcessPool(1)
+    future = pool.enqueue(lambda: 1)
+    assert (
+        future.exception(timeout=10) is not None
+    ), "Ошибка pickle должна попасть в Future"
+    assert pool.enqueue(square, args=[3]).result(timeout=10) == 9
+    pool.dispose(wait=True)
+
+
+def test_process_pool_batches_many_tasks():
+    pool = ProcessPool(2, batch_size=8)
+    assert list(pool.map(square, range(500), timeout=30)) == [x * x for x in range(500)]
+    assert pool.join(timeout=10), "Все задачи должны быть завершены"
+    pool.dispose(wait=True)
+
+
+def test_process_pool_shares_large_arrays():
+    pool = ProcessPool(1, share_threshold=1024)
+    data = array("d", range(1000))
+    assert pool.enqueue(total, args=[data]).result(timeout=10) == (499500.0, "array")
+    buffer = SharedBuffer(array("d", [1.0, 2.0, 3.5]))
+    assert pool.enqueue(view_total, args=[buffer]).result(timeout=10) == 6.5
+    assert buffer.to_array() == array("d", [1.0, 2.0, 3.5])
+    buffer.close()
+    pool.dispose(wait=True)
+
+
+def test_process_pool_dispose():
+    pool = ProcessPool(2)
+    future = pool.enqueue(time.sleep, args=[0.1])
+    pool.dispose()
+    with pytest.raises(Exception, match="disposed"):
+        pool.enqueue(square, args=[1])
+    assert future.result(timeout=10) is None, "Начатые задачи должны завершиться"
+    pool._collector.join(timeout=10)
+    assert not any(process.is_alive() for process in pool._processes)
+
+
+def test_process_pool_callback_enqueues():
+    pool = ProcessPool(1)
+    chained = []
+    future = pool.enqueue(square, args=[2])
+    future.add_done_callback(
+        lambda _: chained.append(pool.enqueue(add, args=[3], kwargs={"y": 4}))
+    )
+    assert future.result(timeout=10) == 4
+    assert pool.join(timeout=10), "Колбэк не должен блокировать пул"
+    assert chained[0].result(timeout=10) == 7
+    pool.dispose(wait=True)
+
+
+def test_process_pool_base_exception():
+    pool = ProcessPool(1)
+    with pytest.raises(SystemExit):
+        pool.enqueue(sys.exit, args=[3]).result(timeout=10)
+    assert pool.enqueue(square, args=[5]).result(timeout=10) == 25
+    pool.dispose(wait=True)
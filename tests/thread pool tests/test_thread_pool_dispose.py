@@ -1,5 +1,6 @@
 from project.thread_pool import ThreadPool
 import pytest
+import threading
 
 
 def test_dispose():
@@ -28,3 +29,19 @@ def test_dispose_clears_task_queue():
     pool = ThreadPool(2)
     pool.dispose()
     assert not hasattr(pool, "_task_queue"), "Очередь задач не очищена после dispose()"
+
+
+def test_dispose_during_tasks_stops_workers(monkeypatch):
+    errors = []
+    monkeypatch.setattr(threading, "excepthook", errors.append)
+    event = threading.Event()
+    pool = ThreadPool(2)
+    pool.enqueue(event.wait)
+    pool.enqueue(event.wait)
+    threads = list(pool._threads)
+    pool.dispose()
+    event.set()
+    for thread in threads:
+        thread.join(timeout=5)
+        assert not thread.is_alive(), "Поток не завершился после dispose()"
+    assert errors == [], "Поток не должен обращаться к удаленной очереди"
@@ -58,3 +58,20 @@ def test_parallel_execution():
     end_time = time.time()
     total_time = end_time - start_time
     assert total_time < 2, "Задачи не выполнялись параллельно"
+
+
+def test_workers_are_reused():
+    import threading
+
+    def failing_task():
+        raise RuntimeError("task failed")
+
+    pool = ThreadPool(1)
+    first = pool.enqueue(threading.current_thread)
+    failed = pool.enqueue(failing_task)
+    last = pool.enqueue(threading.current_thread)
+    pool.join()
+    assert isinstance(
+        failed.exception(), RuntimeError
+    ), "Ошибка должна попасть в Future"
+    assert first.result() is last.result(), "Задачи должны выполняться одним потоком"
@@ -0,0 +1,69 @@
+from project.thread_pool import ThreadPool, as_completed
+import pytest
+import sys
+import threading
+import time
+
+
+def test_future_result():
+    pool = ThreadPool(2)
+    future = pool.enqueue(lambda x, y=0: x + y, args=(1,), kwargs={"y": 2})
+    assert future.result(timeout=5) == 3, "Future должен вернуть результат задачи"
+    assert future.done()
+    assert future.exception() is None
+
+
+def test_future_exception_and_timeout():
+    event = threading.Event()
+
+    def failing_task():
+        event.wait()
+        raise ValueError("bad value")
+
+    pool = ThreadPool(1)
+    future = pool.enqueue(failing_task)
+    assert not future.done()
+    with pytest.raises(TimeoutError):
+        future.result(timeout=0.05)
+    event.set()
+    with pytest.raises(ValueError, match="bad value"):
+        future.result(timeout=5)
+    assert isinstance(future.exception(), ValueError)
+
+
+def test_done_callbacks():
+    called = []
+    pool = ThreadPool(1)
+    future = pool.enqueue(time.sleep, args=(0.05,))
+    future.add_done_callback(lambda f: called.append(f))
+    pool.join()
+    future.add_done_callback(lambda f: called.append(f))
+    assert called == [future, future], "Колбэки должны вызываться после завершения"
+
+
+def test_map_keeps_order():
+    pool = ThreadPool(4)
+    results = pool.map(lambda x: (time.sleep(0.01 * (5 - x)), x * x)[1], range(5))
+    assert list(results) == [0, 1, 4, 9, 16], "map должен сохранять порядок"
+
+
+def test_as_completed_yields_finished_first():
+    pool = ThreadPool(2)
+    slow = pool.enqueue(time.sleep, args=(0.3,))
+    fast = pool.enqueue(lambda: "fast")
+    assert list(as_completed([slow, fast], timeout=5)) == [fast, slow]
+    blocked = pool.enqueue(threading.Event().wait, args=(0.5,))
+    with pytest.raises(TimeoutError):
+        list(as_completed([blocked], timeout=0.05))
+
+
+def test_base_exception_keeps_worker():
+    pool = ThreadPool(1)
+    future = pool.enqueue(sys.exit, args=[3])
+    with pytest.raises(SystemExit):
+        future.result(timeout=5)
+    assert (
+        pool.enqueue(lambda: 5).result(timeout=5) == 5
+    ), "Поток должен продолжить работу"
+    assert pool._threads[0].is_alive()
+    pool.dispose(wait=True)
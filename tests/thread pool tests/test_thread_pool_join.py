@@ -0,0 +1,33 @@
+from project.thread_pool import ThreadPool
+import threading
+import time
+
+
+def test_join_timeout():
+    event = threading.Event()
+    pool = ThreadPool(1)
+    pool.enqueue(event.wait)
+    start_time = time.time()
+    assert not pool.join(timeout=0.2), "join должен вернуть False по таймауту"
+    assert time.time() - start_time < 1
+    event.set()
+    assert pool.join(timeout=5), "join должен вернуть True после завершения задач"
+    assert pool.join(), "Повторный join без задач должен сразу вернуть True"
+
+
+def test_join_does_not_spin():
+    pool = ThreadPool(1)
+    pool.enqueue(time.sleep, args=(0.5,))
+    start = time.process_time()
+    pool.join()
+    assert time.process_time() - start < 0.2, "join не должен нагружать процессор"
+
+
+def test_dispose_wait():
+    result = []
+    pool = ThreadPool(2)
+    for i in range(4):
+        pool.enqueue(lambda x: (time.sleep(0.05), result.append(x)), args=(i,))
+    pool.dispose(wait=True)
+    assert sorted(result) == [0, 1, 2, 3], "dispose(wait=True) должен дождаться задач"
+    assert not hasattr(pool, "_threads"), "Пул должен быть очищен после задач"
@@ -28,3 +28,39 @@ def test_task_queue_order():
     # Ожидаем завершения задач
     pool.join()
     assert result == [0, 1, 2, 3, 4], "Задачи не были выполнены в порядке добавления"
+
+
+def test_task_queue_order_with_many_producers():
+    import threading
+
+    results = {number: [] for number in range(4)}
+    pool = ThreadPool(1)
+
+    def produce(number):
+        for i in range(500):
+            pool.enqueue(results[number].append, args=(i,))
+
+    producers = [threading.Thread(target=produce, args=(n,)) for n in range(4)]
+    for producer in producers:
+        producer.start()
+    for producer in producers:
+        producer.join()
+    assert pool.join(timeout=10)
+    for result in results.values():
+        assert result == list(range(500)), "Порядок задач производителя нарушен"
+
+
+def test_task_queue_is_fifo():
+    import queue
+    from project.thread_pool import _TaskQueue
+
+    task_queue = _TaskQueue()
+    for i in range(3):
+        task_queue.put(i)
+    assert len(task_queue) == 3
+    assert [task_queue.get() for _ in range(3)] == [0, 1, 2], "Очередь должна быть FIFO"
+    try:
+        task_queue.get(block=False)
+        assert False, "Пустая очередь должна бросать queue.Empty"
+    except queue.Empty:
+        pass
@@ -0,0 +1,95 @@
+from project.thread_pool import ThreadPool
+import pytest
+import threading
+import time
+
+
+def wait_until(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "Условие не выполнено вовремя"
+        time.sleep(0.01)
+
+
+def test_scaling_arguments():
+    with pytest.raises(ValueError):
+        ThreadPool(2, min_threads=3)
+    with pytest.raises(ValueError):
+        ThreadPool(2, spawn_threshold=0)
+    with pytest.raises(ValueError):
+        ThreadPool(2, keepalive=0)
+
+
+def test_burst_grows_and_shrinks():
+    event = threading.Event()
+    pool = ThreadPool(4, min_threads=1, keepalive=0.05)
+    futures = [pool.enqueue(event.wait) for _ in range(8)]
+    stats = pool.get_stats()
+    assert stats["threads"] == 4, "Пул должен вырасти до максимума под нагрузкой"
+    assert stats["spawned"]["depth"] == 4
+    event.set()
+    assert pool.join(timeout=5)
+    wait_until(lambda: pool.get_stats()["threads"] == 1)
+    stats = pool.get_stats()
+    assert stats["retired"] == 3, "Простаивающие потоки должны завершаться"
+    assert stats["peak_threads"] == 4
+    assert [event[1] for event in stats["events"]].count("retire") == 3
+    assert all(future.result(timeout=5) for future in futures)
+    wait_until(lambda: sum(thread.is_alive() for thread in pool._threads) == 1)
+
+    futures = [pool.enqueue(time.sleep, args=[0.05]) for _ in range(4)]
+    assert pool.join(timeout=5), "Освобожденные слоты должны запускаться снова"
+    assert pool.get_stats()["threads"] >= 2
+    pool.dispose(wait=True)
+
+
+def test_spawn_threshold():
+    event = threading.Event()
+    pool = ThreadPool(4, spawn_threshold=3)
+    pool.enqueue(event.wait)
+    wait_until(lambda: pool.get_stats()["queued"] == 0)
+    pool.enqueue(event.wait)
+    pool.enqueue(event.wait)
+    assert pool.get_stats()["threads"] == 1, "Очередь короче порога не запускает поток"
+    pool.enqueue(event.wait)
+    assert pool.get_stats()["threads"] == 2
+    event.set()
+    assert pool.join(timeout=5)
+    pool.dispose()
+
+
+def test_spawn_on_wait_latency():
+    event = threading.Event()
+    pool = ThreadPool(2, spawn_threshold=100, max_wait=0.05)
+    pool.enqueue(event.wait)
+    wait_until(lambda: pool.get_stats()["queued"] == 0)
+    pool.enqueue(event.wait)
+    time.sleep(0.1)
+    pool.enqueue(event.wait)
+    stats = pool.get_stats()
+    assert stats["spawned"] == {
+        "depth": 1,
+        "latency": 1,
+    }, "Долгое ожидание запускает поток"
+    assert stats["events"][-1][1:] == ("spawn", "latency", 2)
+    event.set()
+    assert pool.join(timeout=5)
+    pool.dispose()
+
+
+def test_spawn_on_wait_latency_while_workers_are_blocked():
+    event = threading.Event()
+    pool = ThreadPool(3, spawn_threshold=100, max_wait=0.05)
+    blocking = pool.enqueue(event.wait)
+    wait_until(lambda: pool.get_stats()["queued"] == 0)
+    waiting = pool.enqueue(lambda: "done")
+    assert pool.get_stats()["threads"] == 1
+    assert waiting.result(timeout=5) == "done", "Задача не должна ждать занятый поток"
+    assert not blocking.done()
+    stats = pool.get_stats()
+    assert stats["threads"] == 2 and stats["spawned"]["latency"] == 1
+    event.set()
+    assert pool.join(timeout=5)
+    pool.dispose()
+    pool._monitor.join(timeout=5)
+    assert not pool._monitor.is_alive(), "Монитор должен завершиться после dispose()"
@@ -19,10 +19,17 @@ def test_thread_states():
     # Ожидаем завершения задач
     pool.join()
 
-    states_after = [thread.is_alive() for thread in pool._threads]
-    assert not any(
-        states_after
-    ), "Потоки не должны быть активными после завершения задач"
+    # Потоки не завершаются, а ждут следующих задач
+    states_after = [thread.busy for thread in pool._threads]
+    for _ in range(100):
+        if not any(states_after):
+            break
+        time.sleep(0.01)
+        states_after = [thread.busy for thread in pool._threads]
+    assert not any(states_after), "Потоки не должны быть заняты после завершения задач"
+    assert all(
+        thread.is_alive() for thread in pool._threads
+    ), "Потоки должны оставаться в пуле после завершения задач"
 
 
 def test_str_representation():
@@ -0,0 +1,45 @@
+from project.thread_pool import ThreadPool
+import threading
+
+
+def test_recursive_fork_join():
+    pool = ThreadPool(2, work_stealing=True)
+
+    def total(low, high):
+        if high - low <= 8:
+            return sum(range(low, high))
+        middle = (low + high) // 2
+        left = pool.enqueue(total, args=(low, middle))
+        right = pool.enqueue(total, args=(middle, high))
+        return left.result() + right.result()
+
+    future = pool.enqueue(total, args=(0, 1000))
+    assert future.result(timeout=10) == sum(range(1000)), "Неверный результат fork/join"
+    assert pool.join(timeout=10)
+
+
+def test_subtasks_go_to_local_deque():
+    pool = ThreadPool(1, work_stealing=True)
+    sizes = []
+
+    def parent():
+        children = [pool.enqueue(lambda x: x, args=(i,)) for i in range(3)]
+        sizes.append(len(threading.current_thread()._local))
+        sizes.append(len(pool._task_queue))
+        return [child.result() for child in children]
+
+    assert pool.enqueue(parent).result(timeout=10) == [0, 1, 2]
+    assert sizes == [3, 0], "Подзадачи должны попадать в дек рабочего потока"
+
+
+def test_idle_workers_steal():
+    pool = ThreadPool(2, work_stealing=True)
+    event = threading.Event()
+
+    def parent():
+        waiting = pool.enqueue(event.wait, args=(10,))
+        setting = pool.enqueue(event.set)
+        return waiting.result() and setting.result() is None
+
+    assert pool.enqueue(parent).result(timeout=10), "Задачи должны выполниться"
+    pool.dispose(wait=True)
@@ -0,0 +1,40 @@
+import math
+import pytest
+from project.vector import Vector
+
+
+def test_accurate_scalar_product_has_no_cancellation():
+    v1 = Vector([1e16, 1, -1e16])
+    v2 = Vector([1, 1, 1])
+    assert Vector.scalar_product(v1, v2, accurate=True) == 1.0, "Потеря точности"
+
+
+def test_accurate_length_does_not_overflow():
+    assert Vector([3e200, 4e200]).length(accurate=True) == pytest.approx(5e200)
+    assert Vector([3e-200, 4e-200]).length(accurate=True) == pytest.approx(5e-200)
+
+
+def test_accurate_length_replaces_cached_length():
+    vector = Vector([3e200, 4e200], cache_norm=True)
+    assert math.isinf(vector.length(backend="python"))
+    assert vector.length(accurate=True) == pytest.approx(5e200)
+    assert vector.length() == pytest.approx(5e200), "Точная длина должна попасть в кэш"
+
+
+@pytest.mark.parametrize("accurate", [False, True])
+def test_angle_of_nearly_parallel_vectors(accurate):
+    vector = Vector([0.1, 0.2, 0.3])
+    for scale in [3, 7, 1e-3, 1e5]:
+        other = Vector([scale * x for x in vector.coordinates])
+        assert Vector.get_angle(vector, other, "python", accurate) == pytest.approx(
+            0, abs=1e-5
+        )
+        opposite = Vector([-scale * x for x in vector.coordinates])
+        assert Vector.get_angle(vector, opposite, "python", accurate) == pytest.approx(
+            180, abs=1e-5
+        )
+
+
+def test_accurate_angle_of_zero_vector():
+    with pytest.raises(ZeroDivisionError):
+        Vector.get_angle(Vector([0, 0]), Vector([1, 1]), accurate=True)
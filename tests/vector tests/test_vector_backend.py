@@ -0,0 +1,23 @@
+import math
+import pytest
+from project.vector import Vector
+
+
+def test_numpy_backend_matches_python_backend():
+    pytest.importorskip("numpy")
+    vector1 = Vector([1, 2, 3])
+    vector2 = Vector([4, -5, 6])
+    assert Vector.scalar_product(vector1, vector2, "numpy") == Vector.scalar_product(
+        vector1, vector2, "python"
+    ), "Скалярные произведения должны совпадать"
+    assert math.isclose(vector1.length("numpy"), vector1.length("python"))
+    assert math.isclose(
+        Vector.get_angle(vector1, vector2, "numpy"),
+        Vector.get_angle(vector1, vector2, "python"),
+    ), "Углы должны совпадать"
+
+
+def test_numpy_backend_zero_vectors():
+    pytest.importorskip("numpy")
+    with pytest.raises(ZeroDivisionError):
+        Vector.get_angle(Vector([0, 0]), Vector([0, 0]), "numpy")
@@ -0,0 +1,51 @@
+import math
+import pytest
+from project.vector import Vector, VectorBatch
+
+
+def make_batch():
+    return VectorBatch([Vector([3, 4]), Vector([1, 0]), Vector([0, 2])])
+
+
+def test_batch_storage():
+    batch = make_batch()
+    assert len(batch) == 3 and batch.dimension == 2
+    assert batch._data.tolist() == [3, 4, 1, 0, 0, 2], "Векторы хранятся подряд"
+    assert batch[2].coordinates.tolist() == [0, 2]
+
+
+def test_batch_norms_and_dots(backend):
+    batch = make_batch()
+    assert list(batch.norms(backend)) == [5, 1, 2]
+    assert list(batch.dot(Vector([1, 1]), backend)) == [7, 1, 2]
+    assert list(batch.dot(batch, backend)) == [25, 1, 4]
+
+
+def test_batch_normalized(backend):
+    normalized = make_batch().normalized(backend)
+    for norm in normalized.norms(backend):
+        assert math.isclose(norm, 1.0), "Векторы должны быть единичными"
+
+
+def test_batch_pairwise_angles(backend):
+    batch = make_batch()
+    angles = batch.pairwise_angles(
+        VectorBatch([Vector([1, 0]), Vector([1, 1])]), backend
+    )
+    assert angles.height == 3 and angles.width == 2
+    for i in range(3):
+        for j, other in enumerate([Vector([1, 0]), Vector([1, 1])]):
+            assert math.isclose(
+                angles[i, j], Vector.get_angle(batch[i], other), abs_tol=1e-9
+            ), "Углы должны совпадать с Vector.get_angle"
+    assert batch.pairwise_angles(backend=backend)[1, 1] == 0, "Угол с собой равен 0"
+
+
+def test_batch_errors():
+    batch = make_batch()
+    with pytest.raises(Exception, match="vectors must have same amount of dimensions"):
+        batch.append(Vector([1, 2, 3]))
+    with pytest.raises(Exception, match="batches must have same amount of vectors"):
+        batch.dot(VectorBatch([Vector([1, 2])]))
+    with pytest.raises(ZeroDivisionError):
+        VectorBatch([Vector([0, 0])]).normalized()
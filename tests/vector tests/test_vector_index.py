@@ -0,0 +1,81 @@
+import math
+import random
+import pytest
+from project.vector import KDTree, LSHIndex, Vector
+
+
+def random_vectors(count, dimension, seed=1):
+    generator = random.Random(seed)
+    return [
+        Vector([generator.uniform(-1, 1) for _ in range(dimension)])
+        for _ in range(count)
+    ]
+
+
+def brute_force(vectors, query, k):
+    return sorted(
+        math.dist(query.coordinates, vector.coordinates) for vector in vectors
+    )[:k]
+
+
+def test_kd_tree_knn_matches_brute_force():
+    vectors = random_vectors(300, 3)
+    tree = KDTree(vectors)
+    for query in random_vectors(20, 3, seed=2):
+        distances = [distance for distance, _ in tree.knn(query, 5)]
+        assert distances == brute_force(vectors, query, 5), "Неверные соседи"
+
+
+def test_kd_tree_insert_and_radius():
+    tree = KDTree(dimension=2)
+    for vector in random_vectors(200, 2):
+        tree.insert(vector)
+    assert len(tree) == 200
+    query = Vector([0, 0])
+    found = tree.radius(query, 0.3)
+    expected = [
+        vector
+        for vector in random_vectors(200, 2)
+        if math.dist(vector.coordinates, query.coordinates) <= 0.3
+    ]
+    assert len(found) == len(expected), "Неверный поиск в радиусе"
+    assert all(distance <= 0.3 for distance, _ in found)
+
+
+def test_kd_tree_dimension_mismatch():
+    tree = KDTree(random_vectors(5, 2))
+    with pytest.raises(Exception, match="vectors must have same amount of dimensions"):
+        tree.knn(Vector([1, 2, 3]), 1)
+
+
+def test_lsh_index_finds_near_duplicates():
+    vectors = random_vectors(500, 32)
+    index = LSHIndex(32, vectors, seed=3)
+    assert len(index) == 500
+    for vector in vectors[:20]:
+        query = Vector([x + 1e-3 for x in vector.coordinates])
+        angle, found = index.knn(query, 1)[0]
+        assert found is vector, "Почти совпадающий вектор должен находиться"
+        assert angle < 1
+
+
+def test_kd_tree_radius_exact_and_duplicates():
+    tree = KDTree(
+        [Vector([0.0, 0.0]), Vector([1.0, 0.0]), Vector([1.0, 5.0]), Vector([1.0, 1.0])]
+    )
+    found = tree.radius(Vector([1.0, 0.0]), 0.0)
+    assert [list(vector.coordinates) for _, vector in found] == [
+        [1.0, 0.0]
+    ], "Точное совпадение"
+    duplicates = KDTree([Vector([1.0]), Vector([1.0]), Vector([1.0])])
+    assert (
+        len(duplicates.radius(Vector([1.0]), 0.0)) == 3
+    ), "Все дубликаты должны найтись"
+
+
+def test_lsh_index_radius():
+    vectors = random_vectors(100, 16)
+    index = LSHIndex(16, vectors, seed=4)
+    found = index.radius(vectors[0], 5)
+    assert found[0][1] is vectors[0] and found[0][0] == pytest.approx(0, abs=1e-5)
+    assert all(angle <= 5 for angle, _ in found)
@@ -0,0 +1,71 @@
+import pytest
+from project.vector import Vector
+from project.vector_io import (
+    read_binary,
+    read_binary_batches,
+    read_csv,
+    read_csv_batches,
+    write_binary,
+    write_csv,
+)
+
+VECTORS = [Vector([i, i + 0.5, -i]) for i in range(10)]
+
+
+def coordinates(vectors):
+    return [vector.coordinates.tolist() for vector in vectors]
+
+
+@pytest.mark.parametrize("dtype", ["f", "d"])
+def test_binary_round_trip(tmp_path, dtype):
+    path = str(tmp_path / "vectors.bin")
+    assert write_binary(path, iter(VECTORS), dtype) == 10
+    assert coordinates(read_binary(path, 3, dtype, chunk_size=4)) == coordinates(
+        VECTORS
+    ), "Векторы должны читаться в исходном порядке"
+
+
+def test_binary_batches(tmp_path):
+    path = str(tmp_path / "vectors.bin")
+    write_binary(path, VECTORS)
+    batches = list(read_binary_batches(path, 3, chunk_size=4))
+    assert [len(batch) for batch in batches] == [4, 4, 2], "Размеры порций"
+    assert coordinates(
+        batch[i] for batch in batches for i in range(len(batch))
+    ) == coordinates(VECTORS)
+
+
+def test_binary_file_errors(tmp_path):
+    path = str(tmp_path / "vectors.bin")
+    write_binary(path, VECTORS)
+    with pytest.raises(Exception, match="File size is not a multiple"):
+        list(read_binary(path, 4))
+    with pytest.raises(ValueError):
+        list(read_binary(path, 3, dtype="i"))
+    with pytest.raises(Exception, match="same amount of dimensions"):
+        write_binary(path, [Vector([1]), Vector([1, 2])])
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"")
+    assert list(read_binary(str(empty), 3)) == []
+
+
+def test_csv_round_trip(tmp_path):
+    path = str(tmp_path / "vectors.csv")
+    vectors = VECTORS + [Vector([0.1, 1e-300, 1 / 3])]
+    assert write_csv(path, vectors, ";") == 11
+    assert coordinates(read_csv(path, ";")) == coordinates(vectors), "Точное чтение"
+
+
+def test_csv_batches(tmp_path):
+    path = tmp_path / "vectors.csv"
+    path.write_text("1,2\n\n3,4\n5,6\n")
+    batches = list(read_csv_batches(str(path), chunk_size=2))
+    assert [batch._data.tolist() for batch in batches] == [[1, 2, 3, 4], [5, 6]]
+    path.write_text("1,2\n3\n")
+    with pytest.raises(Exception, match="same amount of dimensions"):
+        list(read_csv_batches(str(path)))
+    path.write_text("1,2\n3,4\n5,6,7\n8,9,10\n")
+    with pytest.raises(Exception, match="same amount of dimensions"):
+        list(read_csv_batches(str(path), chunk_size=2))
+    with pytest.raises(Exception, match="same amount of dimensions"):
+        list(read_csv(str(path)))
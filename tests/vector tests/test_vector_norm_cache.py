@@ -0,0 +1,57 @@
+import math
+import pytest
+from project.vector import FrozenVector, Vector
+
+
+def test_norm_is_not_cached_by_default():
+    vector = Vector([3, 4])
+    assert vector.length() == 5
+    assert vector._norm is None, "Длина не должна кэшироваться без cache_norm"
+
+
+def test_cached_norm_is_invalidated_on_mutation():
+    vector = Vector([3, 4], cache_norm=True)
+    assert vector.length() == 5
+    assert vector._norm == 5, "Длина должна кэшироваться"
+    vector[0] = 0
+    assert vector.length() == 4, "Изменение координаты должно сбрасывать кэш"
+    vector.coordinates = [6, 8]
+    assert vector.length() == 10, "Замена координат должна сбрасывать кэш"
+
+
+def test_cached_coordinates_cannot_change_in_place():
+    vector = Vector([3, 4], cache_norm=True)
+    assert vector.length() == 5
+    with pytest.raises(TypeError):
+        vector.coordinates[0] = 0
+    with pytest.raises(AttributeError):
+        vector.coordinates.append(1)
+    assert vector.length() == 5 and list(vector.coordinates) == [3, 4]
+    normalized = Vector([3, 4]).normalized()
+    with pytest.raises(TypeError):
+        normalized.coordinates[0] = 0
+    plain = Vector([3, 4])
+    plain.coordinates[0] = 0
+    assert plain.length() == 4, "Без кэша координаты можно менять на месте"
+
+
+def test_normalized_vector():
+    vector = Vector([3, 4]).normalized()
+    assert math.isclose(vector.length(), 1.0)
+    assert vector._cache_norm, "Нормированный вектор должен кэшировать длину"
+    with pytest.raises(ZeroDivisionError):
+        Vector([0, 0]).normalized()
+
+
+def test_angle_between_normalized_vectors():
+    vector1 = Vector([1, 1]).normalized()
+    vector2 = Vector([1, 0]).normalized()
+    assert math.isclose(Vector.get_angle(vector1, vector2), 45.0, abs_tol=1e-5)
+
+
+def test_frozen_vector_caches_norm():
+    vector = FrozenVector([3, 4])
+    assert vector.length() == 5 and vector._norm == 5
+    assert isinstance(vector.normalized(), FrozenVector)
+    with pytest.raises(AttributeError, match="FrozenVector is immutable"):
+        vector[0] = 1
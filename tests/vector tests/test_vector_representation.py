@@ -0,0 +1,39 @@
+import pytest
+from project.vector import FrozenVector, Vector
+
+
+def test_vector_has_no_dict():
+    vector = Vector([1, 2, 3])
+    assert not hasattr(vector, "__dict__"), "Vector должен использовать __slots__"
+    assert vector.coordinates.typecode == "d", "Координаты хранятся в array('d')"
+    assert vector.coordinates.tolist() == [1, 2, 3]
+
+
+def test_vector_copies_coordinates():
+    coordinates = [1, 2]
+    vector = Vector(coordinates)
+    coordinates.append(3)
+    assert len(vector.coordinates) == 2, "Вектор не должен зависеть от списка"
+
+
+def test_frozen_vector_is_immutable():
+    vector = FrozenVector([1, 2])
+    with pytest.raises(AttributeError, match="FrozenVector is immutable"):
+        vector.coordinates = [3, 4]
+    with pytest.raises(TypeError):
+        vector.coordinates[0] = 5
+
+
+def test_frozen_vector_hash_and_equality():
+    vectors = {FrozenVector([1, 2]), FrozenVector([1, 2]), FrozenVector([2, 1])}
+    assert len(vectors) == 2, "Равные векторы должны иметь одинаковый хэш"
+    assert FrozenVector([1, 2]) == FrozenVector([1.0, 2.0])
+    assert FrozenVector([1, 2]) != Vector([1, 2]), "Равенство только между FrozenVector"
+    assert Vector([1, 2]) not in vectors
+
+
+def test_frozen_vector_operations():
+    vector1 = FrozenVector([3, 4])
+    vector2 = Vector([4, 3])
+    assert vector1.length() == 5
+    assert Vector.scalar_product(vector1, vector2) == 24